@@ -5,4 +5,6 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "backend"))
 
 # FastAPI uygulamamizi backend icinden disa aktariyoruz
+# NOT: Vercel'de DB_POOL_MODE=auto -> NullPool. DATABASE_URL, Supabase'in
+# transaction mode pooler'ina (port 6543) isaret etmeli; havuzu o yonetir.
 from app.main import app
@@ -23,12 +23,100 @@ class Settings(BaseSettings):
     # Veritabani
     database_url: str = "postgresql://localhost:5432/netflix_imdb"
     
+    # Baglanti havuzu stratejisi
+    # OGRENME NOTU:
+    # - queue: Process basina havuz (uzun omurlu sunucu, uvicorn)
+    # - null: Havuz yok, her checkout yeni baglanti. Harici pooler (Supabase
+    #   Supavisor/pgbouncer transaction mode, port 6543) ile serverless icin
+    # - auto: Vercel'de (VERCEL env var'i varsa) null, diger yerlerde queue
+    db_pool_mode: str = "auto"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Havuz doluyken checkout icin bekleme (saniye)
+    db_pool_recycle: int = 1800  # Bu kadar eski baglantilar yenilenir (saniye)
+    # Pre-ping sadece bu kadar saniyedir bosta kalan baglantilara yapilir (0 = her checkout)
+    db_pre_ping_interval: int = 30
+    
     # Redis Cache ayarlari
     # OGRENME NOTU:
     # Upstash Redis URL'i rediss:// (SSL) ile baslar, lokal Redis redis:// ile baslar
     redis_url: str = "redis://localhost:6379"
     cache_ttl: int = 3600  # Cache suresi (saniye) - 1 saat
     cache_enabled: bool = True  # Cache acik/kapali
+    negative_cache_ttl: int = 300  # "Bulunamadi" sonuclarinin cache suresi - 5 dakika
+    search_cache_ttl: int = 600  # Arama sonuclarinin cache suresi - 10 dakika
+    # Redis'e yazilan degerlerin formati: json, orjson veya msgpack
+    # OGRENME NOTU: json <-> orjson gecisi uyumlu, msgpack'e geciste eski kayitlar MISS olur
+    cache_codec: str = "orjson"
+    
+    # L1 cache (process ici LRU + TTL, Redis'in onunde)
+    # OGRENME NOTU: TTL kisa tutulur cunku her worker'in kendi kopyasi var
+    l1_cache_enabled: bool = True
+    l1_cache_max_size: int = 10000  # Maksimum entry sayisi (LRU ile silinir)
+    l1_cache_ttl: int = 60  # Saniye
+    
+    # Single-flight: ayni key icin eszamanli MISS'lerde tek DB cozumlemesi
+    # OGRENME NOTU: Lease, kilidi alan process coker ise kilidin kendiliginden acilma suresi
+    singleflight_enabled: bool = True
+    singleflight_lease_ms: int = 3000  # Redis kilidi (SET NX PX) suresi
+    singleflight_poll_ms: int = 50  # Bekleyenlerin cache'i yoklama araligi
+    
+    # Logging (kuyruk tabanli, istek thread'i stdout'u beklemez)
+    # OGRENME NOTU: HIT/MISS gibi key bazli olaylar DEBUG seviyesinde ve ornekleniyor,
+    # LOG_LEVEL=INFO iken hot path'te maliyetleri tek bir seviye karsilastirmasi
+    log_level: str = "INFO"
+    log_format: str = "text"  # text | json (structured)
+    log_sample_rate: float = 0.01  # DEBUG'da key olaylarinin loglanan orani (1.0 = hepsi)
+    
+    # Metrikler: GET /metrics (Prometheus text formati)
+    metrics_enabled: bool = True
+    
+    # Cache warmup: populer basliklari acilista/istek uzerine onceden cache'e yaz
+    # OGRENME NOTU: warmup_rate Upstash'in istek limitini doldurmamak icin key/saniye siniri
+    warmup_on_startup: bool = False
+    warmup_top_n: int = 5000  # Oy sayisina gore ilk N film
+    warmup_batch_size: int = 500  # Pipeline basina key
+    warmup_rate: int = 2000  # Saniyede en fazla kac key yazilsin
+    
+    # Baslik indeksi (in-memory title index)
+    # OGRENME NOTU: Acilista tum katalog hafizaya alinir, cache MISS'ler DB'ye gitmez
+    title_index_enabled: bool = True
+    # Arama indeksi (n-gram inverted index) - baslik indeksi ile birlikte yuklenir
+    search_index_enabled: bool = True
+    # Fuzzy eslestirme: exact eslesme yoksa /api/rating icin son care (baslik indeksi ile yuklenir)
+    # OGRENME NOTU: Confidence = 1 - distance / uzunluk. Esigin altindaki eslesmeler 404 doner.
+    fuzzy_enabled: bool = True
+    fuzzy_max_distance: int = 2  # Izin verilen en fazla harf hatasi (kisa basliklarda daha az)
+    fuzzy_max_candidates: int = 50  # Sorgu basina dogrulanan en fazla aday (latency ust siniri)
+    fuzzy_scan_budget: int = 20000  # Sorgu basina taranan en fazla trigram posting kaydi
+    fuzzy_min_confidence: float = 0.8
+    
+    # Batch API
+    # OGRENME NOTU: Netflix anasayfasinda 100+ kart var, 20'lik limit cok fazla istek demek.
+    # Batch cozumleme sabit sayida sorgu attigi icin buyuk batch'ler DB'yi yormaz.
+    batch_max_titles: int = 200
+    # Streaming batch (NDJSON): cevap bellekte toplanmadigi icin limit daha yuksek
+    batch_stream_max_titles: int = 2000
+    batch_stream_chunk_size: int = 200  # MGET / DB cozumleme turu basina key
+    
+    # HTTP cache: ETag + Cache-Control, If-None-Match ile 304 (/api/rating, /api/movie)
+    # OGRENME NOTU: ETag veri seti versiyonundan uretilir: DATASET_VERSION bos ise
+    # baslik indeksinin yuklenirken hesapladigi ozet, indeks de yoksa govdenin hash'i.
+    http_cache_enabled: bool = True
+    http_cache_max_age: int = 3600  # Tarayici / extension HTTP cache'i (saniye)
+    http_cache_s_maxage: int = 3600  # Paylasilan cache, Vercel edge CDN (saniye)
+    http_cache_swr: int = 86400  # stale-while-revalidate: bayat cevap + arka planda yenileme
+    dataset_version: str = ""  # Import sonrasi deploy'da verilebilir (ornegin import tarihi)
+    
+    # Lazy init (serverless cold start)
+    # OGRENME NOTU: true ise startup Redis ping'ini ve indeks yuklemeyi beklemez,
+    # ikisi arka planda yapilir. Hazir olana kadar istekler cache'siz/DB'den cevaplanir.
+    lazy_init: bool = False
+    
+    # Async mod
+    # OGRENME NOTU: true ise route'lar async def olur, DB icin asyncpg (create_async_engine),
+    # Redis icin redis.asyncio kullanilir. Tek worker yuzlerce istegi ayni anda bekletebilir.
+    async_mode: bool = False
     
     # API ayarlari
     api_title: str = "Netflix IMDB Rating API"
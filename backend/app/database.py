@@ -10,24 +10,174 @@ OGRENME NOTU:
 MULAKATTA SORULUR:
 - "Connection pooling nedir?" -> Baglantilari yeniden kullanma
 - "Transaction nedir?" -> Atomik islem grubu (ya hepsi ya hicbiri)
+- "Sync vs async driver?" -> psycopg2 thread'i bloklar, asyncpg event loop'a geri doner
+- "Serverless'ta neden havuz sorun?" -> Her instance kendi havuzunu tutar,
+  burst'te instance sayisi x pool_size baglanti DB limitini asar
 """
 
-from sqlalchemy import create_engine
+import os
+import threading
+import time
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from app.config import settings
+from app.utils.metrics import instrument_engine, db_pool_checkout, db_pre_pings
+
+
+# ============================================
+# BAGLANTI HAVUZU STRATEJISI
+# ============================================
+# OGRENME NOTU - Vercel + Supabase:
+# Vercel her istek dalgasinda yeni instance'lar acar. Her instance'in kendi
+# QueuePool'u (5 + 10 overflow) olursa 20 instance = 300 baglanti -> Supabase
+# limiti dolar. Serverless'ta havuzu DB tarafindaki pooler'a (Supavisor/pgbouncer,
+# transaction mode) birakip uygulamada NullPool kullanmak gerekir.
+
+def resolve_pool_mode() -> str:
+    """DB_POOL_MODE'u (auto dahil) queue veya null'a cevir"""
+    mode = settings.db_pool_mode.lower()
+    if mode == "auto":
+        # Vercel runtime'i VERCEL=1 env var'ini set eder
+        return "null" if os.environ.get("VERCEL") else "queue"
+    if mode not in ("queue", "null"):
+        raise ValueError(f"Gecersiz DB_POOL_MODE: {settings.db_pool_mode} (queue, null, auto)")
+    return mode
+
+
+POOL_MODE = resolve_pool_mode()
+
+_timed_pools: dict[type, type] = {}
+
+
+def timed_pool(base: type) -> type:
+    """
+    Pool sinifini checkout suresini olcen alt sinifla sar.
+    
+    OGRENME NOTU:
+    SQLAlchemy'de "checkout oncesi" event'i yok; Pool.connect() havuzdan
+    baglanti alma (bekleme + yeni baglanti + pre-ping) isinin tamamidir.
+    Havuz dolunca isteklerin ne kadar bekledigi burada gorunur.
+    """
+    if base not in _timed_pools:
+        class TimedPool(base):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    return super().connect()
+                finally:
+                    db_pool_checkout.observe(time.perf_counter() - start, mode=POOL_MODE)
+        
+        TimedPool.__name__ = f"Timed{base.__name__}"
+        _timed_pools[base] = TimedPool
+    return _timed_pools[base]
+
+
+def engine_options(is_async: bool = False) -> dict:
+    """create_engine / create_async_engine icin havuz ayarlari"""
+    if POOL_MODE == "null":
+        poolclass, options = NullPool, {}
+    else:
+        poolclass = AsyncAdaptedQueuePool if is_async else QueuePool
+        options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+        }
+    if settings.metrics_enabled:
+        poolclass = timed_pool(poolclass)
+    return {"poolclass": poolclass, "echo": settings.debug, **options}
+
+
+def amortized_pre_ping(engine):
+    """
+    Sadece bir suredir bosta kalan baglantilari ping'le.
+    
+    OGRENME NOTU - pool_pre_ping'in maliyeti:
+    pool_pre_ping=True her checkout'ta "SELECT 1" atar: her istege bir round-trip
+    (Supabase'e ~20-50ms). Oysa az once kullanilmis bir baglantinin kopmus olma
+    ihtimali cok dusuk. Bosta kalma suresi DB_PRE_PING_INTERVAL'i asarsa ping'leriz;
+    kopuksa DisconnectionError -> havuz baglantiyi atar ve yenisiyle tekrar dener.
+    NullPool'da her baglanti taze oldugu icin hic ping atilmaz.
+    """
+    interval = settings.db_pre_ping_interval
+    
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, record):
+        record.info["checked_in_at"] = time.monotonic()
+    
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, record, proxy):
+        checked_in_at = record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < interval:
+            return  # Yeni baglanti veya az once kullanilmis
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+            db_pre_pings.inc(result="ok")
+        except Exception as e:
+            if engine.dialect.is_disconnect(e, dbapi_connection, None):
+                db_pre_pings.inc(result="stale")
+                raise exc.DisconnectionError() from e
+            raise
+
+
+# ============================================
+# LAZY ENGINE
+# ============================================
+# OGRENME NOTU - Cold start:
+# create_engine() baglanti acmaz ama DB driver'ini (psycopg2/asyncpg) ve dialect'i
+# import eder. Engine ilk kullanimda (ilk DB'ye giden istek, indeks yukleme) olusturulur;
+# cache HIT ile cevaplanan istekler bu maliyeti hic odemez.
+# Eski kullanim (from app.database import engine, SessionLocal) asagidaki
+# modul __getattr__'i ile calismaya devam eder.
+
+_engine = None
+_session_factory = None
+_async_engine = None
+_async_session_factory = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Sync engine'i (ilk cagrida olusturup) dondur"""
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                # OGRENME NOTU: pool_pre_ping yerine amortized_pre_ping (sadece bosta kalanlara ping)
+                engine = create_engine(settings.database_url, **engine_options())
+                if POOL_MODE == "queue":
+                    amortized_pre_ping(engine)
+                if settings.metrics_enabled:
+                    instrument_engine(engine)
+                # Session factory
+                # OGRENME NOTU: autocommit=False -> Her degisiklik icin manuel commit gerekli
+                # Bu, hatalarda rollback yapabilmemizi saglar
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    return _engine
 
-# Engine olustur
-# OGRENME NOTU: pool_pre_ping=True baglantinin hala gecerli oldugunu kontrol eder
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,  # Baglanti kontrolu
-    echo=settings.debug  # Debug modda SQL sorgularini goster
-)
 
-# Session factory
-# OGRENME NOTU: autocommit=False -> Her degisiklik icin manuel commit gerekli
-# Bu, hatalarda rollback yapabilmemizi saglar
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_session_factory() -> sessionmaker:
+    """SessionLocal'in lazy karsiligi"""
+    get_engine()
+    return _session_factory
+
+
+def __getattr__(name: str):
+    """Geriye uyumluluk: engine/SessionLocal/async_engine/AsyncSessionLocal ilk erisimde olusur"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db():
@@ -46,8 +196,107 @@ def get_db():
     
     Bu pattern "context manager" benzeri calisir.
     """
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
         db.close()
+
+
+# ============================================
+# ASYNC MOD (ASYNC_MODE=true)
+# ============================================
+# OGRENME NOTU - Neden async engine?
+# Sync route'lar (def) FastAPI'nin threadpool'unda calisir. Her istek
+# DB/Redis cevabini beklerken bir thread'i mesgul eder (varsayilan ~40 thread).
+# Async route'lar (async def) beklerken event loop'a geri doner,
+# tek worker yuzlerce istegi ayni anda bekletebilir.
+#
+# Sync engine async modda da kalir: indeks yukleme, admin endpoint'leri ve
+# script'ler onu kullanir.
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def make_async_url(database_url: str):
+    """
+    Sync DATABASE_URL'i async driver URL'ine cevir.
+    
+    Ornek:
+        postgresql://user:pw@host/db?sslmode=require
+        -> postgresql+asyncpg://user:pw@host/db  (connect_args: ssl=require)
+    
+    OGRENME NOTU:
+    asyncpg, psycopg2'nin sslmode parametresini tanimaz.
+    Supabase URL'lerindeki sslmode'u connect_args'a tasiyoruz.
+    
+    Returns:
+        (url, connect_args) tuple
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.drivername.split("+")[0], url.drivername)
+    url = url.set(drivername=driver)
+    
+    connect_args = {}
+    if driver == "postgresql+asyncpg" and "sslmode" in url.query:
+        connect_args["ssl"] = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"])
+    
+    return url, connect_args
+
+
+def get_async_engine():
+    """
+    Async engine'i (ilk cagrida olusturup) dondur. ASYNC_MODE=false ise None.
+    """
+    global _async_engine, _async_session_factory
+    if not settings.async_mode:
+        return None
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+                
+                url, connect_args = make_async_url(settings.database_url)
+                if POOL_MODE == "null" and url.drivername == "postgresql+asyncpg":
+                    # pgbouncer/Supavisor transaction mode: ayni "baglanti" her transaction'da
+                    # farkli bir server baglantisina gidebilir, prepared statement cache kapali olmali
+                    connect_args["statement_cache_size"] = 0
+                    url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+                engine = create_async_engine(
+                    url,
+                    connect_args=connect_args,
+                    **engine_options(is_async=True),
+                )
+                if POOL_MODE == "queue":
+                    # Event'ler async engine'in altindaki sync engine'e baglanir
+                    amortized_pre_ping(engine.sync_engine)
+                if settings.metrics_enabled:
+                    instrument_engine(engine.sync_engine)
+                # expire_on_commit=False: commit sonrasi attribute'lara erismek icin
+                # yeni sorgu (lazy load) atilmasin - async'te lazy load desteklenmez
+                _async_session_factory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+                _async_engine = engine
+    return _async_engine
+
+
+def get_async_session_factory():
+    """AsyncSessionLocal'in lazy karsiligi (ASYNC_MODE=false ise None)"""
+    get_async_engine()
+    return _async_session_factory
+
+
+async def get_async_db():
+    """
+    get_db'nin async versiyonu (async route'lar icin).
+    
+    OGRENME NOTU:
+    async with blogu session'i istek bitince otomatik kapatir
+    (get_db'deki try/finally ile ayni is).
+    """
+    async with get_async_session_factory()() as db:
+        yield db
@@ -11,18 +11,34 @@ OGRENME NOTU:
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routes import movies
+import asyncio
+import importlib
+import logging
+import threading
+
 from app.routes import cache_routes
 from app.config import settings
-from app.redis import init_redis
+from app.redis import init_redis, init_async_redis
+from app.utils.title_index import load_title_index
+from app.utils.warmup import start_warmup
+from app.utils.metrics import MetricsMiddleware, render_metrics
+from app.utils.log import setup_logging, stop_logging
+
+# Log hattini en basta kur (startup'taki Redis/indeks loglari da kuyruktan gecsin)
+setup_logging()
+logger = logging.getLogger(__name__)
 
 # FastAPI uygulamasi olustur
 app = FastAPI(
     title="Netflix IMDB Rating API",
     description="Netflix'te gosterilen filmler icin IMDB rating'lerini donduren API",
-    version="1.0.0"
+    version="1.0.0",
+    # OGRENME NOTU: orjson, stdlib json'dan cok daha hizli serilestirir.
+    # response_model'li endpoint'ler de bu sinifla render edilir.
+    default_response_class=ORJSONResponse
 )
 
 # CORS ayarlari - Chrome Extension'dan istek alabilmek icin gerekli
@@ -37,8 +53,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Route bazinda sure + istek basina DB sorgu metrikleri (GET /metrics)
+# OGRENME NOTU: En son eklenen middleware en distadir, CORS dahil tum sure olculur
+app.add_middleware(MetricsMiddleware)
+
 # Route'lari ekle
-app.include_router(movies.router, prefix="/api", tags=["Movies"])
+# OGRENME NOTU: ASYNC_MODE=true ise ayni endpoint'lerin async versiyonlari kullanilir.
+# Sadece kullanilan modul import edilir (digeri cold start'a maliyet eklemesin).
+movies_routes = importlib.import_module(
+    "app.routes.movies_async" if settings.async_mode else "app.routes.movies"
+)
+app.include_router(movies_routes.router, prefix="/api", tags=["Movies"])
 app.include_router(cache_routes.router, prefix="/api", tags=["Cache"])
 
 
@@ -50,8 +75,54 @@ def startup_event():
     FastAPI uygulamasi basladiginda calisir.
     Redis baglantisini burada kuruyoruz.
     Baglanti basarisiz olursa API yine calisir (cache'siz).
+    
+    Baslik indeksi de burada yuklenir. Yuklenemezse route'lar DB'ye gider.
+    WARMUP_ON_STARTUP=true ise populer basliklar arka planda cache'e yazilir
+    (indeksten sonra, boylece warmup DB'ye gitmeden calisir).
+    
+    OGRENME NOTU - LAZY_INIT (serverless cold start):
+    Redis ping'i (5s'ye kadar connect timeout) ve indeks yukleme (tum katalog)
+    ilk istegin onunde beklemesin diye arka plan thread'inde yapilir.
+    Hazir olana kadar get_redis_client()/get_title_index() None doner:
+    istekler fail-open yollarindan (cache'siz, DB'den) cevaplanir.
     """
-    init_redis()
+    if settings.lazy_init:
+        threading.Thread(target=initialize_services, daemon=True, name="lazy-init").start()
+    else:
+        initialize_services()
+
+
+def initialize_services():
+    """Redis + baslik indeksi + (istenirse) warmup"""
+    redis_client = init_redis()
+    if settings.title_index_enabled:
+        load_title_index()
+    if settings.warmup_on_startup and redis_client is not None:
+        start_warmup()
+    logger.info("Servisler hazir")
+
+
+# Arka plan task'ina referans (garbage collect edilmesin)
+_background_tasks: set = set()
+
+
+@app.on_event("startup")
+async def async_startup_event():
+    """Async modda redis.asyncio client'ini baslat (sync client admin endpoint'leri icin kalir)"""
+    if not settings.async_mode:
+        return
+    if settings.lazy_init:
+        task = asyncio.create_task(init_async_redis())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    else:
+        await init_async_redis()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Kuyrukta bekleyen log kayitlarini yaz ve listener thread'ini durdur"""
+    stop_logging()
 
 
 @app.get("/")
@@ -75,3 +146,20 @@ def health_check():
     calisip calismadigini kontrol eder.
     """
     return {"status": "healthy", "version": "1.0.0"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """
+    Prometheus metrikleri (text exposition formati).
+    
+    OGRENME NOTU:
+    Prometheus bu endpoint'i periyodik olarak ceker (pull modeli).
+    Sadece cevap veren process'in sayaclari doner: her instance ayri hedef olarak
+    cekilmeli (load balancer uzerinden degil), instance basina tek worker.
+    Toplama instance etiketi uzerinden yapilir (bkz. app/utils/metrics.py):
+        sum by (route) (rate(http_request_duration_seconds_count[5m]))
+    """
+    if not settings.metrics_enabled:
+        return PlainTextResponse("# metrics disabled\n", status_code=404)
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
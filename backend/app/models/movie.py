@@ -18,6 +18,14 @@ from datetime import datetime
 # Base class - tum modeller bundan turetilir
 Base = declarative_base()
 
+# API'deki tur filtresi (kind) -> IMDB titleType degerleri
+# OGRENME NOTU: Netflix sadece "film" ve "dizi" ayrimi yapar, IMDB'de dizi iki tip
+TITLE_KINDS = {
+    "movie": ("movie",),
+    "series": ("tvSeries", "tvMiniSeries"),
+}
+KIND_BY_TITLE_TYPE = {t: kind for kind, types in TITLE_KINDS.items() for t in types}
+
 
 class Movie(Base):
     """
@@ -44,6 +52,7 @@ class Movie(Base):
     
     # Film bilgileri
     title = Column(String(500), nullable=False)
+    search_title = Column(String(500))  # normalize_turkish(title) - exact lookup icin
     original_title = Column(String(500))
     year = Column(Integer, index=True)  # Index: yila gore arama hizli olsun
     
@@ -59,8 +68,16 @@ class Movie(Base):
     # Composite index - title + year ile arama cok hizli olacak
     # OGRENME NOTU: Netflix'ten gelen veri "Inception 2010" seklinde
     # Bu index tam olarak bu arama icin optimize edilmis
+    #
+    # OGRENME NOTU - Fonksiyon Indexi Problemi:
+    # WHERE lower(title) = 'x' sorgusu ix_movies_title'i KULLANAMAZ,
+    # cunku index title'in kendisi uzerinde, lower(title) uzerinde degil.
+    # Cozum: Normalize edilmis basligi ayri kolonda (search_title) saklayip
+    # index'i o kolona koymak. (search_title, year, votes DESC) sirasi
+    # "baslik + opsiyonel yil, en cok oy alan" sorgusunu tek index taramasi yapar.
     __table_args__ = (
         Index('ix_movies_title_year', 'title', 'year'),
+        Index('ix_movies_search_title_year_votes', search_title, year, votes.desc()),
     )
     
     def __repr__(self):
@@ -75,5 +92,6 @@ class Movie(Base):
             "rating": self.rating,
             "votes": self.votes,
             "genres": self.genres,
-            "runtime_minutes": self.runtime_minutes
+            "runtime_minutes": self.runtime_minutes,
+            "title_type": self.title_type
         }
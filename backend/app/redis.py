@@ -9,9 +9,13 @@ OGRENME NOTU - Redis Baglanti Yonetimi:
 MULAKATTA SORULUR:
 - "Cache servisi duserse ne olur?" -> Fail-open: DB'den devam eder, kullanici fark etmez
 - "Singleton pattern nedir?" -> get_redis_client her zaman ayni instance'i doner
+
+OGRENME NOTU - Lazy import:
+redis paketi (ozellikle redis.asyncio) import edilirken ~50-80ms harcar.
+Import'lar init fonksiyonlarinin icinde yapilir; CACHE_ENABLED=false ise
+veya baglanti arka planda kuruluyorsa bu maliyet ilk istege yansimaz.
 """
 
-import redis
 import logging
 from app.config import settings
 
@@ -20,6 +24,24 @@ logger = logging.getLogger(__name__)
 
 # Global Redis client - None ise cache devre disi
 _redis_client = None
+# Async mod icin redis.asyncio client (ASYNC_MODE=true)
+_async_redis_client = None
+
+
+def _client_options() -> dict:
+    """Sync ve async client'larin ortak baglanti ayarlari"""
+    # Upstash icin SSL ayarlari
+    # rediss:// URL'lerinde ssl=True otomatik aktif olur
+    # ssl_cert_reqs="none" -> sertifika dogrulamasi yapma (Upstash icin gerekli)
+    options = {
+        # Degerler codec ile (bkz. utils/cache.py) byte olarak yazilir, decode etme
+        "decode_responses": False,
+        "socket_connect_timeout": 5,
+        "socket_timeout": 3,
+    }
+    if settings.redis_url.startswith("rediss://"):
+        options["ssl_cert_reqs"] = "none"  # Upstash sertifika dogrulamasi gerektirmez
+    return options
 
 
 def init_redis():
@@ -28,7 +50,8 @@ def init_redis():
     
     OGRENME NOTU:
     - redis.from_url() URL'deki bilgilerle baglanti kurar
-    - decode_responses=True: Redis byte doner, biz string istiyoruz
+    - decode_responses=False: Redis byte doner, cache degerlerini codec cozer
+      (msgpack gibi binary formatlar UTF-8 string'e cevrilemez)
     - ping() ile baglanti test edilir
     - Hata olursa None doner -> cache devre disi, API calismaya devam eder
     
@@ -45,22 +68,15 @@ def init_redis():
         return None
     
     try:
-        # Upstash icin SSL ayarlari
-        # rediss:// URL'lerinde ssl=True otomatik aktif olur
-        # ssl_cert_reqs="none" -> sertifika dogrulamasi yapma (Upstash icin gerekli)
-        client = redis.from_url(
-            settings.redis_url,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=3,
-            ssl_cert_reqs="none",  # Upstash sertifika dogrulamasi gerektirmez
-        )
+        import redis
+        
+        client = redis.from_url(settings.redis_url, **_client_options())
         client.ping()
         _redis_client = client
-        logger.info(f"Redis baglanti basarili: {settings.redis_url[:40]}...")
+        logger.info("Redis baglanti basarili: %s...", settings.redis_url[:40])
         return client
     except Exception as e:
-        logger.warning(f"Redis baglanti BASARISIZ (API cache'siz devam edecek): {e}")
+        logger.warning("Redis baglanti BASARISIZ (API cache'siz devam edecek): %s", e)
         _redis_client = None
         return None
 
@@ -71,3 +87,38 @@ def get_redis_client():
     None donerse cache kullanilmayacak.
     """
     return _redis_client
+
+
+async def init_async_redis():
+    """
+    redis.asyncio client'ini baslat (ASYNC_MODE=true).
+    
+    OGRENME NOTU:
+    API sync client ile ayni (get, mget, setex), sadece her komut await edilir.
+    Komut cevabi beklenirken event loop diger istekleri isler.
+    """
+    global _async_redis_client
+    
+    if not settings.cache_enabled:
+        return None
+    
+    try:
+        import redis.asyncio as aioredis
+        
+        client = aioredis.from_url(settings.redis_url, **_client_options())
+        await client.ping()
+        _async_redis_client = client
+        logger.info("Async Redis baglanti basarili")
+        return client
+    except Exception as e:
+        logger.warning("Async Redis baglanti BASARISIZ (API cache'siz devam edecek): %s", e)
+        _async_redis_client = None
+        return None
+
+
+def get_async_redis_client():
+    """
+    Async Redis client singleton dondur.
+    None donerse cache kullanilmayacak.
+    """
+    return _async_redis_client
@@ -7,9 +7,14 @@ Production'da /cache/flush gibi tehlikeli endpoint'ler
 authentication ile korunmali veya kapatilmali.
 """
 
-from fastapi import APIRouter
-from app.utils.cache import get_cache_stats
+from typing import Optional
+
+from fastapi import APIRouter, Query
+from app.utils.cache import get_cache_stats, get_local_cache
 from app.redis import get_redis_client
+from app.utils.title_index import get_title_index, load_title_index
+from app.utils.singleflight import get_flight_stats
+from app.utils.warmup import get_warmup_state, start_warmup
 
 router = APIRouter()
 
@@ -28,14 +33,24 @@ def cache_stats():
     Cache hit ratio dusukse, TTL veya key stratejisi gozden gecirilmeli.
     
     Ideal hit ratio: %80+ (cok sorgu cache'ten donmeli)
+    
+    l1 / l2 alanlari katman bazinda hit/miss/eviction sayilarini gosterir.
+    L1 hit ratio yuksekse trend basliklar Redis'e hic gitmeden donuyor demektir.
+    
+    warmup: Son cache warmup'inin durumu ve ilerlemesi (yuzde).
+    
+    singleflight: MISS'lerin kaci DB'ye gitti (leaders), kaci baska bir
+    istegin sonucunu paylasti (shared_local / shared_remote).
     """
     stats = get_cache_stats()
+    stats["singleflight"] = get_flight_stats()
+    stats["warmup"] = get_warmup_state()
     
-    total = stats["hits"] + stats["misses"]
-    if total > 0:
-        stats["hit_ratio"] = round(stats["hits"] / total * 100, 1)
-    else:
-        stats["hit_ratio"] = 0.0
+    for tier in (stats, stats["l1"], stats["l2"]):
+        if "hits" not in tier:
+            continue
+        total = tier["hits"] + tier["misses"]
+        tier["hit_ratio"] = round(tier["hits"] / total * 100, 1) if total > 0 else 0.0
     
     return stats
 
@@ -53,7 +68,14 @@ def cache_flush():
     flushdb() Redis'teki tum key'leri siler.
     Bu islem geri alinamaz!
     Production'da bu endpoint authentication ile korunmali.
+    
+    Bu process'in L1 cache'i de temizlenir. Diger worker'larin L1'i
+    kendi TTL'leri (L1_CACHE_TTL) dolunca bosalir.
     """
+    local_cache = get_local_cache()
+    if local_cache is not None:
+        local_cache.clear()
+    
     client = get_redis_client()
     if not client:
         return {"message": "Redis bagli degil", "flushed": False}
@@ -63,3 +85,69 @@ def cache_flush():
         return {"message": "Cache temizlendi", "flushed": True}
     except Exception as e:
         return {"message": f"Hata: {e}", "flushed": False}
+
+
+@router.post(
+    "/cache/warmup",
+    summary="Cache warmup baslat",
+    description="En cok oy alan filmleri ve tum Turkce basliklari arka planda cache'e yazar"
+)
+def cache_warmup(top_n: Optional[int] = Query(None, ge=1, description="Ilk N film (varsayilan WARMUP_TOP_N)")):
+    """
+    Cache warmup'i arka planda baslat.
+    
+    OGRENME NOTU:
+    Flush veya import sonrasi cagrilir. Ilerleme /api/cache/stats -> warmup
+    alanindan izlenir. Production'da bu endpoint de authentication ile korunmali.
+    """
+    if get_redis_client() is None:
+        return {"message": "Redis bagli degil", "started": False}
+    
+    started = start_warmup(top_n)
+    return {
+        "message": "Warmup baslatildi" if started else "Warmup zaten calisiyor",
+        "started": started,
+        "warmup": get_warmup_state(),
+    }
+
+
+@router.get(
+    "/index/stats",
+    summary="Baslik indeksi durumu",
+    description="In-memory baslik indeksinin boyutu ve yuklenme zamani"
+)
+def index_stats():
+    """Baslik indeksi yuklu mu, kac kayit var?"""
+    index = get_title_index()
+    if index is None:
+        return {"loaded": False}
+    
+    return {"loaded": True, **index.stats()}
+
+
+@router.post(
+    "/index/reload",
+    summary="Baslik indeksini yeniden yukle",
+    description="IMDB import'undan sonra cagrilmali. Indeksi DB'den yeniden olusturur."
+)
+def index_reload():
+    """
+    Baslik indeksini yeniden olustur.
+    
+    OGRENME NOTU:
+    scripts/import_imdb.py calistiktan sonra calisan API'nin yeni veriyi
+    gormesi icin bu endpoint cagrilir. Eski indeks, yenisi hazir olana kadar
+    kullanilmaya devam eder (istekler bloklanmaz).
+    Yeni indeksin versiyonu degisince rating/movie cache key'leri de yeni
+    namespace'e gecer (rating@<versiyon>:...): eski indeksten uretilmis kayitlar
+    bu instance'ta artik okunmaz. Endpoint sadece istegin ulastigi instance'i
+    yeniler; load balancer arkasinda her instance icin ayri cagrilmali.
+    Production'da bu endpoint de authentication ile korunmali.
+    """
+    previous = get_title_index()
+    index = load_title_index()
+    
+    if index is None or index is previous:
+        return {"message": "Indeks yuklenemedi", "reloaded": False}
+    
+    return {"message": "Indeks yeniden yuklendi", "reloaded": True, **index.stats()}
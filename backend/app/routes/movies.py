@@ -13,21 +13,36 @@ MULAKATTA SORULUR:
 - "Cache-Aside pattern nasil calisir?" -> Once cache'e bak, yoksa DB'den al, cache'e yaz
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+import logging
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
 from typing import Optional
 
-from app.database import get_db
-from app.models.movie import Movie
-from app.models.movie_title import MovieTitle
-from app.schemas import MovieRating, MovieSearch, ErrorResponse, BatchRatingRequest, BatchRatingResponse
-from app.utils.turkish import normalize_turkish, turkish_contains
+from app.config import settings
+from app.database import get_db, get_session_factory
+from app.schemas import (
+    MovieRating, MovieSearch, ErrorResponse, TitleKind,
+    BatchRatingItem, BatchRatingRequest, BatchRatingResponse, BatchStreamRequest
+)
+from app.utils.turkish import normalize_turkish
 from app.utils.cache import (
-    cache_get, cache_set, cache_get_multi,
-    make_rating_key, make_movie_key, make_search_key
+    cache_get, cache_set, cache_get_multi, cache_set_multi,
+    cache_lookup, cache_set_negative,
+    make_rating_key, make_movie_key, make_search_key,
+    make_search_entry, search_entry_ids
 )
+from app.utils.title_index import get_title_index
+from app.utils.search_index import get_search_index
+from app.utils.fuzzy_index import fuzzy_resolve
+from app.utils.http_cache import check_not_modified, cached_json_response
+from app.utils.log import log_key_event
+from app.utils.singleflight import coalesce, coalesce_many
+from app.utils.resolver import TitleQuery, group_by_rating_key, title_query, find_movie, find_movies, find_movie_by_id, find_movies_by_ids, search_movies_db
+
+logger = logging.getLogger(__name__)
 
 # Router olustur
 router = APIRouter()
@@ -43,72 +58,92 @@ router = APIRouter()
 def get_movie_rating(
     title: str = Query(..., description="Film adi (Turkce veya Ingilizce)", min_length=1),
     year: Optional[int] = Query(None, description="Yapim yili", ge=1900, le=2030),
+    kind: Optional[TitleKind] = Query(None, description="Tur: movie veya series"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """
     Film rating'i getir - Turkce ve Ingilizce baslik destekli
     
     OGRENME NOTU - Cache-Aside Pattern Burada Uygulanir:
-    1. Cache key olustur (normalize edilmis baslik)
+    1. Cache key olustur (normalize edilmis baslik + yil + tur)
     2. Cache'e bak -> varsa direkt don (HIT)
     3. Yoksa DB'den cek -> cache'e yaz -> don (MISS)
+    4. Ayni anda gelen MISS'ler single-flight ile tek DB sorgusunda birlesir
     
     Response header'inda X-Cache: HIT veya MISS bilgisi eklenir.
     Bu sayede cache'in calisip calismadigini gorebilirsin.
+    
+    OGRENME NOTU - HTTP cache (bkz. app/utils/http_cache.py):
+    Cevaplar ETag + Cache-Control ile doner. If-None-Match ile gelen istek
+    veri seti degismediyse 304 alir (X-Cache: NOT_MODIFIED, Redis'e gidilmez).
     """
     
+    # Istemcideki ETag guncelse (import olmadi) cache'e bile gitmeden 304
+    not_modified = check_not_modified(if_none_match)
+    if not_modified:
+        return not_modified
+    
     normalized_title = normalize_turkish(title)
     
     # --- CACHE-ASIDE: Oncelikle cache'e bak ---
-    cache_key = make_rating_key(title)
-    cached = cache_get(cache_key)
-    if cached:
-        print(f"[Cache] HIT: {cache_key}")
-        response = JSONResponse(content=cached)
-        response.headers["X-Cache"] = "HIT"
-        return response
+    cache_key = make_rating_key(title, year, kind)
+    hit, cached = cache_lookup(cache_key)
+    if hit and cached is None:
+        # Negatif cache HIT: daha once aranip bulunamamis, DB'ye tekrar gitme
+        log_key_event(logger, "NEGATIVE HIT: %s", cache_key)
+        raise HTTPException(
+            status_code=404,
+            detail=f"Film bulunamadi: {title}" + (f" ({year})" if year else ""),
+            headers={"X-Cache": "HIT"}
+        )
+    if hit:
+        log_key_event(logger, "HIT: %s", cache_key)
+        return cached_json_response(cached, "HIT", if_none_match)
     
     # --- CACHE MISS: DB'den cek ---
-    print(f"[Cache] MISS: {cache_key}")
-    
-    # 1. Movies tablosu (Ingilizce/Orijinal) - Tam Eslesme
-    query = db.query(Movie).filter(func.lower(Movie.title) == normalized_title)
-    
-    if year:
-        query = query.filter(Movie.year == year)
+    log_key_event(logger, "MISS: %s", cache_key)
+    
+    def resolve():
+        # Indeks yuklu ise DB'ye hic gitmeden cozumle
+        index = get_title_index()
+        if index is not None:
+            movie_data = index.lookup(normalized_title, year, kind)
+            if movie_data is None:
+                # Exact eslesme yok: noktalama, sezon etiketi, yazim hatasi icin fuzzy asama
+                match = fuzzy_resolve(title, year, kind)
+                if match:
+                    log_key_event(logger, "FUZZY: %s -> %s (%.2f)", cache_key, match.matched_key, match.confidence)
+                    movie_data = match.movie
+        else:
+            movie = find_movie(db, normalized_title, year, kind)
+            movie_data = MovieRating.model_validate(movie).model_dump() if movie else None
         
-    movie = query.order_by(Movie.votes.desc()).first()
+        # --- CACHE'E YAZ: Sonraki isteklerde hizli donsun ---
+        # Bulunamadi sonucunu da (kisa TTL ile) cache'le.
+        # Key yil/tur icerdigi icin "Inception (1800)" bulunamadi kaydi
+        # "Inception" aramasini etkilemez
+        if movie_data:
+            cache_set(cache_key, movie_data)
+        else:
+            cache_set_negative(cache_key)
+        return movie_data
     
-    # 2. MovieTitles tablosu (Turkce/Yerel) - Tam Eslesme
-    if not movie:
-        tr_query = db.query(MovieTitle).filter(MovieTitle.search_title == normalized_title)
-        tr_titles = tr_query.all()
-        
-        candidates = []
-        for tr in tr_titles:
-            m = db.query(Movie).filter(Movie.imdb_id == tr.imdb_id).first()
-            if m:
-                if year and m.year != year:
-                    continue
-                candidates.append(m)
-        
-        if candidates:
-            candidates.sort(key=lambda x: x.votes or 0, reverse=True)
-            movie = candidates[0]
+    # Single-flight: DB'ye gidilecekse ayni key icin tek cozumleme calisir,
+    # eszamanli istekler (baska process'tekiler dahil) onun sonucunu bekler.
+    if get_title_index() is not None:
+        movie_data = resolve()
+    else:
+        movie_data = coalesce(cache_key, resolve, poll=lambda: cache_lookup(cache_key))
     
-    if not movie:
+    if not movie_data:
         raise HTTPException(
             status_code=404,
-            detail=f"Film bulunamadi: {title}" + (f" ({year})" if year else "")
+            detail=f"Film bulunamadi: {title}" + (f" ({year})" if year else ""),
+            headers={"X-Cache": "MISS"}
         )
     
-    # --- CACHE'E YAZ: Sonraki isteklerde hizli donsun ---
-    movie_data = MovieRating.model_validate(movie).model_dump()
-    cache_set(cache_key, movie_data)
-    
-    response = JSONResponse(content=movie_data)
-    response.headers["X-Cache"] = "MISS"
-    return response
+    return cached_json_response(movie_data, "MISS", if_none_match, versioned=True)
 
 
 @router.get(
@@ -118,6 +153,7 @@ def get_movie_rating(
     description="Film adina gore arama yapar (Turkce ve Ingilizce), birden fazla sonuc donebilir"
 )
 def search_movies(
+    response: Response,
     q: str = Query(..., description="Arama sorgusu (Turkce veya Ingilizce)", min_length=2),
     limit: int = Query(50, description="Maksimum sonuc sayisi", ge=1, le=100),
     db: Session = Depends(get_db)
@@ -131,45 +167,47 @@ def search_movies(
     3. Turkce basliklarda da ara
     
     PERFORMANS NOTU:
-    Bu yaklasim kucuk veritabanlari icin uygun (~60K kayit).
-    Buyuk veritabanlarinda PostgreSQL full-text search kullanilmali.
+    Arama indeksi (n-gram inverted index) yuklu ise DB'ye hic gidilmez,
+    latency katalog boyutundan bagimsizdir. Indeks yoksa asagidaki
+    LIKE '%q%' sorgulari (sequential scan) fallback olarak calisir.
+    
+    OGRENME NOTU - Arama Cache'i (Cache-Aside):
+    Indeks yoksa sonuc "search:<sorgu>" key'i ile cache'lenir.
+    - Sadece imdb_id listesi saklanir (kompakt), filmler indeksten veya
+      tek bir IN sorgusu ile getirilir
+    - limit=50 ile cache'lenen sonuc limit=10 istegine de cevap verir
+    Yazarken-ara (search-as-you-type) ayni on ekleri tekrar tekrar sorar,
+    bu istekler LIKE taramasi yerine cache'ten doner.
+    Indeks yukluyken cache kullanilmaz: hafizadaki arama Redis round-trip'inden hizli
+    (dokumanlar rating sirasinda, tarama `limit` sonucta durur; X-Cache: MISS).
     """
     
-    normalized_q = normalize_turkish(q)
-    results = []
-    found_ids = set()
-    
-    # DB Limit stratejisi: 
-    # Populariteye gore siralama olmadigi icin genis bir havuz cekmeliyiz.
-    # Kullanici 10 istese de biz 100 cekip, rating'e gore siralayip en iyi 10'u donelim.
-    db_limit = min(limit * 10, 500)
-    
-    # 1. Ingilizce basliklarda ara
-    movies = db.query(Movie).filter(
-        func.lower(Movie.title).contains(func.lower(q))
-    ).limit(db_limit).all()
-    
-    for m in movies:
-        results.append(m)
-        found_ids.add(m.imdb_id)
-    
-    # 2. Turkce basliklarda ara (search_title)
-    tr_titles = db.query(MovieTitle).filter(
-        MovieTitle.search_title.contains(normalized_q)
-    ).limit(db_limit).all()
-    
-    for tr in tr_titles:
-        if tr.imdb_id not in found_ids:
-            movie = db.query(Movie).filter(Movie.imdb_id == tr.imdb_id).first()
-            if movie:
-                results.append(movie)
-                found_ids.add(tr.imdb_id)
-
-    # Sonuclari rating'e gore sirala
-    results.sort(key=lambda m: m.rating or 0, reverse=True)
+    search_index = get_search_index()
+    if search_index is not None:
+        results = search_index.search(q, limit)
+        # Indeksten cozuldu (rating/movie route'lari gibi): Redis cache'ine bakilmadi
+        response.headers["X-Cache"] = "MISS"
+        return MovieSearch(
+            results=[MovieRating.model_validate(m) for m in results],
+            total=len(results),
+            query=q
+        )
     
-    # Limit uygula (En son)
-    results = results[:limit]
+    cache_key = make_search_key(q)
+    ids = search_entry_ids(cache_get(cache_key), limit)
+    if ids is not None:
+        index = get_title_index()
+        if index is not None:
+            movies = {i: index.get_movie(i) for i in ids}
+        else:
+            movies = find_movies_by_ids(db, ids)
+        results = [movies[i] for i in ids if movies.get(i)]
+        response.headers["X-Cache"] = "HIT"
+    else:
+        results = search_movies_db(db, q, limit)
+        entry = make_search_entry([m.imdb_id for m in results], limit)
+        cache_set(cache_key, entry, settings.search_cache_ttl)
+        response.headers["X-Cache"] = "MISS"
     
     return MovieSearch(
         results=[MovieRating.model_validate(m) for m in results],
@@ -186,6 +224,7 @@ def search_movies(
 )
 def get_movie_by_id(
     imdb_id: str,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """
@@ -196,36 +235,82 @@ def get_movie_by_id(
     Query parameter'dan farki: Kaynak tanimlayici olarak kullanilir
     """
     
-    # Cache'e bak
+    # Istemcideki ETag guncelse 304, degilse cache'e bak
+    not_modified = check_not_modified(if_none_match)
+    if not_modified:
+        return not_modified
+    
     cache_key = make_movie_key(imdb_id)
     cached = cache_get(cache_key)
     if cached:
-        response = JSONResponse(content=cached)
-        response.headers["X-Cache"] = "HIT"
-        return response
+        return cached_json_response(cached, "HIT", if_none_match)
     
-    movie = db.query(Movie).filter(Movie.imdb_id == imdb_id).first()
+    index = get_title_index()
+    if index is not None:
+        movie_data = index.get_movie(imdb_id)
+    else:
+        movie = find_movie_by_id(db, imdb_id)
+        movie_data = MovieRating.model_validate(movie).model_dump() if movie else None
     
-    if not movie:
+    if not movie_data:
         raise HTTPException(
             status_code=404,
             detail=f"Film bulunamadi: {imdb_id}"
         )
     
     # Cache'e yaz
-    movie_data = MovieRating.model_validate(movie).model_dump()
     cache_set(cache_key, movie_data)
     
-    response = JSONResponse(content=movie_data)
-    response.headers["X-Cache"] = "MISS"
-    return response
+    return cached_json_response(movie_data, "MISS", if_none_match, versioned=True)
+
+
+def _resolve_uncached(db: Optional[Session], uncached: dict[str, TitleQuery]) -> dict[str, Optional[dict]]:
+    """
+    Cache'te olmayan key'leri indeksten (yoksa DB'den toplu) cozumle ve cache'e yaz.
+    Batch ve stream endpoint'leri ortak kullanir. db sadece indeks yokken gerekli.
+    
+    Returns:
+        {cache key: MovieRating payload veya None}
+    """
+    def resolve(keys):
+        index = get_title_index()
+        if index is not None:
+            resolved = {}
+            for k in keys:
+                movie_data = index.lookup(*uncached[k])
+                if movie_data is None:
+                    match = fuzzy_resolve(*uncached[k])
+                    movie_data = match.movie if match else None
+                resolved[k] = movie_data
+        else:
+            movies = find_movies(db, [uncached[k] for k in keys])
+            resolved = {}
+            for k in keys:
+                movie = movies.get(uncached[k])
+                resolved[k] = MovieRating.model_validate(movie).model_dump() if movie else None
+        
+        # Cache'e yaz: bulunanlar ve bulunamayanlar tek pipeline'da (1 round-trip)
+        cache_set_multi(
+            {k: v for k, v in resolved.items() if v},
+            negative_keys=[k for k, v in resolved.items() if not v]
+        )
+        return resolved
+    
+    # Single-flight: baska bir istegin zaten cozmekte oldugu basliklar
+    # tekrar sorgulanmaz, o istegin sonucu beklenir
+    if get_title_index() is not None:
+        return resolve(list(uncached))
+    return coalesce_many(
+        list(uncached), resolve,
+        poll=lambda keys: cache_get_multi(keys, include_negative=True)
+    )
 
 
 @router.post(
     "/ratings/batch",
     response_model=BatchRatingResponse,
     summary="Toplu rating getir",
-    description="Birden fazla film/dizi basligini tek istekte sorgular (max 20)"
+    description="Birden fazla film/dizi basligini tek istekte sorgular (max BATCH_MAX_TITLES, varsayilan 200)"
 )
 def get_batch_ratings(
     request: BatchRatingRequest,
@@ -239,71 +324,134 @@ def get_batch_ratings(
     tek istek ile tum rating'leri al.
     
     Her baslik icin once cache'e bakar (Cache-Aside).
-    Cache'te olmayanlari DB'den toplu ceker.
+    Cache'te olmayanlari DB'den toplu ceker (find_movies: en fazla 2 sorgu).
+    Basliklar yil/tur ile gonderilebilir ({"title": "Dune", "year": 2021, "kind": "movie"}):
+    ayni isimli yapimlar ek /api/rating istegi olmadan bu cagrida ayirt edilir.
+    Baska bir istegin o anda cozmekte oldugu basliklar icin onun sonucu beklenir (single-flight).
     
     MULAKATTA SORULUR:
     - "N+1 problemi nedir?" -> Her kayit icin ayri sorgu atmak
     - "Batch processing avantaji?" -> Ag ve DB yuku azalir
     """
     
+    key_to_items = group_by_rating_key(request.items())
     results = {}
-    found = 0
-    not_found = 0
-    uncached_titles = []  # Cache'te olmayanlar
     
     # 1. Adim: Once hizlica MGET ile cache'e bak (Bulk Optimization)
-    cache_keys = [make_rating_key(t) for t in request.titles]
-    # Key -> Title mapping (Cevaplari eslestirmek icin)
-    key_to_title = {k: t for k, t in zip(cache_keys, request.titles)}
-    
     # Tek seferde Redis'e sor (20x hizlanma potansiyeli)
-    cached_results = cache_get_multi(cache_keys)
+    # include_negative: "bulunamadi" kayitlari da ayni MGET'te sorulur, HIT sayilir
+    cached_results = cache_get_multi(list(key_to_items), include_negative=True)
     
-    for key, title in key_to_title.items():
+    uncached = {}  # Cache key -> TitleQuery (cache'te olmayanlar)
+    for key, key_items in key_to_items.items():
         if key in cached_results:
-            results[title.lower()] = cached_results[key]
-            found += 1
-            print(f"[Batch Cache] HIT: {title}")
+            for item in key_items:
+                results[item.result_key] = cached_results[key]
+            log_key_event(logger, "Batch HIT: %s", key)
         else:
-            uncached_titles.append(title)
-            print(f"[Batch Cache] MISS: {title}")
+            uncached[key] = title_query(key_items[0])
+            log_key_event(logger, "Batch MISS: %s", key)
     
-    # 2. Adim: Cache'te olmayanlari DB'den cek
-    for title in uncached_titles:
-        normalized_title = normalize_turkish(title)
-        movie = None
-        
-        # Ingilizce baslikta ara
-        movie = db.query(Movie).filter(
-            func.lower(Movie.title) == normalized_title
-        ).order_by(Movie.votes.desc()).first()
-        
-        # Turkce baslikta ara
-        if not movie:
-            tr_query = db.query(MovieTitle).filter(
-                MovieTitle.search_title == normalized_title
-            )
-            for tr in tr_query.all():
-                m = db.query(Movie).filter(Movie.imdb_id == tr.imdb_id).first()
-                if m:
-                    movie = m
-                    break
-        
-        if movie:
-            movie_data = MovieRating.model_validate(movie).model_dump()
-            results[title.lower()] = movie_data
-            found += 1
-            # Cache'e yaz
-            cache_key = make_rating_key(title)
-            cache_set(cache_key, movie_data)
-        else:
-            results[title.lower()] = None
-            not_found += 1
+    # 2. Adim: Cache'te olmayanlari indeksten (yoksa DB'den toplu) cek
+    resolved = _resolve_uncached(db, uncached)
+    
+    for key in uncached:
+        for item in key_to_items[key]:
+            results[item.result_key] = resolved.get(key)
     
-    print(f"[Batch] {len(request.titles)} baslik soruldu: {found} bulundu, {not_found} bulunamadi")
+    found = sum(1 for v in results.values() if v)
+    not_found = len(results) - found
+    logger.debug("Batch: %d baslik soruldu, %d bulundu, %d bulunamadi", len(results), found, not_found)
     
     return BatchRatingResponse(
         results=results,
         found=found,
         not_found=not_found
     )
+
+
+@router.post(
+    "/ratings/stream",
+    response_class=StreamingResponse,
+    summary="Toplu rating getir (streaming NDJSON)",
+    description="Basliklari cozuldukce satir satir dondurur (max BATCH_STREAM_MAX_TITLES, varsayilan 2000)"
+)
+def stream_batch_ratings(request: BatchStreamRequest):
+    """
+    Streaming batch - her baslik cozulur cozulmez bir NDJSON satiri
+    
+    OGRENME NOTU - Neden streaming?
+    /ratings/batch tum cevabi toplayip tek seferde gonderir: cache'teki basliklar
+    bile batch'teki en yavas DB MISS'ini bekler. Burada:
+    1. Key'ler BATCH_STREAM_CHUNK_SIZE'lik parcalar halinde MGET ile sorulur,
+       HIT'ler hemen yazilir (ilk kartlar milisaniyeler icinde boyanir)
+    2. MISS'ler ayni boyutta parcalar halinde cozulur (indeks/DB + single-flight),
+       her parca bitince satirlari yazilir
+    3. Son satir ozet: {"done": true, "found": 3, "not_found": 1}
+    Cevap bellekte toplanmaz, sadece o anki parcanin satirlari tutulur.
+    
+    Satir formati (key: BatchRatingItem.result_key, batch'teki results key'i ile ayni):
+        {"key": "dune|2021|movie", "result": {...} | null, "cache": "HIT" | "MISS"}
+    
+    OGRENME NOTU - DB session:
+    Depends(get_db) ile gelen session route dondugunde, govde akmaya baslamadan
+    kapanir. Bu yuzden session generator icinde ve sadece DB'ye gitmek gerekirse acilir.
+    
+    MULAKATTA SORULUR:
+    - "NDJSON nedir?" -> Her satir ayri bir JSON, satir geldikce parse edilebilir
+    - "Chunked transfer encoding?" -> Content-Length bilinmeden govde parca parca gonderilir
+    """
+    return StreamingResponse(
+        _stream_ratings(group_by_rating_key(request.items())),
+        media_type="application/x-ndjson",
+        # Proxy'ler (nginx) satirlari tamponlamasin, cevap cache'lenmesin
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+    )
+
+
+def _stream_ratings(key_to_items: dict[str, list[BatchRatingItem]]):
+    """stream_batch_ratings'in govdesi: once HIT'ler, sonra cozulen MISS'ler"""
+    counts = {"found": 0, "not_found": 0}
+    chunk_size = settings.batch_stream_chunk_size
+    
+    def lines(key, movie_data, source):
+        out = []
+        for item in key_to_items[key]:
+            counts["found" if movie_data else "not_found"] += 1
+            out.append(orjson.dumps({"key": item.result_key, "result": movie_data, "cache": source}))
+        return out
+    
+    # 1. Adim: Cache'teki basliklar (parca basina tek MGET)
+    keys = list(key_to_items)
+    misses = []
+    for i in range(0, len(keys), chunk_size):
+        part = keys[i:i + chunk_size]
+        cached = cache_get_multi(part, include_negative=True)
+        out = []
+        for key in part:
+            if key in cached:
+                out += lines(key, cached[key], "HIT")
+            else:
+                misses.append(key)
+        if out:
+            yield b"\n".join(out) + b"\n"
+    
+    # 2. Adim: MISS'ler parca parca cozulur, her parca bitince yazilir
+    db = None
+    try:
+        for i in range(0, len(misses), chunk_size):
+            part = misses[i:i + chunk_size]
+            if db is None and get_title_index() is None:
+                db = get_session_factory()()
+            resolved = _resolve_uncached(db, {k: title_query(key_to_items[k][0]) for k in part})
+            out = []
+            for key in part:
+                out += lines(key, resolved.get(key), "MISS")
+            yield b"\n".join(out) + b"\n"
+    finally:
+        if db is not None:
+            db.close()
+    
+    logger.debug("Stream: %d HIT key, %d MISS key, %d bulundu, %d bulunamadi",
+                 len(keys) - len(misses), len(misses), counts["found"], counts["not_found"])
+    yield orjson.dumps({"done": True, **counts}) + b"\n"
@@ -0,0 +1,359 @@
+"""
+Movies API Routes - Async Versiyon (ASYNC_MODE=true)
+
+OGRENME NOTU - Sync vs Async Route:
+- `def` route'lar FastAPI threadpool'unda calisir. DB/Redis beklerken
+  thread mesgul kalir, eszamanli istek sayisi thread sayisi ile sinirli.
+- `async def` route'lar event loop'ta calisir. `await` noktalarinda
+  loop diger isteklere gecer, tek worker yuzlerce istegi bekletebilir.
+
+Endpoint'ler ve davranis movies.py ile birebir ayni. DB sorgulari
+app.utils.resolver'daki sync fonksiyonlar `AsyncSession.run_sync()` ile
+calistirilir, Redis icin cache.py'deki *_async fonksiyonlar kullanilir.
+
+DIKKAT: Async route icinde BLOKLAYAN cagri (sync Redis, time.sleep, requests)
+yapilmamali - tum event loop durur.
+"""
+
+import logging
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.config import settings
+from app.database import get_async_db, get_async_session_factory
+from app.schemas import (
+    MovieRating, MovieSearch, ErrorResponse, TitleKind,
+    BatchRatingItem, BatchRatingRequest, BatchRatingResponse, BatchStreamRequest
+)
+from app.utils.turkish import normalize_turkish
+from app.utils.cache import (
+    cache_get_async, cache_set_async, cache_get_multi_async, cache_set_multi_async,
+    cache_lookup_async, cache_set_negative_async,
+    make_rating_key, make_movie_key, make_search_key,
+    make_search_entry, search_entry_ids
+)
+from app.utils.title_index import get_title_index
+from app.utils.search_index import get_search_index
+from app.utils.fuzzy_index import fuzzy_resolve
+from app.utils.http_cache import check_not_modified, cached_json_response
+from app.utils.log import log_key_event
+from app.utils.singleflight import coalesce_async, coalesce_many_async
+from app.utils.resolver import group_by_rating_key, title_query, find_movie, find_movies, find_movie_by_id, find_movies_by_ids, search_movies_db
+
+logger = logging.getLogger(__name__)
+
+# Router olustur
+router = APIRouter()
+
+
+@router.get(
+    "/rating",
+    response_model=MovieRating,
+    responses={404: {"model": ErrorResponse}},
+    summary="Film rating getir",
+    description="Film adi (Turkce veya Ingilizce) ve yila gore IMDB rating'i dondurur"
+)
+async def get_movie_rating(
+    title: str = Query(..., description="Film adi (Turkce veya Ingilizce)", min_length=1),
+    year: Optional[int] = Query(None, description="Yapim yili", ge=1900, le=2030),
+    kind: Optional[TitleKind] = Query(None, description="Tur: movie veya series"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Film rating'i getir (async) - bkz. movies.get_movie_rating"""
+
+    # Istemcideki ETag guncelse (import olmadi) cache'e bile gitmeden 304
+    not_modified = check_not_modified(if_none_match)
+    if not_modified:
+        return not_modified
+
+    normalized_title = normalize_turkish(title)
+
+    cache_key = make_rating_key(title, year, kind)
+    hit, cached = await cache_lookup_async(cache_key)
+    if hit and cached is None:
+        # Negatif cache HIT: daha once aranip bulunamamis, DB'ye tekrar gitme
+        log_key_event(logger, "NEGATIVE HIT: %s", cache_key)
+        raise HTTPException(
+            status_code=404,
+            detail=f"Film bulunamadi: {title}" + (f" ({year})" if year else ""),
+            headers={"X-Cache": "HIT"}
+        )
+    if hit:
+        log_key_event(logger, "HIT: %s", cache_key)
+        return cached_json_response(cached, "HIT", if_none_match)
+
+    log_key_event(logger, "MISS: %s", cache_key)
+
+    async def resolve():
+        index = get_title_index()
+        if index is not None:
+            movie_data = index.lookup(normalized_title, year, kind)
+            if movie_data is None:
+                # Exact eslesme yok: noktalama, sezon etiketi, yazim hatasi icin fuzzy asama
+                match = fuzzy_resolve(title, year, kind)
+                if match:
+                    log_key_event(logger, "FUZZY: %s -> %s (%.2f)", cache_key, match.matched_key, match.confidence)
+                    movie_data = match.movie
+        else:
+            movie = await db.run_sync(find_movie, normalized_title, year, kind)
+            movie_data = MovieRating.model_validate(movie).model_dump() if movie else None
+
+        # Bulunamadi sonucunu da (kisa TTL ile) cache'le.
+        # Key yil/tur icerdigi icin "Inception (1800)" bulunamadi kaydi
+        # "Inception" aramasini etkilemez
+        if movie_data:
+            await cache_set_async(cache_key, movie_data)
+        else:
+            await cache_set_negative_async(cache_key)
+        return movie_data
+
+    # Single-flight: DB'ye gidilecekse ayni key icin tek cozumleme calisir
+    if get_title_index() is not None:
+        movie_data = await resolve()
+    else:
+        movie_data = await coalesce_async(cache_key, resolve, poll=lambda: cache_lookup_async(cache_key))
+
+    if not movie_data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Film bulunamadi: {title}" + (f" ({year})" if year else ""),
+            headers={"X-Cache": "MISS"}
+        )
+
+    return cached_json_response(movie_data, "MISS", if_none_match, versioned=True)
+
+
+@router.get(
+    "/search",
+    response_model=MovieSearch,
+    summary="Film ara",
+    description="Film adina gore arama yapar (Turkce ve Ingilizce), birden fazla sonuc donebilir"
+)
+async def search_movies(
+    response: Response,
+    q: str = Query(..., description="Arama sorgusu (Turkce veya Ingilizce)", min_length=2),
+    limit: int = Query(50, description="Maksimum sonuc sayisi", ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Film ara (async) - bkz. movies.search_movies"""
+
+    search_index = get_search_index()
+    if search_index is not None:
+        results = search_index.search(q, limit)
+        # Indeksten cozuldu (rating/movie route'lari gibi): Redis cache'ine bakilmadi
+        response.headers["X-Cache"] = "MISS"
+        return MovieSearch(
+            results=[MovieRating.model_validate(m) for m in results],
+            total=len(results),
+            query=q
+        )
+
+    cache_key = make_search_key(q)
+    ids = search_entry_ids(await cache_get_async(cache_key), limit)
+    if ids is not None:
+        index = get_title_index()
+        if index is not None:
+            movies = {i: index.get_movie(i) for i in ids}
+        else:
+            movies = await db.run_sync(find_movies_by_ids, ids)
+        results = [movies[i] for i in ids if movies.get(i)]
+        response.headers["X-Cache"] = "HIT"
+    else:
+        results = await db.run_sync(search_movies_db, q, limit)
+        entry = make_search_entry([m.imdb_id for m in results], limit)
+        await cache_set_async(cache_key, entry, settings.search_cache_ttl)
+        response.headers["X-Cache"] = "MISS"
+
+    return MovieSearch(
+        results=[MovieRating.model_validate(m) for m in results],
+        total=len(results),
+        query=q
+    )
+
+
+@router.get(
+    "/movie/{imdb_id}",
+    response_model=MovieRating,
+    responses={404: {"model": ErrorResponse}},
+    summary="IMDB ID ile film getir"
+)
+async def get_movie_by_id(
+    imdb_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """IMDB ID ile film getir (async) - bkz. movies.get_movie_by_id"""
+
+    not_modified = check_not_modified(if_none_match)
+    if not_modified:
+        return not_modified
+
+    cache_key = make_movie_key(imdb_id)
+    cached = await cache_get_async(cache_key)
+    if cached:
+        return cached_json_response(cached, "HIT", if_none_match)
+
+    index = get_title_index()
+    if index is not None:
+        movie_data = index.get_movie(imdb_id)
+    else:
+        movie = await db.run_sync(find_movie_by_id, imdb_id)
+        movie_data = MovieRating.model_validate(movie).model_dump() if movie else None
+
+    if not movie_data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Film bulunamadi: {imdb_id}"
+        )
+
+    await cache_set_async(cache_key, movie_data)
+
+    return cached_json_response(movie_data, "MISS", if_none_match, versioned=True)
+
+
+async def _resolve_uncached(db: Optional[AsyncSession], uncached: dict) -> dict:
+    """Cache'te olmayan key'leri cozumle ve cache'e yaz (async) - bkz. movies._resolve_uncached"""
+    async def resolve(keys):
+        index = get_title_index()
+        if index is not None:
+            resolved = {}
+            for k in keys:
+                movie_data = index.lookup(*uncached[k])
+                if movie_data is None:
+                    match = fuzzy_resolve(*uncached[k])
+                    movie_data = match.movie if match else None
+                resolved[k] = movie_data
+        else:
+            movies = await db.run_sync(find_movies, [uncached[k] for k in keys])
+            resolved = {}
+            for k in keys:
+                movie = movies.get(uncached[k])
+                resolved[k] = MovieRating.model_validate(movie).model_dump() if movie else None
+
+        await cache_set_multi_async(
+            {k: v for k, v in resolved.items() if v},
+            negative_keys=[k for k, v in resolved.items() if not v]
+        )
+        return resolved
+
+    # Single-flight: baska bir istegin cozmekte oldugu basliklar icin onun sonucu beklenir
+    if get_title_index() is not None:
+        return await resolve(list(uncached))
+    return await coalesce_many_async(
+        list(uncached), resolve,
+        poll=lambda keys: cache_get_multi_async(keys, include_negative=True)
+    )
+
+
+@router.post(
+    "/ratings/batch",
+    response_model=BatchRatingResponse,
+    summary="Toplu rating getir",
+    description="Birden fazla film/dizi basligini tek istekte sorgular (max BATCH_MAX_TITLES, varsayilan 200)"
+)
+async def get_batch_ratings(
+    request: BatchRatingRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Toplu rating sorgulama (async) - bkz. movies.get_batch_ratings"""
+
+    key_to_items = group_by_rating_key(request.items())
+    results = {}
+
+    # 1. Adim: MGET ile cache'e bak
+    # include_negative: "bulunamadi" kayitlari da ayni MGET'te sorulur, HIT sayilir
+    cached_results = await cache_get_multi_async(list(key_to_items), include_negative=True)
+
+    uncached = {}  # Cache key -> TitleQuery
+    for key, key_items in key_to_items.items():
+        if key in cached_results:
+            for item in key_items:
+                results[item.result_key] = cached_results[key]
+            log_key_event(logger, "Batch HIT: %s", key)
+        else:
+            uncached[key] = title_query(key_items[0])
+            log_key_event(logger, "Batch MISS: %s", key)
+
+    # 2. Adim: Cache'te olmayanlari indeksten (yoksa DB'den toplu) cek
+    resolved = await _resolve_uncached(db, uncached)
+
+    for key in uncached:
+        for item in key_to_items[key]:
+            results[item.result_key] = resolved.get(key)
+
+    found = sum(1 for v in results.values() if v)
+    not_found = len(results) - found
+    logger.debug("Batch: %d baslik soruldu, %d bulundu, %d bulunamadi", len(results), found, not_found)
+
+    return BatchRatingResponse(
+        results=results,
+        found=found,
+        not_found=not_found
+    )
+
+
+@router.post(
+    "/ratings/stream",
+    response_class=StreamingResponse,
+    summary="Toplu rating getir (streaming NDJSON)",
+    description="Basliklari cozuldukce satir satir dondurur (max BATCH_STREAM_MAX_TITLES, varsayilan 2000)"
+)
+async def stream_batch_ratings(request: BatchStreamRequest):
+    """Streaming batch (async) - bkz. movies.stream_batch_ratings"""
+    return StreamingResponse(
+        _stream_ratings(group_by_rating_key(request.items())),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _stream_ratings(key_to_items: dict[str, list[BatchRatingItem]]):
+    """Async generator: once HIT'ler, sonra cozulen MISS'ler"""
+    counts = {"found": 0, "not_found": 0}
+    chunk_size = settings.batch_stream_chunk_size
+
+    def lines(key, movie_data, source):
+        out = []
+        for item in key_to_items[key]:
+            counts["found" if movie_data else "not_found"] += 1
+            out.append(orjson.dumps({"key": item.result_key, "result": movie_data, "cache": source}))
+        return out
+
+    keys = list(key_to_items)
+    misses = []
+    for i in range(0, len(keys), chunk_size):
+        part = keys[i:i + chunk_size]
+        cached = await cache_get_multi_async(part, include_negative=True)
+        out = []
+        for key in part:
+            if key in cached:
+                out += lines(key, cached[key], "HIT")
+            else:
+                misses.append(key)
+        if out:
+            yield b"\n".join(out) + b"\n"
+
+    # Session route'un Depends'i ile degil burada acilir (govde akarken Depends kapanmis olur)
+    db = None
+    try:
+        for i in range(0, len(misses), chunk_size):
+            part = misses[i:i + chunk_size]
+            if db is None and get_title_index() is None:
+                db = get_async_session_factory()()
+            resolved = await _resolve_uncached(db, {k: title_query(key_to_items[k][0]) for k in part})
+            out = []
+            for key in part:
+                out += lines(key, resolved.get(key), "MISS")
+            yield b"\n".join(out) + b"\n"
+    finally:
+        if db is not None:
+            await db.close()
+
+    logger.debug("Stream: %d HIT key, %d MISS key, %d bulundu, %d bulunamadi",
+                 len(keys) - len(misses), len(misses), counts["found"], counts["not_found"])
+    yield orjson.dumps({"done": True, **counts}) + b"\n"
@@ -12,7 +12,9 @@ FARK:
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal, Union
+
+from app.config import settings
 
 
 class MovieRating(BaseModel):
@@ -30,6 +32,7 @@ class MovieRating(BaseModel):
     rating: Optional[float] = Field(None, ge=0, le=10, description="IMDB puani (0-10)")
     votes: Optional[int] = Field(None, ge=0, description="Oy sayisi")
     genres: Optional[str] = Field(None, description="Turler (virgul ile ayrilmis)")
+    title_type: Optional[str] = Field(None, description="IMDB tipi (movie, tvSeries, tvMiniSeries)")
     
     class Config:
         # ORM modelden direkt olusturulabilir
@@ -44,6 +47,38 @@ class MovieSearch(BaseModel):
     query: str = Field(..., description="Arama sorgusu")
 
 
+# Tur filtresi: movie -> IMDB "movie", series -> "tvSeries" / "tvMiniSeries"
+TitleKind = Literal["movie", "series"]
+
+
+class BatchRatingItem(BaseModel):
+    """
+    Batch icinde yil ve tur bilgisi ile tek baslik
+    
+    OGRENME NOTU:
+    Ayni isimli yapimlar (remake'ler, ayni adli film ve dizi) sadece baslikla
+    ayirt edilemez. Yil/tur verilirse cozumleme ve cache key'i bunlara gore yapilir,
+    extension belirsiz kartlar icin ayrica /api/rating istegi atmak zorunda kalmaz.
+    Netflix dizilerde son sezonun yilini gosterebilir: dizide yil gondermemek daha guvenli.
+    """
+    
+    title: str = Field(..., min_length=1, description="Film/dizi basligi")
+    year: Optional[int] = Field(None, ge=1900, le=2030, description="Yapim yili")
+    kind: Optional[TitleKind] = Field(None, description="Tur: movie veya series")
+    
+    @property
+    def result_key(self) -> str:
+        """
+        Cevaptaki results dict'inde bu baslik icin key.
+        Yil/tur yoksa title.lower() (duz string ile ayni), varsa "baslik|yil|tur".
+        
+        Ornek: ("Dune", 2021, "movie") -> "dune|2021|movie", ("Dark", None, "series") -> "dark||series"
+        """
+        if self.year is None and self.kind is None:
+            return self.title.lower()
+        return f"{self.title.lower()}|{self.year or ''}|{self.kind or ''}"
+
+
 class BatchRatingRequest(BaseModel):
     """
     Batch rating istegi - birden fazla filmi tek istekte sorgula
@@ -54,14 +89,39 @@ class BatchRatingRequest(BaseModel):
     
     MULAKATTA SORULUR:
     - "GET vs POST ne zaman kullanilir?" -> GET okuma, POST olusturma/toplu islem
-    - "Neden batch?" -> N+1 problem: 100 kart = 100 HTTP istegi yerine 5 istek
+    - "Neden batch?" -> N+1 problem: 100 kart = 100 HTTP istegi yerine 1 istek
+    
+    Limit BATCH_MAX_TITLES env degiskeni ile ayarlanir (varsayilan 200).
+    
+    Her eleman duz baslik ("Inception") veya yil/tur iceren obje olabilir:
+    {"title": "Dune", "year": 2021, "kind": "movie"}. Ikisi ayni istekte karisabilir.
+    """
+    
+    titles: List[Union[str, BatchRatingItem]] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.batch_max_titles,
+        description=f"Sorgulanacak film/dizi basliklari veya {{title, year, kind}} objeleri (max {settings.batch_max_titles})"
+    )
+    
+    def items(self) -> List[BatchRatingItem]:
+        """Duz string basliklari da BatchRatingItem'a cevir (route'lar tek tip ile calisir)"""
+        return [BatchRatingItem(title=t) if isinstance(t, str) else t for t in self.titles]
+
+
+class BatchStreamRequest(BatchRatingRequest):
+    """
+    Streaming batch istegi (POST /api/ratings/stream)
+    
+    Eleman formati BatchRatingRequest ile ayni. Cevap NDJSON olarak satir satir
+    aktigi icin limit daha yuksek: BATCH_STREAM_MAX_TITLES (varsayilan 2000).
     """
     
-    titles: List[str] = Field(
+    titles: List[Union[str, BatchRatingItem]] = Field(
         ...,
         min_length=1,
-        max_length=20,
-        description="Sorgulanacak film/dizi basliklari (max 20)"
+        max_length=settings.batch_stream_max_titles,
+        description=f"Sorgulanacak film/dizi basliklari veya {{title, year, kind}} objeleri (max {settings.batch_stream_max_titles})"
     )
 
 
@@ -72,6 +132,7 @@ class BatchRatingResponse(BaseModel):
     OGRENME NOTU:
     results dict olarak donuyor: { "stranger things": {rating data}, ... }
     Boylece client hangi basligin hangi sonuca denk geldigini bilir.
+    Yil/tur verilen basliklarin key'i BatchRatingItem.result_key: "dune|2021|movie"
     """
     
     results: Dict[str, Optional[MovieRating]] = Field(
@@ -1,2 +1,2 @@
 # Utils package
-from app.utils.turkish import normalize_turkish, turkish_match, turkish_contains
+from app.utils.turkish import normalize_turkish, normalize_sql, turkish_match, turkish_contains
@@ -19,27 +19,213 @@ Key ornekleri:
   "search:dark" -> "dark" arama sonuclari
 
 Key'lerin tutarli olmasi icin title normalize edilir (lowercase, ASCII).
+
+ONEMLI KAVRAM - Veri seti namespace'i:
+Veri seti versiyonu biliniyorsa (baslik indeksi ozeti veya DATASET_VERSION)
+rating/movie key'leri versiyonla on eklenir: "rating@<versiyon>:inception".
+Indeks yuklu instance cevabi kendi indeksinden uretir; import + reload sonrasi
+eski indeksten uretilmis kayitlar yeni namespace'ten HIC okunmaz, henuz reload
+olmamis instance'lar ise eski namespace'te tutarli kalir. Versiyon yoksa
+(indeks kapali, cevaplar DB'den) key'ler versiyonsuzdur ve delta import
+degisen key'leri hedefli siler.
+
+ONEMLI KAVRAM - Iki Katmanli Cache (L1 + L2):
+  L1: Process icinde LRU + TTL (LocalCache) -> ~mikrosaniye, ag yok
+  L2: Redis (Upstash)                       -> ~3ms, tum worker'lar paylasir
+Okuma: L1 -> L2 -> (MISS) DB. L2'den gelen deger L1'e de yazilir.
+Yazma: Her iki katmana birden.
+L1 TTL'i kisa tutulur (varsayilan 60sn), boylece worker'lar arasi
+tutarsizlik en fazla birkac dakika surer.
+
+ONEMLI KAVRAM - Codec (Serilestirme):
+Redis'e yazilan deger CACHE_CODEC ile secilen codec'ten gecer:
+  json    -> stdlib, bagimliliksiz
+  orjson  -> Rust ile yazilmis JSON, stdlib'den ~5-10x hizli (varsayilan)
+  msgpack -> Binary format, daha kucuk ama insan okuyamaz
+json ve orjson ayni formati uretir, aralarinda gecis yapmak cache'i bozmaz.
+msgpack'e gecince eski JSON kayitlari cozulemez ve MISS sayilir (TTL ile temizlenir).
+Olcum: backend/benchmarks/bench_codec.py
 """
 
 import json
-from typing import Optional, Any
-from app.redis import get_redis_client
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Iterable, Callable
+from app.redis import get_redis_client, get_async_redis_client
 from app.config import settings
+from app.utils.http_cache import dataset_version
+from app.utils.metrics import record_cache, redis_timer
+from app.utils.turkish import normalize_turkish
+
+logger = logging.getLogger(__name__)
+
+
+class Codec:
+    """
+    Cache degerlerini byte'a cevirir ve geri cozer.
+    
+    OGRENME NOTU:
+    Cache HIT yolunda en pahali is Redis round-trip'inden sonra serilestirme.
+    Codec tek bir yerde tutuldugu icin format degistirmek tek satir (CACHE_CODEC).
+    """
+    
+    def __init__(self, name: str, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Isme gore codec olustur. orjson/msgpack sadece secilirse import edilir.
+    
+    Raises:
+        ValueError: Bilinmeyen codec adi
+    """
+    if name == "json":
+        return Codec(
+            "json",
+            lambda value: json.dumps(value, separators=(",", ":")).encode(),
+            json.loads,
+        )
+    if name == "orjson":
+        import orjson
+        return Codec("orjson", orjson.dumps, orjson.loads)
+    if name == "msgpack":
+        import msgpack
+        return Codec(
+            "msgpack",
+            lambda value: msgpack.packb(value, use_bin_type=True),
+            lambda data: msgpack.unpackb(data, raw=False),
+        )
+    raise ValueError(f"Bilinmeyen CACHE_CODEC: {name} (json, orjson, msgpack)")
+
+
+# Aktif codec (process basina bir kez secilir)
+_codec = get_codec(settings.cache_codec)
+
+
+class LocalCache:
+    """
+    L1 cache: Boyutu sinirli, LRU eviction + TTL, thread-safe.
+    
+    OGRENME NOTU - LRU (Least Recently Used):
+    OrderedDict eklenme sirasini tutar. Her okumada key'i sona tasiriz
+    (move_to_end), boylece en basta hep en uzun suredir kullanilmayan kalir.
+    Kapasite dolunca bastan sileriz (popitem(last=False)) -> O(1).
+    
+    Sync route'lar threadpool'da calistigi icin erisim Lock ile korunur.
+    
+    MULAKATTA SORULUR:
+    - "LRU cache nasil implement edilir?" -> Hash map + doubly linked list (OrderedDict)
+    - "Neden TTL de var?" -> LRU sadece boyutu sinirlar, veri tazeligini sinirlamaz
+    """
+    
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+    
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Returns:
+            (bulundu_mu, deger) - deger None olabilecegi icin ayri flag donuyoruz
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return False, None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return False, None
+            
+            self._data.move_to_end(key)
+            self.stats["hits"] += 1
+            return True, value
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        # L1 hicbir zaman L2'den uzun tutmaz
+        ttl = min(ttl or self.ttl, self.ttl)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.stats["evictions"] += 1
+    
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
+
 
+# Negatif cache: "bulunamadi" kayitlari ayri namespace'te tutulur
+# Deger codec'ten gecmez, sadece var olmasi yeterli
+NEGATIVE_PREFIX = "notfound:"
+NEGATIVE_MARKER = b"1"
+# L1'de negatif kayit degeri (None ile karismasin diye ayri obje)
+_NEGATIVE = object()
+
+# L1 cache (process basina bir tane) - None ise L1 kapali
+_local_cache: Optional[LocalCache] = (
+    LocalCache(settings.l1_cache_max_size, settings.l1_cache_ttl)
+    if settings.cache_enabled and settings.l1_cache_enabled else None
+)
 
 # Cache istatistikleri (uygulama hafizasinda tutuluyor)
+# hits/misses: Toplam (L1 veya L2'den donen istek HIT sayilir)
+# l2_hits/l2_misses: Sadece Redis'e giden istekler
 _cache_stats = {
     "hits": 0,
     "misses": 0,
+    "l2_hits": 0,
+    "l2_misses": 0,
+    "negative_hits": 0,  # "Bulunamadi" kaydindan donen HIT'ler (hits'e dahil)
 }
+# Sync route'lar threadpool'da calisir: "x += 1" atomik degil (oku-topla-yaz), kilitle
+_stats_lock = threading.Lock()
+
+
+def _count(*names: str, amount: int = 1):
+    """Istatistik sayaclarini kilit altinda artir"""
+    with _stats_lock:
+        for name in names:
+            _cache_stats[name] += amount
+
+
+def get_local_cache() -> Optional[LocalCache]:
+    """L1 cache'i dondur (flush endpoint'i icin)"""
+    return _local_cache
 
 
 def get_cache_stats() -> dict:
-    """Cache istatistiklerini dondur"""
+    """Cache istatistiklerini dondur (toplam + katman bazinda)"""
     client = get_redis_client()
-    stats = dict(_cache_stats)
+    with _stats_lock:
+        counters = dict(_cache_stats)
+    stats = {
+        "hits": counters["hits"],
+        "misses": counters["misses"],
+        "negative_hits": counters["negative_hits"],
+    }
     stats["enabled"] = settings.cache_enabled
     stats["connected"] = client is not None
+    stats["codec"] = _codec.name
     
     if client:
         try:
@@ -49,40 +235,138 @@ def get_cache_stats() -> dict:
     else:
         stats["total_keys"] = 0
     
+    if _local_cache is not None:
+        stats["l1"] = {
+            **_local_cache.stats,
+            "size": len(_local_cache),
+            "max_size": _local_cache.max_size,
+            "ttl": _local_cache.ttl,
+        }
+    else:
+        stats["l1"] = {"enabled": False}
+    
+    stats["l2"] = {
+        "hits": counters["l2_hits"],
+        "misses": counters["l2_misses"],
+        "evictions": None,  # Redis tarafinda (INFO stats -> evicted_keys)
+    }
+    
     return stats
 
 
+def _l1_set(key: str, value: Any, ttl: Optional[int] = None):
+    if _local_cache is not None:
+        _local_cache.set(key, value, ttl)
+
+
+def _prepare_lookup(keys: list[str], include_negative: bool) -> tuple[dict, list[str], list[str]]:
+    """
+    Okumanin 1. yarisi: L1'e bak, Redis'e sorulacak key'leri hazirla.
+    
+    OGRENME NOTU:
+    Sync ve async fonksiyonlar sadece Redis cagrisinda farkli. L1 ve
+    istatistik mantigi bu iki yardimci fonksiyonda ortak tutuluyor:
+        results, pending, redis_keys = _prepare_lookup(...)
+        values = client.mget(redis_keys)      # veya await client.mget(...)
+        _complete_lookup(results, pending, values, ...)
+    
+    Returns:
+        (L1'de bulunanlar, Redis'e sorulacak mantiksal key'ler, MGET key listesi)
+    """
+    results = {}
+    pending = []
+    for key in keys:
+        if _local_cache is not None:
+            found, value = _local_cache.get(key)
+            if found and value is not _NEGATIVE:
+                results[key] = value
+                _count("hits")
+                record_cache(key, "l1", "hit")
+                continue
+            if found and include_negative:
+                results[key] = None
+                _count("hits", "negative_hits")
+                record_cache(key, "l1", "negative_hit")
+                continue
+        pending.append(key)
+    
+    redis_keys = list(pending)
+    if include_negative:
+        redis_keys += [make_negative_key(k) for k in pending]
+    return results, pending, redis_keys
+
+
+def _decode(key: str, data: bytes) -> Optional[Any]:
+    """Redis degerini coz. Cozulemezse (ornegin codec degismis) None -> MISS"""
+    try:
+        return _codec.decode(data)
+    except Exception as e:
+        logger.warning("Cozme hatasi (key=%s, codec=%s): %s", key, _codec.name, e)
+        return None
+
+
+def _complete_lookup(results: dict, pending: list[str], values: Optional[list], include_negative: bool) -> dict:
+    """
+    Okumanin 2. yarisi: MGET cevabini coz, L1'i doldur, istatistikleri guncelle.
+    values None ise Redis yok/hata -> pending'in hepsi MISS.
+    """
+    if values is None:
+        if settings.cache_enabled:
+            _count("misses", amount=len(pending))
+            for key in pending:
+                record_cache(key, "l2", "miss")
+        return results
+    
+    n = len(pending)
+    for i, key in enumerate(pending):
+        value = _decode(key, values[i]) if values[i] else None
+        if value is not None:
+            results[key] = value
+            _l1_set(key, value)
+            _count("l2_hits", "hits")
+            record_cache(key, "l2", "hit")
+        elif include_negative and values[n + i]:
+            # "Bulunamadi" kaydi -> HIT sayilir ama deger None
+            results[key] = None
+            _l1_set(key, _NEGATIVE, settings.negative_cache_ttl)
+            _count("l2_hits", "hits", "negative_hits")
+            record_cache(key, "l2", "negative_hit")
+        else:
+            _count("l2_misses", "misses")
+            record_cache(key, "l2", "miss")
+    return results
+
+
 def cache_get(key: str) -> Optional[Any]:
     """
     Cache'ten veri oku.
     
     OGRENME NOTU:
-    - Redis'te her sey string olarak saklanir
-    - JSON.loads ile tekrar Python dict'e donusturuyoruz
+    - Redis'te her sey byte olarak saklanir
+    - Codec (varsayilan orjson) ile tekrar Python dict'e donusturuyoruz
     - Key yoksa veya Redis baglantisi yoksa None dondurur
+    - Once L1 (process ici) cache'e bakilir, Redis'e sadece L1 MISS'te gidilir
     
     Returns:
         Veri varsa dict, yoksa None
     """
+    results, pending, _ = _prepare_lookup([key], include_negative=False)
+    if not pending:
+        return results[key]
+    
     client = get_redis_client()
-    if not client:
-        return None
+    values = None
+    if client:
+        try:
+            with redis_timer("get"):
+                values = [client.get(key)]
+        except Exception as e:
+            logger.warning("Okuma hatasi (key=%s): %s", key, e)
     
-    try:
-        data = client.get(key)
-        if data:
-            _cache_stats["hits"] += 1
-            return json.loads(data)
-        else:
-            _cache_stats["misses"] += 1
-            return None
-    except Exception as e:
-        print(f"[Cache] Okuma hatasi (key={key}): {e}")
-        _cache_stats["misses"] += 1
-        return None
+    return _complete_lookup(results, pending, values, include_negative=False).get(key)
 
 
-def cache_get_multi(keys: list[str]) -> dict[str, Any]:
+def cache_get_multi(keys: list[str], include_negative: bool = False) -> dict[str, Any]:
     """
     Birden fazla key icin cache'ten veri oku (MGET).
     
@@ -91,37 +375,46 @@ def cache_get_multi(keys: list[str]) -> dict[str, Any]:
     - Network round-trip suresini 20 kat iyilestirir (teorik olarak).
     - Redis single-threaded oldugu icin, cok sayida kucuk komut gondermek yerine
       tek buyuk komut gondermek throughput'u (islem kapasitesi) arttirir.
+    - L1'de bulunanlar Redis'e hic sorulmaz, Redis HIT'leri L1'e doldurulur.
+    
+    Args:
+        keys: Cache key'leri
+        include_negative: True ise "bulunamadi" kayitlari da ayni MGET'te sorulur
+            ve HIT sayilir. Bu key'ler sonucta None degeri ile yer alir.
     
     Returns:
         Bulunan kayitlarin dict hali: {key: value}
+        (include_negative=True ise bulunamadi kayitlari {key: None})
     """
-    client = get_redis_client()
-    if not client or not keys:
+    if not keys:
         return {}
     
-    try:
-        # Redis MGET: Tek seferde n tane key sor
-        values = client.mget(keys)
-        
-        results = {}
-        hits = 0
-        misses = 0
-        
-        for key, value in zip(keys, values):
-            if value:
-                results[key] = json.loads(value)
-                hits += 1
-            else:
-                misses += 1
-        
-        _cache_stats["hits"] += hits
-        _cache_stats["misses"] += misses
-        
+    results, pending, redis_keys = _prepare_lookup(keys, include_negative)
+    if not pending:
         return results
-        
-    except Exception as e:
-        print(f"[Cache] MGET hatasi: {e}")
-        return {}
+    
+    client = get_redis_client()
+    values = None
+    if client:
+        try:
+            # Redis MGET: Tek seferde n tane key sor
+            with redis_timer("mget"):
+                values = client.mget(redis_keys)
+        except Exception as e:
+            logger.warning("MGET hatasi: %s", e)
+    
+    return _complete_lookup(results, pending, values, include_negative)
+
+
+def cache_lookup(key: str) -> tuple[bool, Any]:
+    """
+    Tek key icin pozitif ve negatif cache'e tek MGET ile bak.
+    
+    Returns:
+        (HIT mi, deger) - (True, None) ise "bulunamadi" olarak cache'lenmis
+    """
+    results = cache_get_multi([key], include_negative=True)
+    return key in results, results.get(key)
 
 
 def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -143,55 +436,375 @@ def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> bool:
     Returns:
         Basarili ise True
     """
+    _l1_set(key, value, ttl)
+    
     client = get_redis_client()
     if not client:
         return False
     
     try:
         ttl = ttl or settings.cache_ttl
-        serialized = json.dumps(value)
-        client.setex(key, ttl, serialized)
+        serialized = _codec.encode(value)
+        with redis_timer("setex"):
+            client.setex(key, ttl, serialized)
         return True
     except Exception as e:
-        print(f"[Cache] Yazma hatasi (key={key}): {e}")
+        logger.warning("Yazma hatasi (key=%s): %s", key, e)
+        return False
+
+
+def cache_set_negative(key: str, ttl: Optional[int] = None) -> bool:
+    """
+    "Bulunamadi" sonucunu cache'e yaz (Negative Caching).
+    
+    OGRENME NOTU - Negative Caching:
+    Netflix orijinalleri, stand-up'lar gibi IMDB'de olmayan icerikler
+    her istekte DB'de tekrar tekrar aranir ve yine bulunamaz.
+    "Bulunamadi" bilgisini de cache'lersek bu bosuna yapilan sorgular biter.
+    - Ayri namespace: "notfound:rating:xyz" -> pozitif kayitlarla karismaz
+    - Daha kisa TTL (NEGATIVE_CACHE_TTL): Import sonrasi eklenen film
+      en gec birkac dakika icinde gorunur olur
+    
+    DNS'teki NXDOMAIN cache'i ayni fikirdir.
+    """
+    ttl = ttl or settings.negative_cache_ttl
+    _l1_set(key, _NEGATIVE, ttl)
+    
+    client = get_redis_client()
+    if not client:
+        return False
+    
+    try:
+        with redis_timer("setex"):
+            client.setex(make_negative_key(key), ttl, NEGATIVE_MARKER)
+        return True
+    except Exception as e:
+        logger.warning("Yazma hatasi (key=%s): %s", key, e)
+        return False
+
+
+def _prepare_writes(
+    entries: dict[str, Any],
+    ttl: Optional[int],
+    ttls: Optional[dict[str, int]],
+    negative_keys: Iterable[str],
+    l1: bool = True,
+) -> list[tuple[str, int, bytes]]:
+    """
+    Toplu yazmanin ortak kismi: L1'e yaz, Redis'e gidecek SETEX listesini hazirla.
+    
+    Returns:
+        [(redis_key, ttl, deger), ...]
+    """
+    ttls = ttls or {}
+    writes = []
+    for key, value in entries.items():
+        key_ttl = ttls.get(key) or ttl or settings.cache_ttl
+        if l1:
+            _l1_set(key, value, key_ttl)
+        writes.append((key, key_ttl, _codec.encode(value)))
+    
+    for key in negative_keys:
+        if l1:
+            _l1_set(key, _NEGATIVE, settings.negative_cache_ttl)
+        writes.append((make_negative_key(key), settings.negative_cache_ttl, NEGATIVE_MARKER))
+    return writes
+
+
+def cache_set_multi(
+    entries: dict[str, Any],
+    ttl: Optional[int] = None,
+    ttls: Optional[dict[str, int]] = None,
+    negative_keys: Iterable[str] = (),
+    l1: bool = True,
+) -> bool:
+    """
+    Birden fazla key'i tek round-trip'te cache'e yaz (Pipeline).
+    
+    OGRENME NOTU - Redis Pipeline:
+    MGET'in yazma tarafinda karsiligi yok (MSET TTL almaz), bu yuzden
+    SETEX komutlari pipeline'a doldurulup tek seferde gonderilir:
+        20 x SETEX = 20 round-trip  ->  pipeline = 1 round-trip
+    transaction=False: MULTI/EXEC gerekmez, key'ler birbirinden bagimsiz.
+    
+    Args:
+        entries: {key: value} - pozitif kayitlar
+        ttl: Tum pozitif kayitlar icin sure, None ise CACHE_TTL
+        ttls: Key bazinda sure ({key: saniye}), ttl'i ezer
+        negative_keys: "Bulunamadi" olarak yazilacak key'ler (NEGATIVE_CACHE_TTL)
+        l1: False ise sadece Redis'e yazilir (warmup gibi toplu islerde L1'deki
+            sicak key'leri LRU ile disari atmamak icin)
+    
+    Returns:
+        Basarili ise True
+    """
+    writes = _prepare_writes(entries, ttl, ttls, negative_keys, l1)
+    if not writes:
+        return True
+    
+    client = get_redis_client()
+    if not client:
+        return False
+    
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, key_ttl, serialized in writes:
+            pipe.setex(key, key_ttl, serialized)
+        with redis_timer("pipeline_setex"):
+            pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning("Toplu yazma hatasi (%s key): %s", len(writes), e)
         return False
 
 
 def cache_delete(key: str) -> bool:
-    """Cache'ten veri sil"""
+    """Cache'ten veri sil (L1 + L2, negatif kayit dahil)"""
+    if _local_cache is not None:
+        _local_cache.delete(key)
+    
     client = get_redis_client()
     if not client:
         return False
     
     try:
-        client.delete(key)
+        with redis_timer("delete"):
+            client.delete(key, make_negative_key(key))
+        return True
+    except Exception as e:
+        logger.warning("Silme hatasi (key=%s): %s", key, e)
+        return False
+
+
+def cache_delete_multi(keys: Iterable[str], chunk_size: int = 1000) -> int:
+    """
+    Birden fazla key'i sil (L1 + L2, negatif kayitlar dahil).
+    
+    OGRENME NOTU - Hedefli Invalidation:
+    Delta import sonrasi tum cache'i flush etmek yerine sadece degisen
+    kayitlarin key'leri silinir, cache'in geri kalani sicak kalir.
+    DEL birden fazla key alir, chunk'lar tek pipeline'da gonderilir.
+    
+    Returns:
+        Redis'te silinen key sayisi (Redis yoksa 0)
+    """
+    keys = list(dict.fromkeys(keys))
+    if _local_cache is not None:
+        for key in keys:
+            _local_cache.delete(key)
+    
+    client = get_redis_client()
+    if not client or not keys:
+        return 0
+    
+    try:
+        pipe = client.pipeline(transaction=False)
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            pipe.delete(*chunk, *[make_negative_key(k) for k in chunk])
+        with redis_timer("pipeline_delete"):
+            return sum(pipe.execute())
+    except Exception as e:
+        logger.warning("Toplu silme hatasi (%s key): %s", len(keys), e)
+        return 0
+
+
+# ============================================
+# ASYNC VERSIYONLAR (ASYNC_MODE=true)
+# ============================================
+# OGRENME NOTU:
+# Mantik sync fonksiyonlarla birebir ayni, sadece Redis komutlari await edilir.
+# L1 ve istatistikler ortak, /api/cache/stats iki modda da ayni sayilari gosterir.
+
+async def cache_get_async(key: str) -> Optional[Any]:
+    """cache_get'in async versiyonu"""
+    results, pending, _ = _prepare_lookup([key], include_negative=False)
+    if not pending:
+        return results[key]
+    
+    client = get_async_redis_client()
+    values = None
+    if client:
+        try:
+            with redis_timer("get"):
+                values = [await client.get(key)]
+        except Exception as e:
+            logger.warning("Okuma hatasi (key=%s): %s", key, e)
+    
+    return _complete_lookup(results, pending, values, include_negative=False).get(key)
+
+
+async def cache_get_multi_async(keys: list[str], include_negative: bool = False) -> dict[str, Any]:
+    """cache_get_multi'nin async versiyonu (MGET)"""
+    if not keys:
+        return {}
+    
+    results, pending, redis_keys = _prepare_lookup(keys, include_negative)
+    if not pending:
+        return results
+    
+    client = get_async_redis_client()
+    values = None
+    if client:
+        try:
+            with redis_timer("mget"):
+                values = await client.mget(redis_keys)
+        except Exception as e:
+            logger.warning("MGET hatasi: %s", e)
+    
+    return _complete_lookup(results, pending, values, include_negative)
+
+
+async def cache_lookup_async(key: str) -> tuple[bool, Any]:
+    """cache_lookup'in async versiyonu"""
+    results = await cache_get_multi_async([key], include_negative=True)
+    return key in results, results.get(key)
+
+
+async def cache_set_async(key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    """cache_set'in async versiyonu"""
+    _l1_set(key, value, ttl)
+    
+    client = get_async_redis_client()
+    if not client:
+        return False
+    
+    try:
+        ttl = ttl or settings.cache_ttl
+        serialized = _codec.encode(value)
+        with redis_timer("setex"):
+            await client.setex(key, ttl, serialized)
+        return True
+    except Exception as e:
+        logger.warning("Yazma hatasi (key=%s): %s", key, e)
+        return False
+
+
+async def cache_set_negative_async(key: str, ttl: Optional[int] = None) -> bool:
+    """cache_set_negative'in async versiyonu"""
+    ttl = ttl or settings.negative_cache_ttl
+    _l1_set(key, _NEGATIVE, ttl)
+    
+    client = get_async_redis_client()
+    if not client:
+        return False
+    
+    try:
+        with redis_timer("setex"):
+            await client.setex(make_negative_key(key), ttl, NEGATIVE_MARKER)
         return True
     except Exception as e:
-        print(f"[Cache] Silme hatasi (key={key}): {e}")
+        logger.warning("Yazma hatasi (key=%s): %s", key, e)
         return False
 
 
-def make_rating_key(title: str) -> str:
+async def cache_set_multi_async(
+    entries: dict[str, Any],
+    ttl: Optional[int] = None,
+    ttls: Optional[dict[str, int]] = None,
+    negative_keys: Iterable[str] = (),
+    l1: bool = True,
+) -> bool:
+    """cache_set_multi'nin async versiyonu (pipeline)"""
+    writes = _prepare_writes(entries, ttl, ttls, negative_keys, l1)
+    if not writes:
+        return True
+    
+    client = get_async_redis_client()
+    if not client:
+        return False
+    
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, key_ttl, serialized in writes:
+            pipe.setex(key, key_ttl, serialized)
+        with redis_timer("pipeline_setex"):
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning("Toplu yazma hatasi (%s key): %s", len(writes), e)
+        return False
+
+
+def make_rating_key(title: str, year: Optional[int] = None, kind: Optional[str] = None) -> str:
     """
     Rating sorgusu icin cache key olustur.
     
     OGRENME NOTU - Key Normalize:
     Ayni film farkli sekillerde yazilabilir:
     - "Inception", "INCEPTION", "inception" -> hepsi ayni key olmali
-    - normalize_turkish zaten bunu yapiyor, biz de ayni fonksiyonu kullaniyoruz
+    - "Don’t Look Up" (akilli tirnak), cift bosluk, aksanli harfler de ayni key'e duser
+    - normalize_turkish (kanonik key) indeks ve DB search_title kolonuyla ayni fonksiyon;
+      farkli olsaydi ayni film birden fazla key'e bolunurdu (dusuk hit orani)
+    
+    OGRENME NOTU - Yil ve tur key'in parcasi:
+    Sonuc yila/ture gore degisir ("Dune" 1984 vs 2021). Key'de olmasalardi
+    yilli bir istek baska yilin cache kaydindan cevaplanirdi. Ikisi de yoksa
+    key eski formatta kalir (mevcut cache kayitlari gecerli).
+    
+    Ornek:
+        make_rating_key("Dune")                 -> "rating:dune"
+        make_rating_key("Dune", 2021, "movie")  -> "rating:dune|2021|movie"
+        (versiyon biliniyorsa)                  -> "rating@a7fa2d33bbce3c66:dune"
+    """
+    key = f"{_namespace('rating')}:{normalize_turkish(title)}"
+    if year is None and kind is None:
+        return key
+    return f"{key}|{year or ''}|{kind or ''}"
+
+
+def _namespace(prefix: str) -> str:
+    """Key on eki + (biliniyorsa) veri seti versiyonu. Ornek: rating -> rating@<versiyon>"""
+    version = dataset_version()
+    return f"{prefix}@{version}" if version else prefix
+
+
+def make_negative_key(key: str) -> str:
+    """
+    "Bulunamadi" kaydi icin key.
+    Ornek: "rating:xyz" -> "notfound:rating:xyz"
     """
-    from app.utils.turkish import normalize_turkish
-    normalized = normalize_turkish(title)
-    return f"rating:{normalized}"
+    return f"{NEGATIVE_PREFIX}{key}"
 
 
 def make_movie_key(imdb_id: str) -> str:
-    """IMDB ID ile film icin cache key"""
-    return f"movie:{imdb_id}"
+    """IMDB ID ile film icin cache key ("movie:tt1375666", versiyonla "movie@<versiyon>:tt1375666")"""
+    return f"{_namespace('movie')}:{imdb_id}"
 
 
 def make_search_key(query: str) -> str:
-    """Arama sorgusu icin cache key"""
-    from app.utils.turkish import normalize_turkish
-    normalized = normalize_turkish(query)
-    return f"search:{normalized}"
+    """
+    Arama sorgusu icin cache key
+    
+    OGRENME NOTU:
+    Limit key'e eklenmez, degerin icinde tutulur: {"limit": 50, "ids": [...]}
+    Boylece limit=50 icin cache'lenen sonuc limit=10 istegine de cevap verir.
+    """
+    return f"search:{normalize_turkish(query)}"
+
+
+def make_search_entry(ids: list[str], limit: int) -> dict:
+    """
+    Arama sonucunu cache'e yazilacak kompakt hale getir.
+    Tum film verisi yerine sadece imdb_id listesi saklanir.
+    """
+    return {"limit": limit, "ids": ids}
+
+
+def search_entry_ids(entry: Optional[dict], limit: int) -> Optional[list[str]]:
+    """
+    Cache'teki arama sonucu bu limit icin yeterli mi?
+    
+    Yeterli durumlar:
+    - Cache'lenen limit >= istenen limit -> ilk `limit` tanesi
+    - Cache'lenen sonuc limitten az -> zaten tum eslesmeler var
+    
+    Returns:
+        imdb_id listesi, yetersizse None (MISS)
+    """
+    if not entry:
+        return None
+    ids = entry["ids"]
+    if entry["limit"] >= limit or len(ids) < entry["limit"]:
+        return ids[:limit]
+    return None
@@ -0,0 +1,358 @@
+"""
+Fuzzy Baslik Eslestirme (Trigram Aday Uretimi + Sinirli Edit Distance)
+
+OGRENME NOTU - Problem:
+Netflix kartindaki baslik ile IMDB basligi birebir ayni olmayabilir:
+    "Tom & Jerry"               <-> "Tom and Jerry"
+    "Stranger Things: Sezon 4"  <-> "Stranger Things"
+    "Spider-Man: No Way Home"   <-> "Spider Man No Way Home"
+    "Intersteller" (yazim hatasi)
+Exact eslesme bulunamazsa kullanici 404 gorur.
+
+Iki katman:
+1. Kanonik key: noktalama silinir, "&" -> "and", dizilerde sondaki sezon etiketi atilir.
+   Bu key'ler dict'te -> O(1). Cogu Netflix farki burada cozulur.
+   "Part 1", "Vol. 2", "Kisim 3" ATILMAZ: bunlar ayri filmlerdir
+   ("Kill Bill: Vol. 1" != "Kill Bill: Vol. 2"); atilsaydi devam filmleri tek
+   key'de birlesir ve en cok oy alani confidence 1.0 ile donerdi.
+2. Edit distance (yazim hatalari): trigram inverted index + dogrulama
+   - Her key "  inception " gibi bosluk eklenerek trigramlara bolunur
+   - q-gram lemma: Her edit en fazla 3 trigrami (bitisik yer degisimi 4) bozar.
+     d hatali bir eslesme, sorgunun herhangi (4*d + 1) trigramindan EN AZ BIRINI
+     icermek zorunda.
+   - Bu yuzden sadece EN NADIR 4*d + 1 trigramin posting list'i taranir
+     (prefix filtering), ortak trigram sayisina gore siralanan adaylardan
+     en fazla FUZZY_MAX_CANDIDATES tanesi edit distance ile dogrulanir.
+   - Cok yaygin kelimelerden olusan basliklarda en nadir listeler bile uzun
+     olabilir: taranan kayit sayisi FUZZY_SCAN_BUDGET ile sinirli (recall'dan
+     feragat, latency'den degil).
+   Maliyet = min(nadir listeler, butce) + sabit sayida dogrulama -> sinirli latency.
+
+OGRENME NOTU - Neden SymSpell / BK-tree degil?
+- BK-tree: d=2 aramasi agacin buyuk kismini gezer, 100K baslikta onlarca ms.
+- SymSpell (silme varyantlari): ortak baslangicli basliklarda ("The ...", ayni
+  seri) varyant listeleri binlerce aday dondurur; ayrica varyant sayisi
+  baslik basina ~30 -> milyonlarca dict key. Trigram listeleri array('I') ile
+  ~4 byte/kayit (bkz. search_index).
+
+MULAKATTA SORULUR:
+- "Levenshtein distance nedir?" -> Ekleme/silme/degistirme ile minimum donusum sayisi
+- "Yazim hatasi aramasi nasil olceklenir?" -> q-gram filtre + dogrulama (pg_trgm, Lucene FuzzyQuery)
+- "Confidence neden gerekli?" -> Kisa basliklarda 1 harf fark baska bir film demek
+  ("Up" <-> "It"), esik altindaki eslesmeler 404 kalmali
+"""
+
+import re
+from array import array
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from app.config import settings
+from app.models.movie import KIND_BY_TITLE_TYPE
+from app.utils.turkish import normalize_turkish
+
+# "Sezon 2", "Season 2", "2. Sezon", "Limited Series", "Mini Dizi" gibi sondaki sezon etiketleri
+# (sadece dizilerde; part/vol/kisim numaralari devam filmlerini ayirir, atilmaz)
+_SEASON_SUFFIX = re.compile(
+    r"\s*(?:[:\-]\s*)?(?:(?:season|sezon)\s*\d+|\d+\s*\.?\s*sezon|limited series|mini dizi)$"
+)
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+Q = 3  # Trigram
+
+
+def canonical_title(title: str, strip_season: bool = True) -> str:
+    """
+    Fuzzy karsilastirma icin kanonik key.
+
+    Args:
+        strip_season: Sondaki sezon etiketini at (dizi basliklari / dizi olabilecek sorgular)
+
+    Ornek:
+        "Stranger Things: Sezon 4" -> "stranger things"
+        "Tom & Jerry"              -> "tom and jerry"
+        "Kill Bill: Vol. 2"        -> "kill bill vol 2"
+    """
+    text = normalize_turkish(title or "").replace("&", " and ")
+    text = _NON_ALNUM.sub(" ", text).strip()
+    if not strip_season:
+        return text
+    stripped = _SEASON_SUFFIX.sub("", text).strip()
+    # Sadece etiketten ibaret basliklar ("Part 2") bos kalmasin
+    return stripped or text
+
+
+def _trigrams(key: str) -> set[str]:
+    """Bas/son bosluk eklenmis trigramlar: ilk ve son harfteki hatalar da yakalanir"""
+    padded = " " * (Q - 1) + key + " "
+    return {padded[i:i + Q] for i in range(len(padded) - Q + 1)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein + bitisik harf yer degisimi).
+
+    OGRENME NOTU - Banded DP:
+    Sonuc max_distance'tan buyukse kac oldugu onemsiz. Bu yuzden matriste sadece
+    kosegene max_distance uzakliktaki hucreler hesaplanir: O(n*m) yerine O(n*d).
+    max_distance asilirsa max_distance + 1 doner.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    over = max_distance + 1
+    m = len(b)
+    prev_prev = None
+    prev = [j if j <= max_distance else over for j in range(m + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (m + 1)
+        if i <= max_distance:
+            current[0] = i
+        lo = max(1, i - max_distance)
+        hi = min(m, i + max_distance)
+        row_min = current[0]
+        ai = a[i - 1]
+        for j in range(lo, hi + 1):
+            bj = b[j - 1]
+            value = prev[j - 1] + (ai != bj)
+            if prev[j] + 1 < value:
+                value = prev[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (prev_prev is not None and j > 1
+                    and ai == b[j - 2] and a[i - 2] == bj and prev_prev[j - 2] + 1 < value):
+                value = prev_prev[j - 2] + 1
+            current[j] = value if value < over else over
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return over
+        prev_prev, prev = prev, current
+    return prev[m]
+
+
+class FuzzyMatch(NamedTuple):
+    movie: dict  # MovieRating payload
+    matched_key: str  # Eslesen kanonik baslik
+    distance: int
+    confidence: float  # 1.0 = kanonik key birebir ayni
+
+
+class FuzzyIndex:
+    """
+    Kanonik baslik -> film eslemesi ve trigram inverted index.
+
+    Args:
+        movies: imdb_id -> payload (TitleIndex.movies ile paylasilir)
+        max_distance: Izin verilen en fazla edit distance
+        max_candidates: Sorgu basina edit distance ile dogrulanan en fazla aday
+            (latency ust siniri; asilirsa en cok trigram paylasan adaylar secilir)
+        scan_budget: Sorgu basina taranan en fazla posting kaydi
+    """
+
+    def __init__(self, movies: dict[str, dict], max_distance: int = 2,
+                 max_candidates: int = 50, scan_budget: int = 20000):
+        self.movies = movies
+        self.max_distance = max_distance
+        self.max_candidates = max_candidates
+        self.scan_budget = scan_budget
+        self.terms: list[str] = []  # term id -> kanonik baslik
+        self.term_movies: list[list[str]] = []  # term id -> imdb_id'ler (oy sayisina gore)
+        self.term_ids: dict[str, int] = {}
+        self.postings: dict[int, dict[str, array]] = {}  # key uzunlugu -> trigram -> term id'ler
+
+    def add(self, title: str, imdb_id: str):
+        """
+        Baslik ekle. Filmler oy sayisina gore azalan sirada eklenmeli.
+
+        Sezon etiketi sadece dizilerde atilir: "Season 2" adli bir film kendi key'inde kalir.
+        """
+        movie = self.movies.get(imdb_id)
+        is_series = movie is not None and KIND_BY_TITLE_TYPE.get(movie.get("title_type")) == "series"
+        key = canonical_title(title, strip_season=is_series)
+        if not key:
+            return
+        term = self.term_ids.get(key)
+        if term is not None:
+            if imdb_id not in self.term_movies[term]:
+                self.term_movies[term].append(imdb_id)
+            return
+
+        term = self.term_ids[key] = len(self.terms)
+        self.terms.append(key)
+        self.term_movies.append([imdb_id])
+        # Listeler uzunluga gore ayri: sorguda sadece +-d uzunluktaki basliklar taranir
+        table = self.postings.setdefault(len(key), {})
+        for gram in _trigrams(key):
+            posting = table.get(gram)
+            if posting is None:
+                posting = table[gram] = array("I")
+            posting.append(term)
+
+    def _pick(self, term: int, year: Optional[int], kind: Optional[str] = None) -> Optional[dict]:
+        """Key'e bagli filmlerden en cok oy alani (yil/tur verildiyse uyanlardan) sec"""
+        for imdb_id in self.term_movies[term]:
+            movie = self.movies.get(imdb_id)
+            if movie is None or (year and movie["year"] != year):
+                continue
+            if kind and KIND_BY_TITLE_TYPE.get(movie.get("title_type")) != kind:
+                continue
+            return movie
+        return None
+
+    def allowed_distance(self, key: str) -> int:
+        """Kisa basliklarda daha az hata kabul edilir ("up" -> "it" eslesmesin)"""
+        if len(key) <= 4:
+            return 0
+        if len(key) <= 8:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def _candidates(self, key: str, max_distance: int) -> tuple[int, list[tuple[int, int]]]:
+        """
+        Prefix filtering ile adaylar.
+
+        OGRENME NOTU:
+        Sorgunun bir trigrami hic yoksa (posting bos) o trigram zaten "bozulmus"
+        demektir ve en nadir trigram olarak sayilir -> daha az liste taranir.
+
+        Returns:
+            (taranan trigram sayisi, [(term id, ortak trigram sayisi), ...])
+            Adaylar ortak trigram sayisina gore azalan sirada, en fazla max_candidates.
+        """
+        grams = _trigrams(key)
+        # Yer degisimi (OSA'da tek edit) Q + 1 trigrami bozabilir
+        needed = (Q + 1) * max_distance + 1
+        if len(grams) < needed:
+            return needed, []
+        tables = [
+            self.postings[n] for n in range(len(key) - max_distance, len(key) + max_distance + 1)
+            if n in self.postings
+        ]
+        per_gram = []
+        for gram in grams:
+            lists = [p for p in (table.get(gram) for table in tables) if p]
+            per_gram.append((sum(len(p) for p in lists), lists))
+        per_gram.sort(key=lambda item: item[0])
+
+        counts = Counter()
+        budget = self.scan_budget
+        for size, lists in per_gram[:needed]:
+            if size > budget:
+                # Butce asildi: kalan (daha uzun) listeler taranmaz, eslesme kacabilir
+                break
+            for posting in lists:
+                counts.update(posting)
+            budget -= size
+        return needed, counts.most_common(self.max_candidates)
+
+    def lookup(self, title: str, year: Optional[int] = None, kind: Optional[str] = None) -> Optional[FuzzyMatch]:
+        """
+        En iyi fuzzy eslesmeyi bul.
+
+        Siralama: edit distance (kucuk) -> oy sayisi (buyuk).
+
+        Returns:
+            FuzzyMatch veya None (esik kontrolu cagiranin isi: match.confidence)
+        """
+        # Film sorgusunda sezon etiketi atilmaz; tur bilinmiyorsa once tam key denenir
+        key = canonical_title(title, strip_season=kind != "movie")
+        if not key:
+            return None
+
+        for exact in dict.fromkeys((canonical_title(title, strip_season=False), key)):
+            term = self.term_ids.get(exact)
+            if term is not None:
+                movie = self._pick(term, year, kind)
+                if movie:
+                    return FuzzyMatch(movie, exact, 0, 1.0)
+
+        limit = self.allowed_distance(key)
+        if limit == 0:
+            return None
+
+        best = None
+        scanned, candidates = self._candidates(key, limit)
+        for cand, shared in candidates:
+            # limit hatali bir eslesme taranan trigramlardan en fazla (Q + 1) * limit
+            # tanesini kaybeder. Adaylar ortak trigrama gore sirali: gerisi de elenir.
+            if shared < scanned - (Q + 1) * limit:
+                break
+            distance = edit_distance(key, self.terms[cand], limit)
+            if distance > limit:
+                continue
+            movie = self._pick(cand, year, kind)
+            if movie is None:
+                continue
+            rank = (distance, -(movie["votes"] or 0))
+            if best is None or rank < best[0]:
+                best = (rank, cand, movie, distance)
+                # Daha iyi bir eslesme bulundu: kalan adaylar icin sinir daralir
+                limit = distance
+
+        if best is None:
+            return None
+        _, cand, movie, distance = best
+        matched = self.terms[cand]
+        confidence = 1 - distance / max(len(key), len(matched))
+        return FuzzyMatch(movie, matched, distance, round(confidence, 3))
+
+    def stats(self) -> dict:
+        return {
+            "terms": len(self.terms),
+            "posting_lists": sum(len(table) for table in self.postings.values()),
+            "max_distance": self.max_distance,
+            "max_candidates": self.max_candidates,
+            "scan_budget": self.scan_budget,
+        }
+
+
+def build_fuzzy_index(movies: dict[str, dict], aliases: list[tuple[str, str]]) -> FuzzyIndex:
+    """
+    Film payload'lari ve Turkce basliklardan fuzzy indeksi olustur.
+
+    Args:
+        movies: imdb_id -> payload (oy sayisina gore sirali, TitleIndex.movies)
+        aliases: (search_title, imdb_id) ciftleri
+    """
+    index = FuzzyIndex(
+        movies, settings.fuzzy_max_distance, settings.fuzzy_max_candidates, settings.fuzzy_scan_budget
+    )
+    for imdb_id, payload in movies.items():
+        index.add(payload["title"], imdb_id)
+    for search_title, imdb_id in aliases:
+        if imdb_id in movies:
+            index.add(search_title, imdb_id)
+    return index
+
+# Global indeks - title_index.load_title_index() ile birlikte yuklenir
+_fuzzy_index: Optional[FuzzyIndex] = None
+
+
+def set_fuzzy_index(index: Optional[FuzzyIndex]):
+    """Yeni indeksi aktif et (atomic swap)"""
+    global _fuzzy_index
+    _fuzzy_index = index
+
+
+def get_fuzzy_index() -> Optional[FuzzyIndex]:
+    """Fuzzy indeks singleton. None ise fuzzy asama atlanir."""
+    return _fuzzy_index
+
+
+def fuzzy_resolve(title: str, year: Optional[int] = None, kind: Optional[str] = None) -> Optional[FuzzyMatch]:
+    """
+    Exact eslesme bulunamadiginda route'larin cagirdigi fuzzy asama.
+
+    Returns:
+        Guven esigini (FUZZY_MIN_CONFIDENCE) gecen eslesme, yoksa None
+    """
+    index = _fuzzy_index
+    if index is None:
+        return None
+    match = index.lookup(title, year, kind)
+    if match is None or match.confidence < settings.fuzzy_min_confidence:
+        return None
+    return match
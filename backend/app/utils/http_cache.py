@@ -0,0 +1,142 @@
+"""
+HTTP Cache - ETag, Cache-Control ve 304 Not Modified
+
+OGRENME NOTU - Neden HTTP seviyesinde cache?
+/api/rating ve /api/movie/{imdb_id} ayni veri icin bir sonraki IMDB import'una
+kadar ayni cevabi doner. Redis HIT bile olsa her istek Python'a ulasir,
+Redis'e gider ve tum govdeyi gonderir. Cache-Control ile:
+- Tarayici / extension service worker'i (fetch HTTP cache'i) max-age boyunca hic istek atmaz
+- Vercel edge CDN'i s-maxage boyunca cevabi kendisi verir, Python'a hic ulasmaz
+- Sure dolunca stale-while-revalidate: bayat cevap hemen doner, arka planda yenilenir
+- Yenileme istegi If-None-Match ile gelir; veri degismediyse 304 (govdesiz) doner
+
+OGRENME NOTU - ETag nereden gelir?
+1. Veri seti versiyonu (tercih edilen): DATASET_VERSION env degiskeni veya
+   baslik indeksinin yuklenirken hesapladigi ozet (TitleIndex.version).
+   ETag = W/"v1-<versiyon>". If-None-Match eslesirse 304 cache'e/DB'ye
+   HIC gitmeden doner: import olmadikca hicbir cevap degismez.
+2. Versiyon yoksa (indeks kapali/yuklenmemis): govdenin hash'i (row hash).
+   ETag = W/"h1-<hash>". 304 icin yine de cevap cozumlenir ama govde gonderilmez.
+
+OGRENME NOTU - Cache HIT'lerinde neden versiyon ETag'i YOK?
+Redis kaydi CACHE_TTL kadar eski olabilir, diger worker'larin L1'i de kendi
+kopyasini tutar. Reload/import sonrasi eski govde (rating 7.8) YENI versiyon
+ETag'iyle donerse istemci sonraki If-None-Match'te 304 alir ve bayat govdeyi
+suresiz saklar. Bu yuzden versiyon ETag'i sadece bu istekte aktif veri setinden
+cozumlenen (MISS) cevaplara verilir; cache'ten gelen govde kendi hash'ini tasir:
+icerik degisince ETag de degisir.
+ETag'ler zayif (W/): ayni veri farkli instance'larda byte byte ayni serilestirilmeyebilir
+(gzip, key sirasi), anlamsal esitlik yeterli.
+
+MULAKATTA SORULUR:
+- "ETag vs Last-Modified?" -> ETag icerik/versiyon kimligi, Last-Modified saniye hassasiyetli zaman
+- "max-age vs s-maxage?" -> max-age tarayici, s-maxage paylasilan cache (CDN)
+- "stale-while-revalidate ne saglar?" -> Kullanici yenilemeyi beklemez, latency'ye yansimaz
+- "Strong vs weak ETag?" -> Strong byte esitligi, weak anlamsal esitlik (W/ on eki)
+"""
+
+import hashlib
+from typing import Optional
+
+import orjson
+from fastapi import Response
+
+from app.config import settings
+
+# Cevap formati degisirse (yeni alan vb.) artirilir: eski ETag'ler eslesmez
+ETAG_SCHEMA = "1"
+
+
+def dataset_version() -> Optional[str]:
+    """
+    Aktif veri seti versiyonu.
+
+    Oncelik: DATASET_VERSION env -> baslik indeksinin ozeti -> None (govde hash'i kullanilir)
+    """
+    if settings.dataset_version:
+        return settings.dataset_version
+    from app.utils.title_index import get_title_index
+    index = get_title_index()
+    return index.version if index is not None else None
+
+
+def version_etag() -> Optional[str]:
+    """Versiyon biliniyorsa cevabi uretmeden ETag (yoksa None)"""
+    version = dataset_version()
+    return f'W/"v{ETAG_SCHEMA}-{version}"' if version else None
+
+
+def body_etag(body: bytes) -> str:
+    """Govdenin hash'i ile ETag (versiyon bilinmediginde)"""
+    return f'W/"h{ETAG_SCHEMA}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    If-None-Match header'i ETag ile eslesiyor mu? (zayif karsilastirma)
+
+    Ornek:
+        etag_matches('W/"v1-abc", "v1-old"', 'W/"v1-abc"') -> True
+        etag_matches('*', 'W/"v1-abc"') -> True
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def cache_control() -> str:
+    """Basarili cevaplar icin Cache-Control header degeri"""
+    return (
+        f"public, max-age={settings.http_cache_max_age}, "
+        f"s-maxage={settings.http_cache_s_maxage}, "
+        f"stale-while-revalidate={settings.http_cache_swr}"
+    )
+
+
+def not_modified(etag: str, x_cache: Optional[str] = None) -> Response:
+    """304 Not Modified (govdesiz, ETag ve Cache-Control tekrar gonderilir)"""
+    headers = {"ETag": etag, "Cache-Control": cache_control()}
+    if x_cache:
+        headers["X-Cache"] = x_cache
+    return Response(status_code=304, headers=headers)
+
+
+def check_not_modified(if_none_match: Optional[str]) -> Optional[Response]:
+    """
+    Hizli yol: veri seti versiyonu biliniyor ve istemcideki ETag guncelse
+    cache'e/DB'ye gitmeden 304 dondur. Aksi halde None (normal akis devam eder).
+    """
+    # "*" cevabin var olup olmadigini bilmeyi gerektirir, normal akisa birakilir
+    if not settings.http_cache_enabled or not if_none_match or if_none_match.strip() == "*":
+        return None
+    etag = version_etag()
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, "NOT_MODIFIED")
+    return None
+
+
+def cached_json_response(payload: dict, x_cache: str, if_none_match: Optional[str] = None,
+                         versioned: bool = False) -> Response:
+    """
+    JSON cevap + ETag/Cache-Control; ETag istemcidekiyle ayniysa 304.
+
+    Args:
+        versioned: payload bu istekte aktif veri setinden cozumlendiyse True
+            (versiyon ETag'i). Cache'ten gelen payload'lar False: hangi versiyonda
+            uretildigi bilinmez, govde hash'i kullanilir.
+
+    OGRENME NOTU:
+    Govde bir kez orjson ile serilestirilir: hem cevap hem (gerekirse) hash icin.
+    """
+    body = orjson.dumps(payload)
+    headers = {"X-Cache": x_cache}
+    if settings.http_cache_enabled:
+        etag = (version_etag() if versioned else None) or body_etag(body)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, x_cache)
+        headers["ETag"] = etag
+        headers["Cache-Control"] = cache_control()
+    return Response(content=body, media_type="application/json", headers=headers)
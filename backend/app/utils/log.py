@@ -0,0 +1,106 @@
+"""
+Logging - Non-Blocking (Kuyruk Tabanli) Log Hatti
+
+OGRENME NOTU - print() neden hot path'te pahali?
+print() stdout'a SENKRON yazar: her HIT/MISS satiri icin istek thread'i
+I/O bitene kadar bekler (stdout bir pipe/docker log driver ise yavas olabilir).
+Batch endpoint'inde 200 baslik = 200 satir = 200 write() cagrisi.
+
+Cozum (QueueHandler + QueueListener):
+    route -> logger.debug(...) -> QueueHandler -> [queue] -> QueueListener thread -> stdout
+Istek thread'i sadece kuyruga bir kayit koyar (mikro saniye), asil I/O
+ayri bir thread'de yapilir.
+
+OGRENME NOTU - Seviye ve ornekleme (sampling):
+- Key bazli olaylar (HIT/MISS) DEBUG seviyesinde. LOG_LEVEL=INFO iken
+  logger.isEnabledFor() tek bir karsilastirma -> nanosaniye maliyet.
+- DEBUG acikken bile her key loglanmaz: LOG_SAMPLE_RATE=0.01 -> %1'i.
+  Toplam sayilar zaten /metrics ve /api/cache/stats'ta.
+
+MULAKATTA SORULUR:
+- "Logging performansi nasil iyilestirilir?" -> Asenkron handler (kuyruk),
+  lazy formatlama (logger.debug("%s", x) - f-string degil), sampling
+- "Structured logging nedir?" -> Satirlarin JSON gibi makinece okunur olmasi
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.config import settings
+
+# LogRecord'un standart alanlari - geri kalanlar extra={...} ile gelen alanlar
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Her kaydi tek satir JSON olarak yaz (extra alanlar dahil)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        data.update({k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS})
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def setup_logging() -> None:
+    """
+    "app" logger'ini kuyruk tabanli handler ile kur (idempotent).
+
+    Sadece app.* logger'lari etkilenir; uvicorn kendi loglarini yonetmeye devam eder.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    if settings.log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    # respect_handler_level: handler seviyesi listener tarafinda da uygulanir
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    # Cikista kuyrukta kalan kayitlar yazilsin
+    atexit.register(stop_logging)
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.log_level.upper())
+    app_logger.handlers[:] = [QueueHandler(log_queue)]
+    app_logger.propagate = False
+
+
+def stop_logging() -> None:
+    """Listener thread'ini durdur (kuyruktaki kayitlar once yazilir)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_key_event(logger: logging.Logger, msg: str, *args) -> None:
+    """
+    Key bazli (HIT/MISS gibi) DEBUG olayi, LOG_SAMPLE_RATE oraninda ornekleyerek logla.
+
+    Args:
+        msg: %-formatli mesaj (lazy formatlama: kayit atilirsa formatlanir)
+    """
+    if logger.isEnabledFor(logging.DEBUG) and (
+        settings.log_sample_rate >= 1 or random.random() < settings.log_sample_rate
+    ):
+        logger.debug(msg, *args)
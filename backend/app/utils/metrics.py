@@ -0,0 +1,298 @@
+"""
+Metrics - Prometheus Formatinda Uygulama Metrikleri
+
+OGRENME NOTU - Neden ortalama yetmez?
+/cache/stats'taki sayaclar "kac HIT, kac MISS" der ama "istek ne kadar surdu"
+sorusuna cevap vermez. Ortalama 20ms olan bir endpoint'in isteklerinin %1'i
+2 saniye surebilir. Kapasite planlamasi ve tuning icin p50/p95/p99 gerekir.
+
+Histogram: Gozlemler sabit kovalara (bucket) sayilir:
+    http_request_duration_seconds_bucket{le="0.05"} 940   -> 940 istek <= 50ms
+    http_request_duration_seconds_bucket{le="0.1"}  990
+    http_request_duration_seconds_bucket{le="+Inf"} 1000
+Yuzdelikler Prometheus tarafinda hesaplanir:
+    histogram_quantile(0.99, sum by (le, route) (rate(http_request_duration_seconds_bucket[5m])))
+
+OGRENME NOTU - Sayaclar process basina (paylasilan store YOK):
+Her process kendi sayaclarini hafizada tutar; /metrics sadece istegin ulastigi
+process'in sayaclarini doner. Bu yuzden /metrics INSTANCE BASINA cekilmeli:
+- Her container/instance tek uvicorn worker'i ile calisir ve Prometheus her
+  instance'i ayri hedef olarak (service discovery) ceker -> `instance` etiketi
+- Load balancer uzerinden cekmek YANLIS: her scrape rastgele bir worker'a duser,
+  seriler worker'lar arasinda ziplar, rate() anlamsizlasir
+- uvicorn --workers N ile tek port arkasinda N process varsa ayni sorun: tek worker kullan
+  (veya prometheus_client multiprocess modu gibi paylasilan bir store'a gec)
+- Serverless'ta (Vercel) instance'lar kisa omurlu ve dogrudan cekilemez: /metrics
+  orada sadece hata ayiklama icin, izleme icin uygun degil
+pid etiketi hangi process'in cevap verdigini gosterir (yeniden baslatma = sayac sifirlanir).
+Yuzdelik ortalamalari toplanamaz ama bucket'lar instance'lar arasi toplanabilir:
+    sum by (le) (rate(http_request_duration_seconds_bucket[5m]))  # instance basina cekilen seriler
+
+MULAKATTA SORULUR:
+- "Histogram vs Summary?" -> Histogram bucket'lari instance'lar arasi toplanabilir,
+  summary'nin hazir yuzdelikleri toplanamaz
+- "Neden route sablonu (/api/movie/{imdb_id}) etiketleniyor?" -> Her imdb_id ayri
+  seri olursa kardinalite patlar (Prometheus bellegi)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from app.config import settings
+
+# Varsayilan kovalar (saniye): cache HIT'ler ms alti, DB'ye gidenler 10-500ms
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+REDIS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50)
+
+class _Metric:
+    """Etiketli metrik tabani. Tum guncellemeler kilit altinda (thread-safe)."""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: dict[tuple, object] = {}
+        _registry.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: tuple, extra: str = "") -> str:
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key)]
+        # getpid her seferinde: fork ile olusan worker'lar import'u paylassa da dogru pid
+        # (hangi process'in cevap verdigini gosterir; toplama icin degil, bkz. modul notu)
+        pairs.append(f'pid="{os.getpid()}"')
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}"
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            series = list(self._series.items())
+        for key, value in series:
+            lines.extend(self._render_series(key, value))
+        return lines
+
+    def _render_series(self, key: tuple, value) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Sadece artan sayac"""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._series.get(self._key(labels), 0)
+
+    def _render_series(self, key, value):
+        return [f"{self.name}_total{self._labels(key)} {value}"]
+
+
+class Histogram(_Metric):
+    """Kovali dagilim (kumulatif bucket'lar + _sum + _count)"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # [kova sayaclari..., +Inf, sum]
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def _render_series(self, key, value):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), value[:-1]):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else _format_bound(bound)
+            le_label = f'le="{le}"'
+            lines.append(f"{self.name}_bucket{self._labels(key, le_label)} {cumulative}")
+        lines.append(f"{self.name}_sum{self._labels(key)} {value[-1]}")
+        lines.append(f"{self.name}_count{self._labels(key)} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return str(int(bound)) if float(bound).is_integer() else repr(bound)
+
+
+_registry: list[_Metric] = []
+
+
+def render_metrics() -> str:
+    """Tum metrikleri Prometheus text formatinda dondur (GET /metrics)"""
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ============================================
+# UYGULAMA METRIKLERI
+# ============================================
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP istek suresi", ("method", "route", "status")
+)
+db_queries_per_request = Histogram(
+    "db_queries_per_request", "Istek basina DB sorgu sayisi", ("route",), COUNT_BUCKETS
+)
+db_time_per_request = Histogram(
+    "db_time_per_request_seconds", "Istek basina toplam DB suresi", ("route",)
+)
+db_queries = Counter("db_queries", "Calistirilan DB sorgusu")
+redis_command_duration = Histogram(
+    "redis_command_duration_seconds", "Redis komut suresi (pipeline tek komut sayilir)",
+    ("command",), REDIS_BUCKETS
+)
+redis_errors = Counter("redis_errors", "Basarisiz Redis komutu", ("command",))
+db_pool_checkout = Histogram(
+    "db_pool_checkout_seconds", "Havuzdan baglanti alma suresi (bekleme + pre-ping dahil)",
+    ("mode",), REDIS_BUCKETS
+)
+db_pre_pings = Counter("db_pre_pings", "Bosta kalmis baglantilara yapilan pre-ping", ("result",))
+cache_requests = Counter(
+    "cache_requests", "Key prefix'ine gore cache sonuclari (hit/negative_hit/miss)",
+    ("prefix", "layer", "result")
+)
+
+
+def key_prefix(key: str) -> str:
+    """
+    'rating:inception' -> 'rating' (etiket kardinalitesi prefix sayisiyla sinirli).
+    Veri seti versiyonu atilir: 'rating@<versiyon>:inception' -> 'rating'
+    (aksi halde her reload yeni bir seri acardi).
+    """
+    return key.split(":", 1)[0].split("@", 1)[0]
+
+
+def record_cache(key: str, layer: str, result: str):
+    """Cache sonucu: layer l1/l2, result hit/negative_hit/miss"""
+    if settings.metrics_enabled:
+        cache_requests.inc(prefix=key_prefix(key), layer=layer, result=result)
+
+
+@contextmanager
+def redis_timer(command: str):
+    """
+    Redis cagrisini olc. Async'te de kullanilir:
+        with redis_timer("mget"):
+            values = await client.mget(keys)
+    """
+    if not settings.metrics_enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        redis_errors.inc(command=command)
+        raise
+    finally:
+        redis_command_duration.observe(time.perf_counter() - start, command=command)
+
+
+# ============================================
+# ISTEK BASINA DB SAYACI
+# ============================================
+# OGRENME NOTU - ContextVar:
+# Middleware istek basinda bos bir sayac koyar, SQLAlchemy event'leri ayni
+# sayaci arttirir. Sync route'lar threadpool'da calissa da FastAPI context'i
+# thread'e kopyalar; sayac ayni (mutable) obje oldugu icin guncellemeler gorunur.
+
+_request_db: ContextVar[Optional[list]] = ContextVar("request_db", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    db_queries.inc()
+    counter = _request_db.get()
+    if counter is not None:
+        counter[0] += 1
+        counter[1] += elapsed
+
+
+def instrument_engine(engine):
+    """Sync engine'e (async engine icin engine.sync_engine) sorgu sayaci bagla"""
+    from sqlalchemy import event
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """
+    Saf ASGI middleware: route bazinda sure + istek basina DB sorgu sayisi/suresi.
+
+    OGRENME NOTU:
+    BaseHTTPMiddleware her istek icin ek task ve kuyruk olusturur; saf ASGI
+    middleware sadece send'i sarar, overhead'i mikro saniye seviyesinde.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.metrics_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        counter = [0, 0.0]
+        token = _request_db.set(counter)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_db.reset(token)
+            # Route sablonu; eslesmeyen istekler (404) tek etikette toplanir
+            route = getattr(scope.get("route"), "path", "unmatched")
+            http_request_duration.observe(
+                elapsed, method=scope["method"], route=route, status=status["code"]
+            )
+            db_queries_per_request.observe(counter[0], route=route)
+            db_time_per_request.observe(counter[1], route=route)
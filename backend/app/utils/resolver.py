@@ -0,0 +1,217 @@
+"""
+Baslik Cozumleme - Veritabani Sorgulari
+
+OGRENME NOTU:
+Bu fonksiyonlar route'lardan ayrildi cunku hem sync route'lar (movies.py)
+hem async route'lar (movies_async.py) ayni sorgulari kullaniyor.
+Async tarafta AsyncSession.run_sync() ile cagrilirlar:
+
+    movie = await db.run_sync(find_movie, normalized_title, year)
+
+run_sync, sync ORM kodunu async baglanti uzerinde (greenlet ile) calistirir.
+Boylece ayni sorgu mantigini iki kere yazmak zorunda kalmayiz.
+
+Tum fonksiyonlar ilk parametre olarak sync Session alir.
+"""
+
+from collections import defaultdict
+from typing import NamedTuple, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie, TITLE_KINDS, KIND_BY_TITLE_TYPE
+from app.models.movie_title import MovieTitle
+from app.schemas import BatchRatingItem
+from app.utils.cache import make_rating_key
+from app.utils.turkish import normalize_turkish
+
+
+class TitleQuery(NamedTuple):
+    """
+    Batch cozumlemede tek sorgu: normalize baslik + opsiyonel yil ve tur.
+    Tuple oldugu icin dict key'i olarak kullanilir.
+    """
+    title: str
+    year: Optional[int] = None
+    kind: Optional[str] = None  # "movie" | "series" (bkz. TITLE_KINDS)
+
+    def accepts(self, year: Optional[int], title_type: Optional[str]) -> bool:
+        """Film bu sorgunun yil/tur filtresine uyuyor mu?"""
+        if self.year and year != self.year:
+            return False
+        return not self.kind or KIND_BY_TITLE_TYPE.get(title_type) == self.kind
+
+
+def title_query(item: BatchRatingItem) -> TitleQuery:
+    """Batch elemanini cozumleme sorgusuna cevir (baslik normalize edilir)"""
+    return TitleQuery(normalize_turkish(item.title), item.year, item.kind)
+
+
+def group_by_rating_key(items: list[BatchRatingItem]) -> dict[str, list[BatchRatingItem]]:
+    """
+    Batch basliklarini cache key'ine gore grupla (batch ve stream route'lari icin).
+    
+    Ayni key'e dusen basliklar ("Başlangıç" ve "Baslangic") tek key olarak sorulur
+    ve cozulur, cevapta her biri kendi result_key'i ile yer alir.
+    """
+    key_to_items = {}
+    for item in items:
+        key_to_items.setdefault(make_rating_key(item.title, item.year, item.kind), []).append(item)
+    return key_to_items
+
+
+def find_movie(
+    db: Session, normalized_title: str, year: Optional[int] = None, kind: Optional[str] = None
+) -> Optional[Movie]:
+    """
+    Normalize edilmis basligi DB'de cozumle (indeks yuklu degilse kullanilir).
+    
+    1. Movies tablosu (Ingilizce/Orijinal) - Tam Eslesme
+    2. MovieTitles tablosu (Turkce/Yerel) - Tam Eslesme
+    Birden fazla aday varsa en cok oy alan secilir.
+    
+    PERFORMANS NOTU:
+    movies.search_title import sirasinda normalize_turkish ile doldurulur,
+    (search_title, year, votes DESC) index'i ile sorgu tek index probe'u olur.
+    """
+    query = db.query(Movie).filter(Movie.search_title == normalized_title)
+    
+    if year:
+        query = query.filter(Movie.year == year)
+    if kind:
+        query = query.filter(Movie.title_type.in_(TITLE_KINDS[kind]))
+        
+    movie = query.order_by(Movie.votes.desc()).first()
+    
+    if not movie:
+        tr_query = db.query(MovieTitle).filter(MovieTitle.search_title == normalized_title)
+        tr_titles = tr_query.all()
+        
+        candidates = []
+        for tr in tr_titles:
+            m = db.query(Movie).filter(Movie.imdb_id == tr.imdb_id).first()
+            if m:
+                if not TitleQuery(normalized_title, year, kind).accepts(m.year, m.title_type):
+                    continue
+                candidates.append(m)
+        
+        if candidates:
+            candidates.sort(key=lambda x: x.votes or 0, reverse=True)
+            movie = candidates[0]
+    
+    return movie
+
+
+def find_movies(db: Session, queries: list[TitleQuery]) -> dict[TitleQuery, Movie]:
+    """
+    Birden fazla basligi sabit sayida sorgu ile cozumle (set-based).
+    
+    OGRENME NOTU - N+1 yerine IN:
+    Her baslik icin ayri sorgu (ve her Turkce alias icin ayri Movie sorgusu)
+    atmak yerine tum basliklari tek bir IN (...) sorgusunda soruyoruz:
+    1. movies: search_title IN (...)           -> 1 sorgu
+    2. movie_titles JOIN movies: search_title IN (...) -> 1 sorgu (sadece kalanlar icin)
+    Batch boyutu ne olursa olsun en fazla 2 sorgu.
+    
+    Sonuclar votes DESC sirali gelir. Yil/tur filtresi SQL'de degil burada uygulanir:
+    ayni baslik batch'te farkli yil/tur ile birden fazla kez sorulabilir, her sorgu
+    icin filtresine uyan ilk (en cok oy alan) film secilir.
+    
+    Returns:
+        {TitleQuery: Movie} - bulunamayanlar dict'te yer almaz
+    """
+    wanted = list(dict.fromkeys(q for q in queries if q.title))
+    found = {}
+    if not wanted:
+        return found
+    
+    def assign(rows, pending):
+        candidates = defaultdict(list)
+        for key, movie in rows:
+            candidates[key].append(movie)
+        for q in pending:
+            movie = next((m for m in candidates[q.title] if q.accepts(m.year, m.title_type)), None)
+            if movie is not None:
+                found[q] = movie
+    
+    # 1. Ingilizce/orijinal basliklar
+    titles = list(dict.fromkeys(q.title for q in wanted))
+    rows = db.query(Movie.search_title, Movie).filter(
+        Movie.search_title.in_(titles)
+    ).order_by(Movie.votes.desc()).all()
+    assign(rows, wanted)
+    
+    # 2. Turkce basliklar (JOIN ile, alias basina ayri sorgu yok)
+    remaining = [q for q in wanted if q not in found]
+    if remaining:
+        rows = db.query(MovieTitle.search_title, Movie).join(
+            Movie, Movie.imdb_id == MovieTitle.imdb_id
+        ).filter(
+            MovieTitle.search_title.in_(list(dict.fromkeys(q.title for q in remaining)))
+        ).order_by(Movie.votes.desc()).all()
+        assign(rows, remaining)
+    
+    return found
+
+
+def find_movie_by_id(db: Session, imdb_id: str) -> Optional[Movie]:
+    """IMDB ID ile film getir"""
+    return db.query(Movie).filter(Movie.imdb_id == imdb_id).first()
+
+
+def find_movies_by_ids(db: Session, imdb_ids: list[str]) -> dict[str, Movie]:
+    """
+    Birden fazla IMDB ID'yi tek sorguda getir (imdb_id unique index).
+    
+    Returns:
+        {imdb_id: Movie}
+    """
+    if not imdb_ids:
+        return {}
+    movies = db.query(Movie).filter(Movie.imdb_id.in_(imdb_ids)).all()
+    return {m.imdb_id: m for m in movies}
+
+
+def search_movies_db(db: Session, q: str, limit: int) -> list[Movie]:
+    """
+    LIKE '%q%' ile arama (arama indeksi yuklu degilse kullanilir).
+    
+    Returns:
+        Rating'e gore azalan sirali en fazla `limit` film
+    """
+    normalized_q = normalize_turkish(q)
+    results = []
+    found_ids = set()
+    
+    # DB Limit stratejisi: 
+    # Populariteye gore siralama olmadigi icin genis bir havuz cekmeliyiz.
+    # Kullanici 10 istese de biz 100 cekip, rating'e gore siralayip en iyi 10'u donelim.
+    db_limit = min(limit * 10, 500)
+    
+    # 1. Ingilizce basliklarda ara
+    movies = db.query(Movie).filter(
+        func.lower(Movie.title).contains(func.lower(q))
+    ).limit(db_limit).all()
+    
+    for m in movies:
+        results.append(m)
+        found_ids.add(m.imdb_id)
+    
+    # 2. Turkce basliklarda ara (search_title)
+    tr_titles = db.query(MovieTitle).filter(
+        MovieTitle.search_title.contains(normalized_q)
+    ).limit(db_limit).all()
+    
+    for tr in tr_titles:
+        if tr.imdb_id not in found_ids:
+            movie = db.query(Movie).filter(Movie.imdb_id == tr.imdb_id).first()
+            if movie:
+                results.append(movie)
+                found_ids.add(tr.imdb_id)
+
+    # Sonuclari rating'e gore sirala
+    results.sort(key=lambda m: m.rating or 0, reverse=True)
+    
+    # Limit uygula (En son)
+    return results[:limit]
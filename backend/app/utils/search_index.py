@@ -0,0 +1,178 @@
+"""
+Arama Indeksi (N-gram Inverted Index)
+
+OGRENME NOTU - LIKE '%q%' neden yavas?
+/api/search eskiden `lower(title) LIKE '%q%'` sorgusu atiyordu.
+Basta wildcard (%) oldugu icin B-tree index kullanilamaz -> her aramada
+tum tablo taranir (sequential scan). Katalog buyudukce arama da yavaslar.
+
+Cozum: Inverted index (arama motorlarinin temeli)
+- Her basligi 3'er harflik parcalara (trigram) bol:
+  "inception" -> "inc", "nce", "cep", "ept", "pti", "tio", "ion"
+- Her trigram icin o trigrami iceren dokumanlarin listesini tut (posting list)
+- Arama: sorgunun trigramlarindan EN NADIR olanin listesini al,
+  sadece o adaylari dogrula (substring kontrolu)
+
+Boylece arama maliyeti katalog boyutuna degil, en secici trigramin
+liste uzunluguna bagli olur -> katalog buyudukce latency sabit kalir.
+
+OGRENME NOTU - Kisa/yaygin sorgular ve erken durma:
+2-3 harflik ("the", "ar") veya cok yaygin sorgularda en secici liste bile
+katalogun buyuk kismi olabilir. Dokumanlar indekse rating sirasiyla eklenir,
+bu yuzden her posting list zaten sonuc sirasindadir: `limit` farkli film
+bulununca tarama durur, tum listeyi gezip siralamaya gerek kalmaz.
+- Sorgu <= 3 harf: sorgu n-gram'in kendisi, listedeki her aday eslesir
+  -> en fazla `limit` (+ ayni filmin diger basliklari) dokuman gezilir
+- Uzun sorgu: adaylar dogrulanir; eslesmeyen aday cok ise (tum trigram'lari
+  yaygin ama kendisi nadir bir sorgu) en kotu durum yine en secici listenin boyu
+
+MULAKATTA SORULUR:
+- "Inverted index nedir?" -> Kelime/parca -> dokuman listesi eslemesi (Elasticsearch, Lucene)
+- "PostgreSQL'de karsiligi?" -> pg_trgm eklentisi + GIN index
+- "Neden array('I')?" -> Python list'te her int ayri obje (~36 byte), array'de 4 byte
+"""
+
+from array import array
+from typing import Optional
+
+from app.utils.turkish import normalize_turkish
+
+# 2 karakterlik sorgular icin bigram, digerleri icin trigram kullanilir
+NGRAM_SIZES = (2, 3)
+
+
+def _ngrams(text: str, n: int) -> set[str]:
+    """Metni n uzunlugunda parcalara bol (tekrarsiz)"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class SearchIndex:
+    """
+    Normalize basliklar uzerinde n-gram inverted index.
+
+    Her dokuman bir (normalize baslik, imdb_id) ciftidir. Bir filmin
+    hem Ingilizce hem Turkce basligi ayri dokuman olarak indekslenir,
+    sonuclar imdb_id'ye gore tekillestirilir.
+    """
+
+    def __init__(self, movies: dict[str, dict]):
+        self.movies = movies  # imdb_id -> MovieRating payload (TitleIndex ile paylasilir)
+        self.doc_texts: list[str] = []
+        self.doc_ids: list[str] = []
+        self.postings: dict[str, array] = {}
+
+    def add(self, normalized_title: str, imdb_id: str):
+        """Dokuman ekle"""
+        if not normalized_title:
+            return
+        doc = len(self.doc_texts)
+        self.doc_texts.append(normalized_title)
+        self.doc_ids.append(imdb_id)
+        for n in NGRAM_SIZES:
+            for gram in _ngrams(normalized_title, n):
+                posting = self.postings.get(gram)
+                if posting is None:
+                    posting = self.postings[gram] = array("I")
+                posting.append(doc)
+
+    def _candidates(self, query: str) -> Optional[array]:
+        """
+        Sorgu icin en kisa posting list'i dondur.
+
+        OGRENME NOTU:
+        Sorgunun TUM trigramlarini iceren dokuman, sorguyu icermek zorunda degildir
+        ("abcab" sorgusu ile "abcxbcab"), bu yuzden sonuclar her durumda dogrulanir.
+        Kesisim almak yerine en secici listeyi dogrulamak daha ucuz.
+        """
+        n = 3 if len(query) >= 3 else 2
+        best = None
+        for gram in _ngrams(query, n):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return None  # Bir parca bile yoksa sonuc yok
+            if best is None or len(posting) < len(best):
+                best = posting
+        return best
+
+    def search(self, query: str, limit: int) -> list[dict]:
+        """
+        Substring arama, rating'e gore en iyi `limit` sonuc.
+
+        Dokumanlar rating sirasiyla eklendigi icin (bkz. build_search_index)
+        adaylar sonuc sirasinda gezilir ve `limit` sonuca ulasinca durulur.
+
+        Args:
+            query: Kullanici sorgusu (normalize edilmemis olabilir)
+            limit: Maksimum sonuc sayisi
+
+        Returns:
+            MovieRating payload listesi (rating azalan)
+        """
+        normalized = normalize_turkish(query.strip()) if query else ""
+        if len(normalized) < 2:
+            return []
+
+        candidates = self._candidates(normalized)
+        if not candidates:
+            return []
+
+        matched = {}
+        for doc in candidates:
+            if normalized in self.doc_texts[doc]:
+                imdb_id = self.doc_ids[doc]
+                if imdb_id not in matched:
+                    matched[imdb_id] = self.movies[imdb_id]
+                    if len(matched) >= limit:
+                        break
+        return list(matched.values())
+
+    def stats(self) -> dict:
+        return {
+            "documents": len(self.doc_texts),
+            "ngrams": len(self.postings),
+        }
+
+
+def _rating_order(payload: dict) -> tuple:
+    """Arama sonuc sirasi: rating, esitlikte oy sayisi (azalan)"""
+    return (-(payload["rating"] or 0), -(payload["votes"] or 0))
+
+
+def build_search_index(movies: dict[str, dict], aliases: list[tuple[str, str]]) -> SearchIndex:
+    """
+    Film payload'lari ve Turkce basliklardan arama indeksini olustur.
+
+    Dokumanlar rating sirasiyla eklenir: posting list'ler dokuman numarasina gore
+    artan oldugu icin ayni zamanda sonuc sirasinda olur (SearchIndex.search erken durur).
+    sorted stabil: esit rating/oy'da ilk eklenen (Ingilizce baslik, sonra Turkce) once gelir.
+
+    Args:
+        movies: imdb_id -> payload (TitleIndex.movies)
+        aliases: (search_title, imdb_id) ciftleri
+    """
+    docs = [(normalize_turkish(payload["title"]), imdb_id) for imdb_id, payload in movies.items()]
+    docs += [(search_title, imdb_id) for search_title, imdb_id in aliases if imdb_id in movies]
+    docs.sort(key=lambda doc: _rating_order(movies[doc[1]]))
+
+    index = SearchIndex(movies)
+    for normalized_title, imdb_id in docs:
+        index.add(normalized_title, imdb_id)
+    return index
+
+
+# Global indeks - title_index.load_title_index() ile birlikte yuklenir
+_search_index: Optional[SearchIndex] = None
+
+
+def set_search_index(index: Optional[SearchIndex]):
+    """Yeni indeksi aktif et (atomic swap)"""
+    global _search_index
+    _search_index = index
+
+
+def get_search_index() -> Optional[SearchIndex]:
+    """
+    Arama indeksi singleton dondur.
+    None donerse /api/search DB'ye gider.
+    """
+    return _search_index
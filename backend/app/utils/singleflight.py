@@ -0,0 +1,366 @@
+"""
+Single-Flight - Eszamanli Cache MISS'lerin Birlestirilmesi
+
+OGRENME NOTU - Thundering Herd (Suru Etkisi):
+Populer bir film Redis'ten expire oldugunda, o anda gelen TUM istekler
+ayni anda MISS olur ve hepsi ayni sorguyu DB'ye atar. 100 istek = 100 ayni sorgu.
+TTL sinirlarinda (her saat basi) DB'de ani yuk sivrilmeleri gorulur.
+
+Cozum: Ayni key icin sadece BIR cozumleme calissin, digerleri onun sonucunu beklesin.
+- Process ici: key -> devam eden cagri tablosu (Go'daki singleflight paketi gibi)
+- Process'ler arasi: Redis'te kisa omurlu kilit (lease)
+    SET lock:<key> <token> NX PX 3000
+  Kilidi alan cozumler ve cache'e yazar. Alamayanlar cache'i kisa araliklarla
+  yoklar (poll). Lease suresi dolarsa (lider coktu vs.) kendileri cozer.
+
+MULAKATTA SORULUR:
+- "Cache stampede nasil onlenir?" -> Request coalescing, lock/lease, erken yenileme
+- "Kilit sahibi olurse ne olur?" -> Lease (TTL'li kilit) sayesinde kilit kendiliginden acilir
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from app.config import settings
+from app.redis import get_redis_client, get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "lock:"
+
+
+class _Call:
+    """Devam eden bir cozumleme (process ici bekleyenler icin)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# Process ici devam eden cagrilar: key -> _Call
+_calls: dict[str, _Call] = {}
+_calls_lock = threading.Lock()
+
+# Istatistikler: kac istek baskasinin sonucunu paylasti
+_flight_stats = {
+    "leaders": 0,  # Cozumlemeyi kendisi yapan
+    "shared_local": 0,  # Ayni process'teki liderin sonucunu alan
+    "shared_remote": 0,  # Baska process'in cache'e yazdigi sonucu alan
+}
+
+
+_stats_lock = threading.Lock()
+
+
+def _count(name: str, amount: int = 1):
+    """Istatistik sayacini kilit altinda artir (sync yol threadpool'da calisir)"""
+    with _stats_lock:
+        _flight_stats[name] += amount
+
+
+def get_flight_stats() -> dict:
+    with _stats_lock:
+        return dict(_flight_stats)
+
+
+def _lock_key(key: str) -> str:
+    return f"{LOCK_PREFIX}{key}"
+
+
+def _release(client, keys: list[str], token: str):
+    """
+    Sadece bizim aldigimiz kilitleri sil.
+
+    NOT: GET + DEL atomik degil. Lease arada dolup baskasina gecerse onun
+    kilidini silebiliriz; en kotu durumda bir cozumleme fazladan calisir.
+    """
+    try:
+        lock_keys = [_lock_key(k) for k in keys]
+        owners = client.mget(lock_keys)
+        mine = [lk for lk, owner in zip(lock_keys, owners) if owner == token.encode()]
+        if mine:
+            client.delete(*mine)
+    except Exception as e:
+        logger.warning("Kilit birakma hatasi: %s", e)
+
+
+def _acquire(client, keys: list[str], token: str) -> list[str]:
+    """
+    Key'ler icin Redis lease almayi dene (tek pipeline).
+
+    Returns:
+        Kilidi alinan key'ler
+    """
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.set(_lock_key(key), token, nx=True, px=settings.singleflight_lease_ms)
+        acquired = pipe.execute()
+        return [k for k, ok in zip(keys, acquired) if ok]
+    except Exception as e:
+        # Redis hatasi -> fail-open: herkes kendi cozer
+        logger.warning("Kilit alma hatasi: %s", e)
+        return list(keys)
+
+
+def _wait_remote(keys: list[str], poll: Callable[[list[str]], dict]) -> dict[str, Any]:
+    """
+    Baska process'in cozdugu key'leri cache'ten yokla (lease suresi boyunca).
+
+    Returns:
+        Cache'te beliren sonuclar (bulunamayanlar dict'te yok)
+    """
+    results = {}
+    pending = list(keys)
+    deadline = time.monotonic() + settings.singleflight_lease_ms / 1000
+    interval = settings.singleflight_poll_ms / 1000
+
+    while pending and time.monotonic() < deadline:
+        time.sleep(interval)
+        found = poll(pending)
+        results.update(found)
+        pending = [k for k in pending if k not in found]
+
+    return results
+
+
+def coalesce_many(
+    keys: list[str],
+    resolve: Callable[[list[str]], dict],
+    poll: Optional[Callable[[list[str]], dict]] = None,
+) -> dict[str, Any]:
+    """
+    Key'leri cozumle, ayni key icin eszamanli cozumlemeleri birlestir.
+
+    Args:
+        keys: Cozulecek key'ler (genelde cache key'leri)
+        resolve: key listesi -> {key: deger}. Cache'e yazmak da bu fonksiyonun isi,
+            boylece diger process'ler sonucu cache'ten okuyabilir.
+        poll: key listesi -> {key: deger} (cache'ten okuma). None ise sadece
+            process ici birlestirme yapilir (Redis kilidi kullanilmaz).
+
+    Returns:
+        {key: deger} - resolve'un dondurmedigi key'ler icin None
+    """
+    keys = list(dict.fromkeys(keys))
+    if not settings.singleflight_enabled:
+        results = resolve(keys)
+        return {key: results.get(key) for key in keys}
+
+    owned: dict[str, _Call] = {}
+    waiting: dict[str, _Call] = {}
+
+    # 1. Process ici: her key icin lider miyiz, bekleyen mi?
+    with _calls_lock:
+        for key in keys:
+            call = _calls.get(key)
+            if call is None:
+                call = _calls[key] = _Call()
+                owned[key] = call
+            else:
+                waiting[key] = call
+
+    results: dict[str, Any] = {}
+    try:
+        if owned:
+            results.update(_resolve_owned(list(owned), resolve, poll))
+    except BaseException as e:
+        for call in owned.values():
+            call.error = e
+        raise
+    finally:
+        with _calls_lock:
+            for key, call in owned.items():
+                call.result = results.get(key)
+                _calls.pop(key, None)
+                call.event.set()
+
+    # 2. Baska thread'in cozdugu key'leri bekle
+    for key, call in waiting.items():
+        call.event.wait(settings.singleflight_lease_ms / 1000)
+        if call.event.is_set() and call.error is None:
+            results[key] = call.result
+            _count("shared_local")
+        else:
+            # Lider hata verdi veya cok uzun surdu -> kendimiz cozelim
+            results.update(resolve([key]))
+
+    return {key: results.get(key) for key in keys}
+
+
+def _resolve_owned(keys: list[str], resolve, poll) -> dict[str, Any]:
+    """Process icinde lideri oldugumuz key'leri (gerekirse Redis kilidi ile) coz"""
+    client = get_redis_client() if poll is not None else None
+    if client is None:
+        _count("leaders", len(keys))
+        return resolve(keys)
+
+    token = uuid.uuid4().hex
+    acquired = _acquire(client, keys, token)
+    results = {}
+    try:
+        if acquired:
+            _count("leaders", len(acquired))
+            results.update(resolve(acquired))
+    finally:
+        if acquired:
+            _release(client, acquired, token)
+
+    # Kilidi baska process'te olanlar: cache'e yazmasini bekle
+    remote = [k for k in keys if k not in set(acquired)]
+    if remote:
+        found = _wait_remote(remote, poll)
+        _count("shared_remote", len(found))
+        results.update(found)
+        leftover = [k for k in remote if k not in found]
+        if leftover:
+            _count("leaders", len(leftover))
+            results.update(resolve(leftover))
+
+    return results
+
+
+def coalesce(key: str, resolve: Callable[[], Any], poll: Optional[Callable[[], tuple]] = None) -> Any:
+    """
+    Tek key icin coalesce_many kisayolu.
+
+    Args:
+        resolve: () -> deger
+        poll: () -> (HIT mi, deger) (cache_lookup ile ayni imza)
+    """
+    def poll_many(_keys):
+        hit, value = poll()
+        return {key: value} if hit else {}
+
+    return coalesce_many([key], lambda _keys: {key: resolve()}, poll_many if poll is not None else None)[key]
+
+
+# ============================================
+# ASYNC VERSIYON (ASYNC_MODE=true)
+# ============================================
+# OGRENME NOTU:
+# Event loop tek thread'de calistigi icin Lock gerekmez; bekleyenler
+# liderin asyncio.Future'ini await eder.
+
+_async_calls: dict[str, asyncio.Future] = {}
+
+
+async def _acquire_async(client, keys: list[str], token: str) -> list[str]:
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.set(_lock_key(key), token, nx=True, px=settings.singleflight_lease_ms)
+        acquired = await pipe.execute()
+        return [k for k, ok in zip(keys, acquired) if ok]
+    except Exception as e:
+        logger.warning("Kilit alma hatasi: %s", e)
+        return list(keys)
+
+
+async def _release_async(client, keys: list[str], token: str):
+    try:
+        lock_keys = [_lock_key(k) for k in keys]
+        owners = await client.mget(lock_keys)
+        mine = [lk for lk, owner in zip(lock_keys, owners) if owner == token.encode()]
+        if mine:
+            await client.delete(*mine)
+    except Exception as e:
+        logger.warning("Kilit birakma hatasi: %s", e)
+
+
+async def _resolve_owned_async(keys: list[str], resolve, poll) -> dict[str, Any]:
+    client = get_async_redis_client() if poll is not None else None
+    if client is None:
+        _count("leaders", len(keys))
+        return await resolve(keys)
+
+    token = uuid.uuid4().hex
+    acquired = await _acquire_async(client, keys, token)
+    results = {}
+    try:
+        if acquired:
+            _count("leaders", len(acquired))
+            results.update(await resolve(acquired))
+    finally:
+        if acquired:
+            await _release_async(client, acquired, token)
+
+    remote = [k for k in keys if k not in set(acquired)]
+    if remote:
+        pending = list(remote)
+        deadline = time.monotonic() + settings.singleflight_lease_ms / 1000
+        while pending and time.monotonic() < deadline:
+            await asyncio.sleep(settings.singleflight_poll_ms / 1000)
+            found = await poll(pending)
+            _count("shared_remote", len(found))
+            results.update(found)
+            pending = [k for k in pending if k not in found]
+        if pending:
+            _count("leaders", len(pending))
+            results.update(await resolve(pending))
+
+    return results
+
+
+async def coalesce_many_async(keys: list[str], resolve, poll=None) -> dict[str, Any]:
+    """coalesce_many'nin async versiyonu (resolve ve poll coroutine fonksiyonlari)"""
+    keys = list(dict.fromkeys(keys))
+    if not settings.singleflight_enabled:
+        results = await resolve(keys)
+        return {key: results.get(key) for key in keys}
+
+    loop = asyncio.get_running_loop()
+    owned: dict[str, asyncio.Future] = {}
+    waiting: dict[str, asyncio.Future] = {}
+
+    for key in keys:
+        future = _async_calls.get(key)
+        if future is None:
+            future = _async_calls[key] = loop.create_future()
+            owned[key] = future
+        else:
+            waiting[key] = future
+
+    results: dict[str, Any] = {}
+    try:
+        if owned:
+            results.update(await _resolve_owned_async(list(owned), resolve, poll))
+    except BaseException as e:
+        for future in owned.values():
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # "exception never retrieved" uyarisini sustur
+        raise
+    finally:
+        for key, future in owned.items():
+            _async_calls.pop(key, None)
+            if not future.done():
+                future.set_result(results.get(key))
+
+    for key, future in waiting.items():
+        try:
+            results[key] = await asyncio.wait_for(
+                asyncio.shield(future), settings.singleflight_lease_ms / 1000
+            )
+            _count("shared_local")
+        except Exception:
+            results.update(await resolve([key]))
+
+    return {key: results.get(key) for key in keys}
+
+
+async def coalesce_async(key: str, resolve, poll=None) -> Any:
+    """coalesce'in async versiyonu"""
+    async def poll_many(_keys):
+        hit, value = await poll()
+        return {key: value} if hit else {}
+
+    async def resolve_many(_keys):
+        return {key: await resolve()}
+
+    return (await coalesce_many_async([key], resolve_many, poll_many if poll is not None else None))[key]
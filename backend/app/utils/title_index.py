@@ -0,0 +1,217 @@
+"""
+Baslik Cozumleme Indeksi (In-Memory Title Index)
+
+OGRENME NOTU - Neden process icinde indeks?
+Cache MISS oldugunda /api/rating ve /api/ratings/batch veritabanina
+birden fazla sorgu atiyor (Ingilizce baslik, Turkce baslik, her alias icin
+Movie sorgusu). Supabase'e her round-trip ~50-200ms.
+
+Katalog kucuk (~60K film + ~24K Turkce baslik), bu yuzden tamamini
+uygulama acilirken hafizaya alip dict ile cozumleyebiliriz:
+- Key: (normalize_turkish(baslik), yil, tur) -> En cok oy alan imdb_id
+- Yil/tur verilmezse yerlerinde None olan key kullanilir: (baslik, None, None)
+- Lookup O(1), mikrosaniye seviyesinde, DB'ye hic gitmez
+
+Veri sadece IMDB import'u ile degisir. Import sonrasi
+POST /api/index/reload ile indeks yeniden olusturulur.
+
+MULAKATTA SORULUR:
+- "Her seyi cache'lemek mantikli mi?" -> Veri kucuk ve nadiren degisiyorsa evet
+- "Reload sirasinda gelen istekler ne olur?" -> Yeni indeks ayri kurulur,
+  hazir olunca referans tek atama ile degistirilir (atomic swap)
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional
+
+from app.config import settings
+from app.models.movie import Movie, KIND_BY_TITLE_TYPE
+from app.models.movie_title import MovieTitle
+from app.utils.turkish import normalize_turkish
+from app.utils.search_index import build_search_index, set_search_index
+from app.utils.fuzzy_index import build_fuzzy_index, set_fuzzy_index
+
+logger = logging.getLogger(__name__)
+
+
+class TitleIndex:
+    """
+    Normalize baslik + yil + tur -> film eslemesi.
+
+    OGRENME NOTU:
+    Iki ayri tablo tutuyoruz cunku DB sorgusundaki oncelik korunmali:
+    once Ingilizce/orijinal baslik (movies), bulunamazsa Turkce baslik (movie_titles).
+    Her tabloda ayni key'e birden fazla film denk gelirse en cok oy alan kazanir.
+    """
+
+    def __init__(self):
+        self.movies: dict[str, dict] = {}  # imdb_id -> MovieRating payload
+        self.primary: dict[tuple, str] = {}  # (baslik, yil, tur) -> imdb_id
+        self.localized: dict[tuple, str] = {}  # (turkce baslik, yil, tur) -> imdb_id
+        self.aliases: list[tuple[str, str]] = []  # (turkce baslik, imdb_id) - arama indeksi icin
+        self.version: Optional[str] = None  # Veri ozeti (HTTP ETag'i icin, bkz. http_cache)
+        self.loaded_at: Optional[float] = None
+        self.build_seconds: float = 0.0
+
+    def add_movie(self, payload: dict):
+        """Filmi ekle. Cagiran taraf filmleri oy sayisina gore azalan sirada vermeli."""
+        self.movies[payload["imdb_id"]] = payload
+        self._add_key(self.primary, normalize_turkish(payload["title"]), payload)
+
+    def add_localized(self, search_title: str, imdb_id: str):
+        """Turkce basligi ekle (film once add_movie ile eklenmis olmali)."""
+        payload = self.movies.get(imdb_id)
+        if payload and search_title:
+            self._add_key(self.localized, search_title, payload)
+            self.aliases.append((search_title, imdb_id))
+
+    @staticmethod
+    def _add_key(table: dict, normalized_title: str, payload: dict):
+        # Her film yil/tur verilmis ve verilmemis tum kombinasyonlara eklenir,
+        # lookup filtre sayisindan bagimsiz tek dict erisimi kalir.
+        # setdefault: ilk eklenen (en cok oy alan) kazanir
+        imdb_id = payload["imdb_id"]
+        years = (None, payload["year"]) if payload["year"] else (None,)
+        kind = KIND_BY_TITLE_TYPE.get(payload.get("title_type"))
+        kinds = (None, kind) if kind else (None,)
+        for year in years:
+            for k in kinds:
+                table.setdefault((normalized_title, year, k), imdb_id)
+
+    def lookup(self, normalized_title: str, year: Optional[int] = None, kind: Optional[str] = None) -> Optional[dict]:
+        """
+        Normalize edilmis basligi filme cevir.
+
+        Args:
+            kind: "movie" | "series" (None ise tur filtresi yok)
+
+        Returns:
+            MovieRating payload dict'i, bulunamazsa None
+        """
+        key = (normalized_title, year or None, kind or None)
+        imdb_id = self.primary.get(key) or self.localized.get(key)
+        return self.movies.get(imdb_id) if imdb_id else None
+
+    def get_movie(self, imdb_id: str) -> Optional[dict]:
+        """IMDB ID ile film payload'u"""
+        return self.movies.get(imdb_id)
+
+    def stats(self) -> dict:
+        return {
+            "movies": len(self.movies),
+            "primary_keys": len(self.primary),
+            "localized_keys": len(self.localized),
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "build_seconds": round(self.build_seconds, 3),
+        }
+
+
+def build_title_index(db) -> TitleIndex:
+    """
+    Veritabanindan indeksi olustur.
+
+    OGRENME NOTU - Sadece gerekli kolonlar:
+    ORM objesi yerine tuple cekmek (db.query(Movie.imdb_id, ...)) hem
+    bellek hem hiz acisindan cok daha ucuz. 60K ORM objesi olusturmaya gerek yok.
+    
+    OGRENME NOTU - Versiyon:
+    Okunan tum satirlarin ozeti (blake2b) indeksin versiyonu olur. Ayni veriyi
+    yukleyen her instance ayni versiyonu hesaplar, boylece ETag'ler instance'lar
+    ve CDN arasinda tutarli kalir; import bir satiri bile degistirirse versiyon degisir.
+    """
+    start = time.perf_counter()
+    index = TitleIndex()
+
+    rows = db.query(
+        Movie.imdb_id, Movie.title, Movie.year,
+        Movie.rating, Movie.votes, Movie.genres, Movie.title_type
+    ).order_by(Movie.votes.desc().nullslast(), Movie.imdb_id).all()
+
+    for imdb_id, title, year, rating, votes, genres, title_type in rows:
+        index.add_movie({
+            "imdb_id": imdb_id,
+            "title": title,
+            "year": year,
+            "rating": rating,
+            "votes": votes,
+            "genres": genres,
+            "title_type": title_type,
+        })
+
+    # Turkce basliklar: film sirasini korumak icin votes'a gore sirala
+    # (esitlikte imdb_id/id: her instance ayni sirayi -> ayni versiyonu gorur)
+    # search_title kolonu yerine key burada hesaplanir: normalizasyon degisip
+    # backfill henuz calismamissa bile indeks cache key'leri ile ayni kalir
+    localized = db.query(MovieTitle.imdb_id, MovieTitle.title).join(
+        Movie, Movie.imdb_id == MovieTitle.imdb_id
+    ).order_by(Movie.votes.desc().nullslast(), Movie.imdb_id, MovieTitle.id).all()
+
+    for imdb_id, title in localized:
+        index.add_localized(normalize_turkish(title), imdb_id)
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr(rows).encode())
+    digest.update(repr(localized).encode())
+    index.version = digest.hexdigest()
+    index.loaded_at = time.time()
+    index.build_seconds = time.perf_counter() - start
+    return index
+
+
+# Global indeks - None ise indeks yok, route'lar DB'ye gider
+_title_index: Optional[TitleIndex] = None
+_reload_lock = threading.Lock()
+
+
+def load_title_index() -> Optional[TitleIndex]:
+    """
+    Indeksi (yeniden) yukle.
+
+    OGRENME NOTU - Fail-open:
+    Redis'te oldugu gibi, indeks kurulamazsa API calismaya devam eder.
+    Eski indeks varsa o kullanilmaya devam edilir, yoksa route'lar DB'ye duser.
+    
+    Arama indeksi (search_index) ve fuzzy indeks ayni veriden burada
+    olusturulur, boylece katalog DB'den tek sefer okunur.
+    """
+    global _title_index
+    from app.database import get_session_factory
+
+    with _reload_lock:
+        db = get_session_factory()()
+        try:
+            index = build_title_index(db)
+        except Exception as e:
+            logger.warning("Baslik indeksi olusturulamadi (DB'den devam edilecek): %s", e)
+            return _title_index
+        finally:
+            db.close()
+
+        if settings.search_index_enabled:
+            search_index = build_search_index(index.movies, index.aliases)
+            set_search_index(search_index)
+            logger.info("Arama indeksi yuklendi: %s", search_index.stats())
+        
+        if settings.fuzzy_enabled:
+            fuzzy_index = build_fuzzy_index(index.movies, index.aliases)
+            set_fuzzy_index(fuzzy_index)
+            logger.info("Fuzzy indeks yuklendi: %s", fuzzy_index.stats())
+        
+        _title_index = index
+        logger.info(
+            "Baslik indeksi yuklendi: %d film, %d Turkce key, %.2fs",
+            len(index.movies), len(index.localized), index.build_seconds
+        )
+        return index
+
+
+def get_title_index() -> Optional[TitleIndex]:
+    """
+    Indeks singleton dondur.
+    None donerse route'lar veritabanina gider.
+    """
+    return _title_index
@@ -1,5 +1,5 @@
 """
-Turkce Karakter Normalizasyonu
+Turkce Karakter Normalizasyonu (Kanonik Baslik Key'i)
 
 OGRENME NOTU:
 Turkce karakterler (ş, ı, ç, ğ, ü, ö) ile ASCII karsiliklari (s, i, c, g, u, o)
@@ -9,9 +9,36 @@ arasinda eslestirme yapmamiz gerekiyor. Cunku:
 - Veritabaninda "Başlangıç" var
 
 Bu modul her iki taraftaki metni normalize ederek eslestirme sagliyor.
+
+OGRENME NOTU - Tek kaynak:
+Ayni normalizasyon UC yerde kullanilir ve birebir ayni sonucu vermek ZORUNDA:
+- Cache key'leri (make_rating_key)       -> farkliysa ayni film iki ayri key'de
+- Indeksler (title_index, search_index)  -> farkliysa indeks MISS
+- DB kolonu search_title (import/backfill) -> farkliysa DB lookup MISS
+Bu yuzden Python fonksiyonu (normalize_turkish) ve SQL karsiligi (normalize_sql)
+ayni tablolardan (TITLE_TRANSLATION, COMBINING_MARKS, WHITESPACE) uretilir.
+
+Adimlar:
+1. Ceviri tablosu (str.translate, tek gecis): Turkce harfler, akilli tirnaklar,
+   tire cesitleri, ozel bosluklar; gorunmez karakterler (zero-width, soft hyphen) silinir
+2. ASCII degilse NFKD + birlesik aksan isaretlerini at: "Amélie" -> "Amelie", "ﬁ" -> "fi"
+3. Kucuk harf
+4. Bosluk dizileri tek bosluga, bas/son bosluk atilir
+
+Noktalama SILINMEZ ("Spider-Man" != "Spider Man"); o fark fuzzy asamanin isi.
+
+MULAKATTA SORULUR:
+- "Unicode normalization formlari?" -> NFC/NFD (kanonik), NFKC/NFKD (uyumluluk: ligatur, tam genislik)
+- "Neden lru_cache?" -> Populer basliklar tekrar tekrar normalize edilir, hit ~100ns
 """
 
+import re
+import unicodedata
+from functools import lru_cache
+
 # Turkce -> ASCII karakter eslestirmesi
+# OGRENME NOTU: NFKD "ş"yi "s" + cedilla'ya ayirir ama "ı" (noktasiz i) ayrismaz,
+# "İ".lower() ise "i" + birlesik nokta verir. Bu yuzden Turkce harfler tabloda.
 TURKISH_CHAR_MAP = {
     'ş': 's', 'Ş': 'S',
     'ı': 'i', 'İ': 'I',
@@ -21,30 +48,98 @@ TURKISH_CHAR_MAP = {
     'ö': 'o', 'Ö': 'O',
 }
 
+# Noktalama cesitleri -> ASCII karsiligi
+PUNCTUATION_MAP = {
+    **dict.fromkeys('\u2018\u2019\u201a\u201b\u2032\u00b4\u0060', "'"),  # ‘ ’ ‚ ‛ ′ ´ `
+    **dict.fromkeys('\u201c\u201d\u201e\u201f\u2033\u00ab\u00bb', '"'),  # “ ” „ ‟ ″ « »
+    **dict.fromkeys('\u2010\u2011\u2012\u2013\u2014\u2015\u2212', '-'),  # tire cesitleri, eksi
+    # NBSP ve ozel bosluklar (en/em space, thin space, ideographic space...)
+    **dict.fromkeys('\u00a0' + ''.join(map(chr, range(0x2000, 0x200b))) + '\u202f\u205f\u3000', ' '),
+}
+
+# Gorunmez karakterler (Netflix DOM'unda gelebilir): zero-width, yon isaretleri, BOM, soft hyphen
+INVISIBLE_CHARS = '\u200b\u200c\u200d\u200e\u200f\u2060\ufeff\u00ad'
 
+# Birden fazla karaktere acilanlar (SQL'de TRANSLATE yerine REPLACE)
+MULTI_CHAR_MAP = {'\u2026': '...'}  # …
+
+TITLE_TRANSLATION = str.maketrans({
+    **TURKISH_CHAR_MAP,
+    **PUNCTUATION_MAP,
+    **MULTI_CHAR_MAP,
+    **dict.fromkeys(INVISIBLE_CHARS),
+})
+
+# NFKD sonrasi atilan birlesik aksan isaretleri (Combining Diacritical Marks blogu)
+COMBINING_MARKS = '[\u0300-\u036f]'
+# Bosluk sayilan karakterler (Python \s ile PostgreSQL \s ayni degil, acikca yazilir)
+WHITESPACE = ' \t\n\r\f\v'
+
+_COMBINING_RE = re.compile(COMBINING_MARKS)
+_WHITESPACE_RE = re.compile(f"[{WHITESPACE}]+")
+
+# Hot key'ler icin memoization (process basina, ~1MB)
+NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_turkish(text: str) -> str:
     """
-    Turkce karakterleri ASCII karsiliklarina donusturur.
-    
+    Basligi kanonik key'e donusturur (cache key, indeks ve search_title kolonu icin).
+
     Ornek:
-        "Başlangıç" -> "baslangic"
+        "Başlangıç"       -> "baslangic"
+        "Amélie  – 2001"  -> "amelie - 2001"
+        "Don’t Look Up"   -> "don't look up"
     """
     if not text:
         return text
-    
-    # Smart quotes -> Straight quotes
-    result = text.replace('\u2019', "'").replace('\u2018', "'")
 
-    for tr_char, ascii_char in TURKISH_CHAR_MAP.items():
-        result = result.replace(tr_char, ascii_char)
-    
-    return result.lower()
+    result = text.translate(TITLE_TRANSLATION)
+    if not result.isascii():
+        result = _COMBINING_RE.sub('', unicodedata.normalize('NFKD', result))
+    result = result.lower()
+
+    return _WHITESPACE_RE.sub(' ', result).strip(' ')
+
+
+def _sql_literal(value: str) -> str:
+    """SQL string literal (tek tirnak escape: ' -> '')"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def normalize_sql(column: str) -> str:
+    """
+    normalize_turkish'in PostgreSQL karsiligi (backfill / import icin SQL ifadesi).
+
+    Ayni tablolardan uretilir:
+        TRANSLATE (tek karakter eslestirme + silme) -> REPLACE (…) -> normalize(NFKD)
+        -> aksan isaretlerini sil -> LOWER -> bosluk dizilerini daralt -> BTRIM
+
+    OGRENME NOTU:
+    - TRANSLATE(s, 'abc', 'xy'): a->x, b->y, c SILINIR (hedefte karsiligi yok)
+    - normalize(text, NFKD) PostgreSQL 13+ ve UTF8 veritabani ister
+    - LOWER ASCII disi harflerde (Kiril, Yunan) collation'a bagli: ASCII disi
+      satirlar backfill sonrasi Python ile kontrol edilmeli (bkz. scripts/add_search_titles.py)
+
+    Ornek:
+        normalize_sql("title") -> "BTRIM(REGEXP_REPLACE(LOWER(...title...), ...), ' ')"
+    """
+    single = {**TURKISH_CHAR_MAP, **PUNCTUATION_MAP}
+    source = ''.join(single) + INVISIBLE_CHARS
+    target = ''.join(single.values())
+    sql = f"TRANSLATE({column}, {_sql_literal(source)}, {_sql_literal(target)})"
+    for char, replacement in MULTI_CHAR_MAP.items():
+        sql = f"REPLACE({sql}, {_sql_literal(char)}, {_sql_literal(replacement)})"
+    sql = f"REGEXP_REPLACE(normalize({sql}, NFKD), {_sql_literal(COMBINING_MARKS)}, '', 'g')"
+    sql = f"REGEXP_REPLACE(LOWER({sql}), {_sql_literal(f'[{WHITESPACE}]+')}, ' ', 'g')"
+    return f"BTRIM({sql}, ' ')"
 
 
 def turkish_match(text1: str, text2: str) -> bool:
     """
     Iki metni Turkce karakter farki olmadan karsilastirir.
-    
+
     Ornek:
         turkish_match("Başlangıç", "Baslangic") -> True
         turkish_match("Yıldızlararası", "yildizlararasi") -> True
@@ -55,7 +150,7 @@ def turkish_match(text1: str, text2: str) -> bool:
 def turkish_contains(haystack: str, needle: str) -> bool:
     """
     needle, haystack icinde var mi kontrol eder (Turkce karakter farki olmadan).
-    
+
     Ornek:
         turkish_contains("Başlangıç", "baslang") -> True
     """
@@ -0,0 +1,179 @@
+"""
+Cache Warmup - En Cok Aranan Basliklari Onceden Cache'e Yazma
+
+OGRENME NOTU - Soguk Cache Problemi:
+Deploy, /api/cache/flush veya IMDB import'u sonrasi Redis bos olur.
+Ilk dakikalarda her istek MISS -> DB'ye gider, hit ratio %0'dan baslar.
+
+Warmup ile en populer icerikler kullanici sormadan cache'e yazilir:
+- Oy sayisina gore ilk N film -> rating:<baslik> ve movie:<imdb_id>
+- Tum Turkce basliklar (search_title) -> rating:<turkce baslik>
+Netflix TR anasayfasindaki kartlarin buyuk cogunlugu bu kume icinde.
+
+Key'ler route'larla birebir ayni cozumleme ile hesaplanir (indeks varsa
+index.lookup, yoksa resolver.find_movies), boylece warmup'in yazdigi deger
+ile MISS'te hesaplanacak deger ayni olur.
+
+OGRENME NOTU - Rate Limit:
+Upstash istek/saniye ile ucretlendirir ve sinirlar. Warmup, pipeline'lari
+WARMUP_RATE (key/saniye) hizini asmayacak sekilde uyuyarak gonderir.
+
+OGRENME NOTU - TTL Jitter:
+Hepsi ayni TTL ile yazilirsa hepsi ayni saniyede expire olur ve
+bir saat sonra toplu MISS (thundering herd) yasanir. Her key'in
+TTL'i +-%10 rastgele kaydirilir.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+from app.config import settings
+from app.models.movie import Movie
+from app.models.movie_title import MovieTitle
+from app.schemas import MovieRating
+from app.utils.cache import cache_set_multi, make_rating_key, make_movie_key
+from app.utils.resolver import TitleQuery, find_movies
+from app.utils.title_index import get_title_index
+from app.utils.turkish import normalize_turkish
+
+logger = logging.getLogger(__name__)
+
+# Warmup durumu (/api/cache/stats'ta gosterilir)
+_warmup_state = {
+    "status": "idle",  # idle | running | done | failed
+    "total": 0,  # Yazilacak toplam key
+    "written": 0,  # Yazilan key
+    "started_at": None,
+    "finished_at": None,
+    "error": None,
+}
+_warmup_lock = threading.Lock()
+
+
+def get_warmup_state() -> dict:
+    """Warmup ilerlemesi (yuzde dahil)"""
+    state = dict(_warmup_state)
+    state["progress"] = round(state["written"] / state["total"] * 100, 1) if state["total"] else 0.0
+    return state
+
+
+def _jittered_ttls(keys: list[str]) -> dict[str, int]:
+    """Her key icin CACHE_TTL +-%10"""
+    base = settings.cache_ttl
+    spread = max(int(base * 0.1), 1)
+    return {key: base + random.randint(-spread, spread) for key in keys}
+
+
+def _collect_titles(db, top_n: int) -> tuple[list[str], list[dict]]:
+    """
+    Warmup kumesini belirle.
+
+    Returns:
+        (normalize basliklar, ilk N filmin payload'lari)
+    """
+    index = get_title_index()
+    if index is not None:
+        # index.movies votes DESC sirasiyla eklendi (dict sirayi korur)
+        top = list(index.movies.values())[:top_n]
+        aliases = [title for title, _ in index.aliases]
+    else:
+        movies = db.query(Movie).order_by(Movie.votes.desc().nullslast()).limit(top_n).all()
+        top = [MovieRating.model_validate(m).model_dump() for m in movies]
+        aliases = [
+            t for (t,) in db.query(MovieTitle.search_title)
+            .filter(MovieTitle.search_title.isnot(None)).distinct().all()
+        ]
+
+    titles = list(dict.fromkeys([normalize_turkish(m["title"]) for m in top] + aliases))
+    return titles, top
+
+
+def _resolve(db, titles: list[str]) -> dict[str, Optional[dict]]:
+    """Basliklari route'larla ayni sekilde cozumle: {baslik: payload}"""
+    index = get_title_index()
+    if index is not None:
+        return {t: index.lookup(t) for t in titles}
+
+    movies = find_movies(db, [TitleQuery(t) for t in titles])
+    return {q.title: MovieRating.model_validate(m).model_dump() for q, m in movies.items()}
+
+
+def run_warmup(top_n: Optional[int] = None) -> dict:
+    """
+    Warmup'i calistir (bloklayan). Ayni anda tek warmup calisir.
+
+    Args:
+        top_n: Oy sayisina gore ilk kac film, None ise WARMUP_TOP_N
+
+    Returns:
+        Son warmup durumu
+    """
+    from app.database import get_session_factory
+
+    if not _warmup_lock.acquire(blocking=False):
+        return get_warmup_state()
+
+    top_n = top_n or settings.warmup_top_n
+    batch_size = settings.warmup_batch_size
+    # Her batch en az bu kadar surmeli: batch_size / rate saniye
+    min_interval = batch_size / settings.warmup_rate if settings.warmup_rate > 0 else 0
+
+    _warmup_state.update(
+        status="running", total=0, written=0,
+        started_at=time.time(), finished_at=None, error=None,
+    )
+    db = get_session_factory()()
+    try:
+        titles, top = _collect_titles(db, top_n)
+        _warmup_state["total"] = len(titles) + len(top)
+        logger.info("Cache warmup basladi: %s baslik, %s film", len(titles), len(top))
+
+        # movie:<imdb_id> key'leri + rating:<baslik> key'leri, batch batch
+        jobs = [("movie", top[i:i + batch_size]) for i in range(0, len(top), batch_size)]
+        jobs += [("rating", titles[i:i + batch_size]) for i in range(0, len(titles), batch_size)]
+
+        for kind, chunk in jobs:
+            started = time.monotonic()
+            if kind == "movie":
+                entries = {make_movie_key(m["imdb_id"]): m for m in chunk}
+            else:
+                resolved = _resolve(db, chunk)
+                entries = {make_rating_key(t): m for t, m in resolved.items() if m}
+
+            # L1'e yazma: warmup key'leri process'in sicak L1 key'lerini LRU ile atmasin
+            if entries and not cache_set_multi(entries, ttls=_jittered_ttls(list(entries)), l1=False):
+                raise RuntimeError("Redis'e yazilamadi")
+            _warmup_state["written"] += len(chunk)
+
+            # Rate limit: batch'ler arasi en az min_interval saniye
+            elapsed = time.monotonic() - started
+            if elapsed < min_interval:
+                time.sleep(min_interval - elapsed)
+
+        _warmup_state["status"] = "done"
+        logger.info("Cache warmup tamamlandi: %s key", _warmup_state['written'])
+    except Exception as e:
+        _warmup_state.update(status="failed", error=str(e))
+        logger.warning("Cache warmup basarisiz: %s", e)
+    finally:
+        _warmup_state["finished_at"] = time.time()
+        db.close()
+        _warmup_lock.release()
+
+    return get_warmup_state()
+
+
+def start_warmup(top_n: Optional[int] = None) -> bool:
+    """
+    Warmup'i arka plan thread'inde baslat (startup ve admin endpoint'i icin).
+
+    Returns:
+        Baslatildiysa True, zaten calisiyorsa False
+    """
+    if _warmup_lock.locked():
+        return False
+    threading.Thread(target=run_warmup, args=(top_n,), daemon=True, name="cache-warmup").start()
+    return True
@@ -0,0 +1,258 @@
+"""
+API Benchmark Suite - Hot Path'lerin Offline Olcumu
+
+OGRENME NOTU:
+Tamamen offline calisir: SQLite fixture veritabani + fakeredis (veya --redis-url
+ile lokal Redis). Olculenler:
+- Mikro: normalize_turkish, make_rating_key (ns/islem)
+- Makro (TestClient ile tum FastAPI yigini, ag yok):
+    /api/rating        HIT (L1), HIT (L2 - L1 her istekte bosaltilir), MISS
+    /api/search        (cache key her istekte silinir -> en kotu durum)
+    /api/ratings/batch farkli batch boyutu x hit orani kombinasyonlari
+
+MISS olcumleri icin ilgili key'ler her istekten ONCE silinir (sure disinda),
+boylece ilk istek key'i cache'e yazsa da sonraki tur yine MISS olur.
+
+Sonuclar JSON olarak yazilir (--output); iki commit arasi karsilastirma:
+    python benchmarks/bench_api.py --output before.json
+    (degisiklik)
+    python benchmarks/bench_api.py --output after.json --compare before.json
+
+Kullanim (backend/ klasorunden, fakeredis gerekli: pip install -r benchmarks/requirements.txt):
+    python benchmarks/bench_api.py
+    python benchmarks/bench_api.py --no-title-index --batch-sizes 20 200 --hit-ratios 0 0.9
+    python benchmarks/bench_api.py --async --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fixtures import build_database, configure_env, use_fake_redis
+
+
+def summarize(name: str, samples: list[float], **params) -> dict:
+    """Sure orneklerinden (saniye) yuzdelik ozet"""
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)] * 1e6
+
+    mean = sum(ordered) / len(ordered)
+    return {
+        "name": name,
+        "params": params,
+        "n": len(ordered),
+        "mean_us": round(mean * 1e6, 2),
+        "p50_us": round(pct(0.50), 2),
+        "p95_us": round(pct(0.95), 2),
+        "p99_us": round(pct(0.99), 2),
+        "ops_per_sec": round(1 / mean, 1) if mean else None,
+    }
+
+
+def bench_micro(name: str, func, inputs: list, repeat: int = 5) -> dict:
+    """Fonksiyonu tum girdiler uzerinde calistir, islem basina sure"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            func(value)
+        samples.append((time.perf_counter() - start) / len(inputs))
+    result = summarize(name, samples, inputs=len(inputs), repeat=repeat)
+    result["ns_per_op"] = round(min(samples) * 1e9, 1)
+    return result
+
+
+def bench_requests(name: str, send, iterations: int, before=None, **params) -> dict:
+    """
+    send() ile istek at, sadece istegin suresini olc.
+
+    Args:
+        before: Her istekten once (sure disinda) cagrilir, i parametresi alir
+    """
+    samples = []
+    for i in range(iterations):
+        if before is not None:
+            before(i)
+        start = time.perf_counter()
+        response = send(i)
+        samples.append(time.perf_counter() - start)
+        if response.status_code >= 500:
+            raise RuntimeError(f"{name}: HTTP {response.status_code} {response.text[:200]}")
+    return summarize(name, samples, **params)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent, text=True
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(results: list[dict], meta: dict, baseline_path: Path):
+    """Baseline JSON'a gore p50 degisimini yazdir (+ yavaslama, - hizlanma)"""
+    baseline = json.loads(baseline_path.read_text())
+
+    def key(r):
+        return (r["name"], json.dumps(r["params"], sort_keys=True))
+
+    old = {key(r): r for r in baseline["results"]}
+    config_keys = ("movies", "title_index", "async_mode", "redis")
+    if any(baseline["meta"].get(k) != meta.get(k) for k in config_keys):
+        print("UYARI: Baseline farkli ayarlarla calistirilmis, sonuclar dogrudan karsilastirilamaz",
+              file=sys.stderr)
+    print(f"\nKarsilastirma ({baseline['meta'].get('commit')} -> bu calistirma), p50:", file=sys.stderr)
+    for r in results:
+        prev = old.get(key(r))
+        if not prev or not prev["p50_us"]:
+            continue
+        change = (r["p50_us"] - prev["p50_us"]) / prev["p50_us"] * 100
+        print(f"  {r['name']:<28}{json.dumps(r['params']):<40}{prev['p50_us']:>10.1f} -> "
+              f"{r['p50_us']:>10.1f} us  ({change:+.1f}%)", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API hot path benchmark (offline)")
+    parser.add_argument("--movies", type=int, default=5000, help="Fixture film sayisi")
+    parser.add_argument("--iterations", type=int, default=300, help="Tekil endpoint istek sayisi")
+    parser.add_argument("--batch-iterations", type=int, default=50)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[20, 50, 200])
+    parser.add_argument("--hit-ratios", type=float, nargs="+", default=[0.0, 0.5, 0.9, 1.0])
+    parser.add_argument("--no-title-index", action="store_true", help="Indeksi kapat (MISS'ler DB'ye gider)")
+    parser.add_argument("--async", dest="async_mode", action="store_true", help="ASYNC_MODE=true")
+    parser.add_argument("--redis-url", help="Lokal Redis (verilmezse fakeredis). DIKKAT: FLUSHDB yapilir")
+    parser.add_argument("--db", type=Path, help="SQLite dosyasi (varsayilan: gecici klasor)")
+    parser.add_argument("--output", type=Path, help="JSON sonuc dosyasi (verilmezse stdout)")
+    parser.add_argument("--compare", type=Path, help="Karsilastirilacak onceki JSON")
+    args = parser.parse_args()
+
+    db_path = args.db or Path(tempfile.mkdtemp(prefix="bench_")) / "bench.db"
+    configure_env(db_path, args.redis_url, not args.no_title_index, args.async_mode)
+    if not args.redis_url:
+        use_fake_redis()
+
+    # App import'lari env ayarlandiktan SONRA
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.redis import get_redis_client
+    from app.utils.cache import (
+        get_local_cache, cache_delete, cache_delete_multi, make_rating_key, make_search_key
+    )
+    from app.utils.turkish import normalize_turkish
+
+    movies, titles = build_database(db_path, args.movies)
+    # Hit ve miss havuzlari ayrik: ilk yari HIT icin isitilir, ikinci yari hep MISS
+    pool = [m["title"] for m in movies] + [t["title"] for t in titles]
+    half = len(pool) // 2
+    hit_pool, miss_pool = pool[:half], pool[half:]
+
+    results = []
+    results.append(bench_micro("normalize_turkish", normalize_turkish, [t["title"] for t in titles[:2000]]))
+    results.append(bench_micro("make_rating_key", make_rating_key, [t["title"] for t in titles[:2000]]))
+
+    with TestClient(app) as client:
+        client.post("/api/cache/flush")
+        l1 = get_local_cache()
+
+        def rating(title):
+            return lambda i: client.get("/api/rating", params={"title": title})
+
+        hot = hit_pool[0]
+        client.get("/api/rating", params={"title": hot})
+        results.append(bench_requests("rating_hit_l1", rating(hot), args.iterations))
+        if l1 is not None:
+            results.append(bench_requests(
+                "rating_hit_l2", rating(hot), args.iterations, before=lambda i: l1.clear()
+            ))
+
+        def miss_title(i):
+            return miss_pool[i % len(miss_pool)]
+
+        results.append(bench_requests(
+            "rating_miss",
+            lambda i: client.get("/api/rating", params={"title": miss_title(i)}),
+            args.iterations,
+            before=lambda i: cache_delete(make_rating_key(miss_title(i))),
+        ))
+
+        queries = [w.lower() for w in WORDS_FOR_SEARCH]
+        results.append(bench_requests(
+            "search",
+            lambda i: client.get("/api/search", params={"q": queries[i % len(queries)], "limit": 50}),
+            args.iterations,
+            before=lambda i: cache_delete(make_search_key(queries[i % len(queries)])),
+        ))
+
+        for size in args.batch_sizes:
+            for ratio in args.hit_ratios:
+                n_hit = round(size * ratio)
+                hits = hit_pool[:n_hit]
+                if hits:
+                    client.post("/api/ratings/batch", json={"titles": hits})
+
+                def batch_titles(i, n_hit=n_hit, hits=hits, size=size):
+                    start = (i * size) % max(len(miss_pool) - size, 1)
+                    return hits + miss_pool[start:start + size - n_hit]
+
+                def before(i, batch_titles=batch_titles, n_hit=n_hit):
+                    cache_delete_multi(make_rating_key(t) for t in batch_titles(i)[n_hit:])
+
+                results.append(bench_requests(
+                    "ratings_batch",
+                    lambda i, batch_titles=batch_titles: client.post(
+                        "/api/ratings/batch", json={"titles": batch_titles(i)}
+                    ),
+                    args.batch_iterations,
+                    before=before,
+                    batch_size=size,
+                    hit_ratio=ratio,
+                ))
+
+        if args.redis_url and get_redis_client() is not None:
+            client.post("/api/cache/flush")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "movies": args.movies,
+            "title_index": not args.no_title_index,
+            "async_mode": args.async_mode,
+            "redis": "local" if args.redis_url else "fakeredis",
+        },
+        "results": results,
+    }
+
+    for r in results:
+        print(f"{r['name']:<20}{json.dumps(r['params']):<40}p50 {r['p50_us']:>10.1f} us  "
+              f"p99 {r['p99_us']:>10.1f} us", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        print(text)
+
+    if args.compare:
+        compare(results, report["meta"], args.compare)
+
+
+# Arama sorgulari: fixture basliklarindaki kelimeler (Ingilizce + Turkce)
+WORDS_FOR_SEARCH = ["Dark", "Night", "Shadow", "Storm", "Karanlık", "Gölge", "Fırtına", "Yıldız"]
+
+
+if __name__ == "__main__":
+    main()
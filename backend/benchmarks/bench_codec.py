@@ -0,0 +1,72 @@
+"""
+Cache Codec Benchmark - json vs orjson vs msgpack
+
+OGRENME NOTU:
+Her cache HIT/MISS'te deger serilestirilir (encode) veya cozulur (decode).
+Bu script tek bir MovieRating kaydi ve 200'luk bir batch icin entry basina
+maliyeti (mikrosaniye) ve Redis'te kaplayacagi boyutu (byte) olcer.
+
+Kullanim (backend/ klasorunden):
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py --iterations 50000 --codecs json orjson
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.cache import get_codec
+
+SAMPLE = {
+    "imdb_id": "tt1375666",
+    "title": "Inception",
+    "year": 2010,
+    "rating": 8.8,
+    "votes": 2500000,
+    "genres": "Action,Adventure,Sci-Fi",
+}
+
+
+def bench(codec, value, iterations: int) -> dict:
+    """Tek degerin encode/decode suresi (mikrosaniye) ve boyutu"""
+    data = codec.encode(value)
+    encode = timeit.timeit(lambda: codec.encode(value), number=iterations)
+    decode = timeit.timeit(lambda: codec.decode(data), number=iterations)
+    return {
+        "encode_us": encode / iterations * 1e6,
+        "decode_us": decode / iterations * 1e6,
+        "bytes": len(data),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache codec benchmark")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--codecs", nargs="+", default=["json", "orjson", "msgpack"])
+    args = parser.parse_args()
+
+    batch = [dict(SAMPLE, imdb_id=f"tt{i:07d}") for i in range(200)]
+
+    print(f"{'codec':<10}{'payload':<10}{'encode us':>12}{'decode us':>12}{'bytes':>10}")
+    for name in args.codecs:
+        try:
+            codec = get_codec(name)
+        except ImportError as e:
+            print(f"{name:<10}kurulu degil ({e})")
+            continue
+
+        single = bench(codec, SAMPLE, args.iterations)
+        # Batch: 200 kayit tek deger olarak -> entry basina maliyet
+        many = bench(codec, batch, max(args.iterations // 200, 10))
+        for label, r, n in (("entry", single, 1), ("batch/200", many, len(batch))):
+            print(
+                f"{name:<10}{label:<10}{r['encode_us'] / n:>12.2f}"
+                f"{r['decode_us'] / n:>12.2f}{r['bytes'] / n:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Fuzzy Eslestirme Benchmark - Katalog Boyutuna Gore Arama Suresi
+
+OGRENME NOTU:
+Fuzzy asamanin iddiasi: arama suresi katalog boyutuyla degil, en nadir
+trigram listelerinin uzunluguyla ve FUZZY_MAX_CANDIDATES ile sinirli.
+Bu script farkli katalog boyutlarinda olcer:
+    build_ms / memory_mb   indeks kurulum suresi ve tracemalloc ile bellek
+    lookup (p50/p99 us)    sorgu turune gore:
+        canonical  noktalama + sezon etiketi ("Dark-Night-Star 12: Season 2")
+        typo1      1 harf hatasi (degistirme veya yer degisimi)
+        typo2      2 harf hatasi
+        miss       katalogda olmayan baslik (en kotu durum: tum adaylar dogrulanir)
+    accuracy               dogru filme eslesen sorgu orani (miss icin: None donme orani)
+
+Iki katalog turu (--catalogs):
+    fixture  benchmarks/fixtures.py basliklari: 20 kelimelik sozluk, basliklar sadece
+             sondaki sayi ile ayrisiyor -> trigram listeleri cok uzun (en kotu durum)
+    words    Rastgele uretilmis 20K kelimelik sozlukten 1-5 kelimelik basliklar
+             (gercek katalogun cesitliligine daha yakin)
+
+Kullanim (backend/ klasorunden):
+    python benchmarks/bench_fuzzy.py
+    python benchmarks/bench_fuzzy.py --sizes 1000 10000 100000 --queries 2000 --output fuzzy.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_api import git_commit, summarize
+from fixtures import make_fixture_rows
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+# Sahte kelimeler icin hece parcalari (bas sessiz + unlu + son sessiz)
+ONSETS = ["", "b", "br", "c", "ch", "d", "dr", "f", "g", "gr", "h", "j", "k", "l", "m",
+          "n", "p", "pr", "r", "s", "sh", "st", "t", "th", "tr", "v", "w", "z"]
+VOWELS = ["a", "e", "i", "o", "u", "ea", "ou", "ai", "y"]
+CODAS = ["", "", "n", "r", "s", "t", "l", "nd", "ck", "st"]
+
+
+def make_word_catalog(n_movies: int, seed: int, vocabulary: int = 20000) -> list[dict]:
+    """Heceli sahte kelimelerden cesitli basliklar (sik kelimeler Zipf benzeri daha sik secilir)"""
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(rng.randint(1, 3)))
+        for _ in range(vocabulary)
+    ]
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    movies = []
+    for i in range(n_movies):
+        n_words = rng.choice((1, 2, 2, 3, 3, 4, 5))
+        movies.append({
+            "imdb_id": f"tt{i:07d}",
+            "title": " ".join(rng.choices(words, weights, k=n_words)).title(),
+            "year": rng.randint(1960, 2024),
+            "votes": rng.randint(100, 3_000_000),
+        })
+    return movies
+
+
+def add_typos(title: str, n: int, rng: random.Random) -> str:
+    """Harf degistirme / bitisik harf yer degisimi ile n hata ekle (bosluklara dokunmaz)"""
+    chars = list(title)
+    positions = [i for i, c in enumerate(chars[:-1]) if c.isalpha() and chars[i + 1].isalpha()]
+    for pos in rng.sample(positions, n):
+        if rng.random() < 0.5:
+            chars[pos], chars[pos + 1] = chars[pos + 1], chars[pos]
+        else:
+            chars[pos] = rng.choice([c for c in ALPHABET if c != chars[pos].lower()])
+    return "".join(chars)
+
+
+def make_queries(movies: list[dict], n: int, rng: random.Random) -> dict[str, list[tuple[str, str]]]:
+    """Sorgu turu -> (sorgu, beklenen baslik) listesi (ayni baslikli filmler ayirt edilmez)"""
+    # Hata eklenecek kadar uzun basliklar (kisa basliklarda fuzzy zaten kapali)
+    eligible = [m for m in movies if len(m["title"]) > 8]
+    picks = [rng.choice(eligible) for _ in range(n)]
+    return {
+        "canonical": [(m["title"].replace(" ", "-") + ": Season 2", m["title"]) for m in picks],
+        "typo1": [(add_typos(m["title"], 1, rng), m["title"]) for m in picks],
+        "typo2": [(add_typos(m["title"], 2, rng), m["title"]) for m in picks],
+        "miss": [("".join(rng.choice(ALPHABET) for _ in range(14)), None) for _ in picks],
+    }
+
+
+def bench_size(catalog: str, size: int, n_queries: int, seed: int) -> list[dict]:
+    from app.utils.fuzzy_index import build_fuzzy_index, canonical_title, fuzzy_resolve, set_fuzzy_index
+    from app.utils.turkish import normalize_turkish
+
+    if catalog == "fixture":
+        movies, titles = make_fixture_rows(size, seed)
+    else:
+        movies, titles = make_word_catalog(size, seed), []
+    payloads = {m["imdb_id"]: m for m in sorted(movies, key=lambda m: -m["votes"])}
+
+    aliases = [(normalize_turkish(t["title"]), t["imdb_id"]) for t in titles]
+    start = time.perf_counter()
+    index = build_fuzzy_index(payloads, aliases)
+    build_ms = (time.perf_counter() - start) * 1000
+    # Bellek ayri bir kurulumda olculur (tracemalloc kurulumu birkac kat yavaslatir)
+    tracemalloc.start()
+    probe = build_fuzzy_index(payloads, aliases)
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    del probe
+    set_fuzzy_index(index)
+
+    rng = random.Random(seed)
+    results = []
+    for kind, queries in make_queries(movies, n_queries, rng).items():
+        samples, correct = [], 0
+        for query, expected in queries:
+            start = time.perf_counter()
+            match = fuzzy_resolve(query)
+            samples.append(time.perf_counter() - start)
+            got = canonical_title(match.movie["title"]) if match else None
+            correct += got == (canonical_title(expected) if expected else None)
+        result = summarize("fuzzy_lookup", samples, catalog=catalog, size=size, query=kind)
+        result["accuracy"] = round(correct / len(queries), 3)
+        results.append(result)
+
+    stats = index.stats()
+    print(f"{catalog:<8}{size:>7}: build {build_ms:>8.0f} ms  bellek {memory_mb:>7.1f} MB  "
+          f"{stats['terms']} key, {stats['posting_lists']} liste", file=sys.stderr)
+    for r in results:
+        print(f"    {r['params']['query']:<10} p50 {r['p50_us']:>8.1f} us  p99 {r['p99_us']:>8.1f} us  "
+              f"dogruluk {r['accuracy']:.1%}", file=sys.stderr)
+    return [{
+        "name": "fuzzy_build", "params": {"catalog": catalog, "size": size},
+        "build_ms": round(build_ms, 1), "memory_mb": round(memory_mb, 1), **stats,
+    }] + results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy eslestirme benchmark")
+    parser.add_argument("--catalogs", nargs="+", choices=["fixture", "words"], default=["fixture", "words"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=1000, help="Sorgu turu basina sorgu sayisi")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="JSON sonuc dosyasi (verilmezse stdout)")
+    args = parser.parse_args()
+
+    results = []
+    for catalog in args.catalogs:
+        for size in args.sizes:
+            results.extend(bench_size(catalog, size, args.queries, args.seed))
+
+    from app.config import settings
+    text = json.dumps({
+        "meta": {
+            "commit": git_commit(),
+            "max_distance": settings.fuzzy_max_distance,
+            "max_candidates": settings.fuzzy_max_candidates,
+            "scan_budget": settings.fuzzy_scan_budget,
+            "min_confidence": settings.fuzzy_min_confidence,
+        },
+        "results": results,
+    }, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
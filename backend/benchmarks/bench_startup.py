@@ -0,0 +1,119 @@
+"""
+Cold Start Benchmark - Import Suresi ve Ilk Cevaba Kadar Gecen Sure
+
+OGRENME NOTU:
+Serverless'ta (Vercel) her yeni instance su yolu odeyerek ilk istegi cevaplar:
+    python baslar -> app.main import -> startup event'leri -> ilk istek
+Bu script her olcumu TAZE bir Python process'inde yapar (import cache'i yok) ve
+LAZY_INIT=false/true icin karsilastirir:
+    import_ms          app.main import suresi
+    startup_ms         startup event'leri (Redis ping, indeks yukleme)
+    first_response_ms  import basindan ilk /api/rating cevabina kadar toplam sure
+
+--redis-url ile gercek (veya erisilemeyen) bir Redis verilebilir; verilmezse fakeredis.
+Erisilemeyen Redis'te LAZY_INIT=false ping'in connect timeout'unu bekler.
+
+Kullanim (backend/ klasorunden):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --output startup.json
+    python benchmarks/bench_startup.py --redis-url redis://10.255.255.1:6379
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Child process: sureleri olcup JSON olarak stdout'a yazar
+CHILD = r"""
+import json, sys, time
+sys.path.insert(0, {backend!r})
+sys.path.insert(0, {benchmarks!r})
+if {fake_redis!r}:
+    from fixtures import use_fake_redis
+    use_fake_redis()
+t_fake = time.perf_counter()
+from app.main import app
+t_import = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    t_startup = time.perf_counter()
+    response = client.get("/api/rating", params={{"title": {title!r}}})
+    t_first = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (t_import - t_fake) * 1000,
+    "startup_ms": (t_startup - t_import) * 1000,
+    # fakeredis kurulumu olcume dahil degil
+    "first_response_ms": (t_first - t_fake) * 1000,
+    "status": response.status_code,
+}}))
+"""
+
+
+def run_child(env: dict, title: str, fake_redis: bool) -> dict:
+    code = CHILD.format(
+        backend=str(BACKEND_DIR),
+        benchmarks=str(Path(__file__).parent),
+        fake_redis=fake_redis,
+        title=title,
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def median(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Mod basina process sayisi")
+    parser.add_argument("--movies", type=int, default=20000, help="Fixture film sayisi (indeks boyutu)")
+    parser.add_argument("--redis-url", help="Redis (verilmezse fakeredis)")
+    parser.add_argument("--output", type=Path, help="JSON sonuc dosyasi (verilmezse stdout)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from fixtures import configure_env
+
+    db_path = Path(tempfile.mkdtemp(prefix="bench_startup_")) / "bench.db"
+    configure_env(db_path, args.redis_url)
+    # Fixture'i ayri bir process'te olustur (bu process app import etmesin)
+    subprocess.run([
+        sys.executable, "-c",
+        f"import sys; sys.path[:0] = [{str(BACKEND_DIR)!r}, {str(Path(__file__).parent)!r}];"
+        f"from fixtures import build_database; build_database({str(db_path)!r}, {args.movies})",
+    ], env=dict(os.environ), check=True)
+
+    from fixtures import make_fixture_rows
+    title = make_fixture_rows(1)[1][0]["title"]
+
+    results = []
+    for lazy in (False, True):
+        env = dict(os.environ, LAZY_INIT=str(lazy).lower())
+        runs = [run_child(env, title, fake_redis=not args.redis_url) for _ in range(args.runs)]
+        summary = {"lazy_init": lazy, "runs": runs}
+        for metric in ("import_ms", "startup_ms", "first_response_ms"):
+            summary[f"{metric}_median"] = round(median([r[metric] for r in runs]), 1)
+        results.append(summary)
+        print(f"LAZY_INIT={str(lazy).lower():<6} import {summary['import_ms_median']:>8.1f} ms  "
+              f"startup {summary['startup_ms_median']:>8.1f} ms  "
+              f"ilk cevap {summary['first_response_ms_median']:>8.1f} ms", file=sys.stderr)
+
+    text = json.dumps({"movies": args.movies, "redis": args.redis_url or "fakeredis", "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark Fixture'lari - Offline SQLite Veritabani ve Sahte Redis
+
+OGRENME NOTU:
+Benchmark'lar canli Supabase/Upstash'e baglanirsa olculen sey ag gecikmesi olur
+ve sonuclar calistirmadan calistirmaya degisir. Burada:
+- Veritabani: Sabit seed ile uretilen SQLite dosyasi (her calistirmada ayni veri)
+- Redis: fakeredis (process ici) veya --redis-url ile lokal bir Redis
+Boylece iki commit arasindaki fark kodun farki olur, ortamin degil.
+
+Bu modul app import EDILMEDEN once configure_env() ile ayarlari env'e yazar
+(app.config import aninda Settings() okur).
+"""
+
+import os
+import random
+from pathlib import Path
+
+# Sentetik baslik parcalari (Turkce karakterler normalize_turkish'i da calistirsin)
+WORDS = [
+    "Dark", "Night", "Last", "Secret", "Lost", "City", "Dream", "Winter", "Red", "Silent",
+    "Storm", "Road", "King", "Ghost", "Blue", "River", "Fire", "Shadow", "Island", "Star",
+]
+TR_WORDS = [
+    "Karanlık", "Gece", "Son", "Gizli", "Kayıp", "Şehir", "Rüya", "Kış", "Kırmızı", "Sessiz",
+    "Fırtına", "Yol", "Kral", "Hayalet", "Mavi", "Nehir", "Ateş", "Gölge", "Ada", "Yıldız",
+]
+GENRES = ["Action", "Drama", "Comedy", "Sci-Fi", "Thriller", "Romance", "Horror"]
+
+
+def make_fixture_rows(n_movies: int, seed: int = 42) -> tuple[list[dict], list[dict]]:
+    """
+    Deterministik film ve Turkce baslik satirlari uret.
+
+    Returns:
+        (movies, movie_titles) - her filmin bir Turkce basligi var
+    """
+    rng = random.Random(seed)
+    movies, titles = [], []
+    for i in range(n_movies):
+        picks = rng.sample(range(len(WORDS)), 3)
+        suffix = f" {i}"  # Basliklar benzersiz olsun
+        movies.append({
+            "imdb_id": f"tt{i:07d}",
+            "title": " ".join(WORDS[p] for p in picks) + suffix,
+            "year": rng.randint(1960, 2024),
+            "rating": round(rng.uniform(1, 10), 1),
+            "votes": rng.randint(100, 3_000_000),
+            "genres": ",".join(rng.sample(GENRES, 2)),
+            "title_type": "movie",
+        })
+        titles.append({
+            "imdb_id": f"tt{i:07d}",
+            "title": " ".join(TR_WORDS[p] for p in picks) + suffix,
+            "region": "TR",
+            "language": "tr",
+        })
+    return movies, titles
+
+
+def configure_env(db_path: Path, redis_url: str = None, title_index: bool = True, async_mode: bool = False):
+    """App import edilmeden once ayarlari env'e yaz"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["CACHE_ENABLED"] = "true"
+    os.environ["REDIS_URL"] = redis_url or "redis://fake"
+    os.environ["TITLE_INDEX_ENABLED"] = str(title_index).lower()
+    os.environ["SEARCH_INDEX_ENABLED"] = str(title_index).lower()
+    os.environ["ASYNC_MODE"] = str(async_mode).lower()
+    os.environ["WARMUP_ON_STARTUP"] = "false"
+    os.environ["LOG_LEVEL"] = "WARNING"
+
+
+def use_fake_redis():
+    """
+    redis.from_url'i fakeredis ile degistir (process ici, ag yok).
+
+    Sync ve async client ayni FakeServer'i paylasir, boylece ASYNC_MODE'da
+    admin endpoint'leri (sync) ve route'lar (async) ayni veriyi gorur.
+    """
+    import fakeredis
+    import redis
+    import redis.asyncio
+
+    server = fakeredis.FakeServer()
+    redis.from_url = lambda url, **kw: fakeredis.FakeRedis(
+        server=server, decode_responses=kw.get("decode_responses", False)
+    )
+    redis.asyncio.from_url = lambda url, **kw: fakeredis.FakeAsyncRedis(
+        server=server, decode_responses=kw.get("decode_responses", False)
+    )
+
+
+def build_database(db_path: Path, n_movies: int, seed: int = 42) -> tuple[list[dict], list[dict]]:
+    """
+    SQLite fixture veritabanini (yeniden) olustur. configure_env'den sonra cagrilmali.
+
+    Returns:
+        make_fixture_rows ciktisi (benchmark'lar sorgu basliklarini buradan secer)
+    """
+    from app.database import get_engine
+    from app.models import Base, Movie, MovieTitle
+    from app.utils.turkish import normalize_turkish
+
+    engine = get_engine()
+    movies, titles = make_fixture_rows(n_movies, seed)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Movie.__table__.insert(), [
+            {**m, "search_title": normalize_turkish(m["title"])} for m in movies
+        ])
+        conn.execute(MovieTitle.__table__.insert(), [
+            {**t, "search_title": normalize_turkish(t["title"])} for t in titles
+        ])
+    return movies, titles
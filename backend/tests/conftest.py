@@ -0,0 +1,42 @@
+"""
+Test Ortami - SQLite + fakeredis (bkz. benchmarks/fixtures.py)
+
+OGRENME NOTU:
+app.config import aninda Settings() okur. Bu yuzden env, herhangi bir test
+modulu app'i import etmeden ONCE (conftest yuklenirken) ayarlanir.
+Testler canli Supabase/Upstash'e baglanmaz.
+
+Kullanim (backend/ klasorunden):
+    pip install -r tests/requirements.txt
+    python -m pytest tests
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).parent.parent
+sys.path[:0] = [str(BACKEND), str(BACKEND / "benchmarks")]
+
+from fixtures import configure_env, use_fake_redis  # noqa: E402
+
+DB_PATH = Path(tempfile.mkdtemp()) / "test.db"
+configure_env(DB_PATH)
+use_fake_redis()
+
+
+@pytest.fixture
+def redis_client():
+    """Temiz fakeredis + bos L1 (her test kendi verisiyle baslar)"""
+    from app.redis import init_redis
+    from app.utils.cache import get_local_cache
+
+    client = init_redis()
+    client.flushdb()
+    local = get_local_cache()
+    if local is not None:
+        local.clear()
+    yield client
+    client.flushdb()
@@ -0,0 +1,201 @@
+"""
+Cache testleri: L1 LRU/TTL, negatif cache namespace'i, pipeline ile toplu yazma, codec'ler.
+"""
+
+import pytest
+
+from app.config import settings
+from app.utils import cache
+from app.utils.cache import (
+    LocalCache, NEGATIVE_PREFIX, cache_delete_multi, cache_get, cache_get_multi,
+    cache_lookup, cache_set, cache_set_multi, cache_set_negative, get_codec,
+)
+
+PAYLOAD = {"imdb_id": "tt1375666", "title": "Başlangıç", "year": 2010, "rating": 8.8,
+           "votes": 2600000, "genres": None, "aliases": ["Inception", "İnsepşın"]}
+
+
+def _ttl(client, key):
+    """Kalan TTL (saniye, ms hassasiyetinde; TTL komutu asagi yuvarlar)"""
+    return client.pttl(key) / 1000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+# ---------- L1: LocalCache ----------
+
+def test_local_cache_evicts_least_recently_used():
+    l1 = LocalCache(max_size=2, ttl=60)
+    l1.set("a", 1)
+    l1.set("b", 2)
+    assert l1.get("a") == (True, 1)  # a en son kullanilan oldu
+    l1.set("c", 3)
+
+    assert l1.get("b") == (False, None)
+    assert l1.get("a") == (True, 1)
+    assert l1.get("c") == (True, 3)
+    assert l1.stats["evictions"] == 1
+    assert len(l1) == 2
+
+
+def test_local_cache_expires_entries(clock):
+    l1 = LocalCache(max_size=10, ttl=60)
+    l1.set("short", "x", ttl=5)
+    l1.set("long", "y")
+
+    clock.now += 6
+    assert l1.get("short") == (False, None)
+    assert l1.get("long") == (True, "y")
+    assert l1.stats["expired"] == 1
+
+    clock.now += 60
+    assert l1.get("long") == (False, None)
+
+
+def test_local_cache_ttl_never_exceeds_l1_ttl(clock):
+    l1 = LocalCache(max_size=10, ttl=60)
+    l1.set("k", "v", ttl=3600)
+    clock.now += 61
+    assert l1.get("k") == (False, None)
+
+
+def test_local_cache_stores_none_distinct_from_missing():
+    l1 = LocalCache(max_size=10, ttl=60)
+    l1.set("k", None)
+    assert l1.get("k") == (True, None)
+    assert l1.get("other") == (False, None)
+
+
+# ---------- L1 + L2 okuma/yazma ----------
+
+def test_cache_set_then_lookup_from_l1_and_l2(redis_client):
+    assert cache_lookup("rating:inception") == (False, None)
+
+    cache_set("rating:inception", PAYLOAD)
+    assert cache_lookup("rating:inception") == (True, PAYLOAD)
+    assert _ttl(redis_client, "rating:inception") == pytest.approx(settings.cache_ttl, abs=2)
+
+    # L1 bosaltilinca Redis'ten okunur ve L1 tekrar dolar
+    cache.get_local_cache().clear()
+    assert cache_get("rating:inception") == PAYLOAD
+    assert cache.get_local_cache().get("rating:inception") == (True, PAYLOAD)
+
+
+def test_negative_cache_uses_separate_namespace(redis_client):
+    cache_set_negative("rating:nope")
+
+    assert redis_client.exists(f"{NEGATIVE_PREFIX}rating:nope")
+    assert not redis_client.exists("rating:nope")
+    assert _ttl(redis_client, f"{NEGATIVE_PREFIX}rating:nope") == pytest.approx(settings.negative_cache_ttl, abs=2)
+
+    # Negatif kayit: HIT ama deger None; include_negative olmadan MISS
+    assert cache_lookup("rating:nope") == (True, None)
+    cache.get_local_cache().clear()
+    assert cache_lookup("rating:nope") == (True, None)
+    cache.get_local_cache().clear()
+    assert cache_get("rating:nope") is None
+    assert cache_get_multi(["rating:nope"]) == {}
+
+
+def test_negative_entry_does_not_shadow_positive_key(redis_client):
+    cache_set_negative("rating:dune|1800|")
+    cache_set("rating:dune", PAYLOAD)
+    assert cache_lookup("rating:dune") == (True, PAYLOAD)
+    assert cache_lookup("rating:dune|1800|") == (True, None)
+
+
+def test_cache_set_multi_uses_one_pipeline(redis_client, monkeypatch):
+    executed = []
+    original = redis_client.pipeline
+
+    def pipeline(*args, **kwargs):
+        pipe = original(*args, **kwargs)
+        execute = pipe.execute
+        pipe.execute = lambda: executed.append(len(pipe.command_stack)) or execute()
+        return pipe
+
+    monkeypatch.setattr(redis_client, "pipeline", pipeline)
+    ok = cache_set_multi(
+        {"rating:a": {"v": 1}, "rating:b": {"v": 2}},
+        ttls={"rating:b": 120},
+        negative_keys=["rating:c"],
+    )
+
+    assert ok
+    assert executed == [3]
+    assert _ttl(redis_client, "rating:a") == pytest.approx(settings.cache_ttl, abs=2)
+    assert _ttl(redis_client, "rating:b") == pytest.approx(120, abs=2)
+    assert redis_client.exists(f"{NEGATIVE_PREFIX}rating:c")
+    assert cache_get_multi(["rating:a", "rating:b", "rating:c"], include_negative=True) == {
+        "rating:a": {"v": 1}, "rating:b": {"v": 2}, "rating:c": None,
+    }
+
+
+def test_cache_set_multi_without_l1(redis_client):
+    cache_set_multi({"rating:warm": {"v": 1}}, l1=False)
+    assert cache.get_local_cache().get("rating:warm") == (False, None)
+    assert cache_get("rating:warm") == {"v": 1}
+
+
+def test_cache_delete_multi_removes_positive_and_negative(redis_client):
+    cache_set("movie:tt1", {"v": 1})
+    cache_set_negative("rating:x")
+    deleted = cache_delete_multi(["movie:tt1", "rating:x", "movie:tt1"])
+
+    assert deleted == 2
+    assert cache_lookup("movie:tt1") == (False, None)
+    assert cache_lookup("rating:x") == (False, None)
+
+
+def test_undecodable_value_is_a_miss(redis_client):
+    redis_client.set("rating:broken", b"\xff\x00not-json")
+    assert cache_get("rating:broken") is None
+
+
+def test_stats_count_hits_and_misses(redis_client):
+    before = cache.get_cache_stats()
+    cache_lookup("rating:stat")
+    cache_set("rating:stat", {"v": 1})
+    cache_lookup("rating:stat")
+    after = cache.get_cache_stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+
+# ---------- Codec'ler ----------
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_codec_round_trip(name):
+    codec = get_codec(name)
+    data = codec.encode(PAYLOAD)
+    assert isinstance(data, bytes)
+    assert codec.decode(data) == PAYLOAD
+
+
+def test_json_and_orjson_are_interchangeable():
+    json_codec, orjson_codec = get_codec("json"), get_codec("orjson")
+    assert orjson_codec.decode(json_codec.encode(PAYLOAD)) == PAYLOAD
+    assert json_codec.decode(orjson_codec.encode(PAYLOAD)) == PAYLOAD
+
+
+def test_msgpack_cannot_read_json_entries():
+    with pytest.raises(Exception):
+        get_codec("msgpack").decode(get_codec("orjson").encode(PAYLOAD))
+
+
+def test_unknown_codec_raises():
+    with pytest.raises(ValueError):
+        get_codec("pickle")
@@ -0,0 +1,66 @@
+"""
+Fuzzy indeks regresyon testleri: numarali devam filmleri ayri key'lerde kalmali,
+sezon etiketi sadece dizilerde atilmali.
+"""
+
+from app.utils.fuzzy_index import FuzzyIndex, canonical_title
+
+
+def _movie(imdb_id, title, year, votes, title_type="movie"):
+    return {"imdb_id": imdb_id, "title": title, "year": year, "rating": 8.0,
+            "votes": votes, "title_type": title_type}
+
+
+def _build(*movies):
+    # Oy sayisina gore azalan sirada eklenir (build_fuzzy_index ile ayni)
+    ordered = sorted(movies, key=lambda m: -m["votes"])
+    index = FuzzyIndex({m["imdb_id"]: m for m in ordered})
+    for movie in ordered:
+        index.add(movie["title"], movie["imdb_id"])
+    return index
+
+
+SEQUELS = _build(
+    _movie("tt0266697", "Kill Bill: Vol. 1", 2003, 1200000),
+    _movie("tt0378194", "Kill Bill: Vol. 2", 2004, 800000),
+    _movie("tt1201607", "Harry Potter and the Deathly Hallows: Part 2", 2011, 950000),
+    _movie("tt0926084", "Harry Potter and the Deathly Hallows: Part 1", 2010, 600000),
+    _movie("tt4574334", "Stranger Things", 2016, 1300000, "tvSeries"),
+)
+
+
+def test_canonical_title_keeps_part_and_volume_numbers():
+    assert canonical_title("Kill Bill: Vol. 2") == "kill bill vol 2"
+    assert canonical_title("Dune: Part Two") == "dune part two"
+    assert canonical_title("Harry Potter and the Deathly Hallows - Part 1").endswith("part 1")
+    assert canonical_title("Stranger Things: Sezon 4") == "stranger things"
+    assert canonical_title("Stranger Things: Sezon 4", strip_season=False) == "stranger things sezon 4"
+
+
+def test_numbered_sequels_resolve_to_their_own_entry():
+    for query, expected in [
+        ("Kill Bill Vol 2", "tt0378194"),
+        ("Kill Bill: Vol. 1", "tt0266697"),
+        ("Harry Potter and the Deathly Hallows - Part 1", "tt0926084"),
+        ("Harry Potter and the Deathly Hallows: Part 2", "tt1201607"),
+    ]:
+        match = SEQUELS.lookup(query)
+        assert match is not None and match.movie["imdb_id"] == expected, query
+        assert match.confidence == 1.0
+
+
+def test_numbered_sequels_with_movie_kind():
+    match = SEQUELS.lookup("Kill Bill Vol 2", kind="movie")
+    assert match.movie["imdb_id"] == "tt0378194"
+
+
+def test_season_label_stripped_for_series_only():
+    assert SEQUELS.lookup("Stranger Things: Sezon 4").movie["imdb_id"] == "tt4574334"
+    assert SEQUELS.lookup("Stranger Things 2. Sezon", kind="series").movie["imdb_id"] == "tt4574334"
+    assert SEQUELS.lookup("Stranger Things: Sezon 4", kind="movie") is None
+
+
+def test_movie_titled_like_a_season_keeps_its_key():
+    index = _build(_movie("tt0000001", "Summer Season 2", 2020, 1000))
+    assert "summer season 2" in index.term_ids
+    assert index.lookup("Summer Season 2", kind="movie").movie["imdb_id"] == "tt0000001"
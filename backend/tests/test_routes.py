@@ -0,0 +1,206 @@
+"""
+Route testleri: HTTP cache (ETag / 304) ve NDJSON stream'i.
+
+Her test sync (movies) ve async (movies_async) route'lari ile, indeks acik ve
+kapali (DB yolu) calisir.
+"""
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from conftest import DB_PATH
+from fixtures import build_database
+
+from app.config import settings
+from app.redis import init_async_redis
+from app.routes import movies, movies_async
+from app.utils import fuzzy_index, search_index, title_index
+from app.utils.cache import cache_set, make_rating_key
+from app.utils.http_cache import body_etag
+
+MISSING = "Boyle Bir Film Yok 12345"
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    movies_rows, _ = build_database(DB_PATH, 40)
+    return movies_rows
+
+
+@pytest.fixture(params=["sync", "async"])
+def client(request, catalog, redis_client, monkeypatch):
+    """app.main'deki secimin karsiligi: ASYNC_MODE'a gore movies veya movies_async"""
+    app = FastAPI(default_response_class=ORJSONResponse)
+    if request.param == "async":
+        monkeypatch.setattr(settings, "async_mode", True)
+        app.include_router(movies_async.router, prefix="/api")
+        app.add_event_handler("startup", init_async_redis)
+    else:
+        app.include_router(movies.router, prefix="/api")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(params=["index", "db"])
+def index_mode(request, catalog, monkeypatch):
+    """Indeks acik: katalog hafizada (versiyon ETag'i). Kapali: DB yolu (govde hash'i)."""
+    monkeypatch.setattr(title_index, "_title_index", None)
+    monkeypatch.setattr(search_index, "_search_index", None)
+    monkeypatch.setattr(fuzzy_index, "_fuzzy_index", None)
+    if request.param == "index":
+        title_index.load_title_index()
+    return request.param
+
+
+def _title(catalog, i=0):
+    return catalog[i]["title"]
+
+
+# ---------- HTTP cache: ETag / 304 ----------
+
+def test_miss_gets_version_etag_and_304(client, index_mode, catalog):
+    resp = client.get("/api/rating", params={"title": _title(catalog)})
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Cache"] == "MISS"
+    assert "max-age" in resp.headers["Cache-Control"]
+    etag = resp.headers["ETag"]
+    if index_mode == "index":
+        assert etag == f'W/"v1-{title_index.get_title_index().version}"'
+    else:
+        assert etag == body_etag(resp.content)
+
+    again = client.get("/api/rating", params={"title": _title(catalog)}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+    # Versiyon biliniyorsa cache'e bile gidilmez
+    expected = "NOT_MODIFIED" if index_mode == "index" else "HIT"
+    assert again.headers["X-Cache"] == expected
+
+
+def test_hit_gets_body_hash_etag(client, index_mode, catalog):
+    params = {"title": _title(catalog, 1)}
+    client.get("/api/rating", params=params)
+
+    resp = client.get("/api/rating", params=params)
+    assert resp.headers["X-Cache"] == "HIT"
+    assert resp.headers["ETag"] == body_etag(resp.content)
+
+    again = client.get("/api/rating", params=params, headers={"If-None-Match": resp.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.headers["X-Cache"] == "HIT"
+
+
+def test_stale_hit_does_not_get_version_etag(client, index_mode, catalog):
+    # Eski veri setinden kalmis (CACHE_TTL icinde) kayit: yeni versiyonun ETag'ini tasimamali
+    title = _title(catalog, 2)
+    stale = {**catalog[2], "rating": 1.0}
+    cache_set(make_rating_key(title), stale)
+
+    resp = client.get("/api/rating", params={"title": title})
+    assert resp.headers["X-Cache"] == "HIT"
+    assert resp.json()["rating"] == 1.0
+    assert resp.headers["ETag"].startswith('W/"h1-')
+
+
+def test_not_found_has_no_etag_or_cache_control(client, index_mode):
+    # Ikinci istek negatif cache'ten (HIT) doner; ikisi de HTTP cache'e girmemeli
+    for expected in ("MISS", "HIT"):
+        resp = client.get("/api/rating", params={"title": MISSING})
+        assert resp.status_code == 404
+        assert resp.headers["X-Cache"] == expected
+        assert "ETag" not in resp.headers
+        assert "Cache-Control" not in resp.headers
+
+    resp = client.get("/api/movie/tt9999999")
+    assert resp.status_code == 404
+    assert "ETag" not in resp.headers
+    assert "Cache-Control" not in resp.headers
+
+
+def test_movie_by_id_etag(client, index_mode, catalog):
+    path = f"/api/movie/{catalog[3]['imdb_id']}"
+    resp = client.get(path)
+    assert resp.status_code == 200
+    assert resp.json()["imdb_id"] == catalog[3]["imdb_id"]
+
+    again = client.get(path, headers={"If-None-Match": resp.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_stale_etag_gets_full_body(client, index_mode, catalog):
+    params = {"title": _title(catalog, 4)}
+    resp = client.get("/api/rating", params=params, headers={"If-None-Match": 'W/"v1-eski"'})
+    assert resp.status_code == 200
+    assert resp.json()["title"] == _title(catalog, 4)
+
+
+# ---------- NDJSON stream ----------
+
+def _stream(client, titles):
+    resp = client.post("/api/ratings/stream", json={"titles": titles})
+    assert resp.status_code == 200
+    assert resp.headers["Content-Type"].startswith("application/x-ndjson")
+    assert resp.headers["Cache-Control"] == "no-store"
+    assert resp.content.endswith(b"\n")
+    return [orjson.loads(line) for line in resp.content.split(b"\n")[:-1]]
+
+
+def test_stream_framing_and_summary(client, index_mode, catalog, monkeypatch):
+    monkeypatch.setattr(settings, "batch_stream_chunk_size", 2)
+    titles = [_title(catalog, i) for i in range(5)] + [MISSING, {"title": MISSING, "year": 2001}]
+
+    lines = _stream(client, titles)
+
+    *rows, done = lines
+    assert done == {"done": True, "found": 5, "not_found": 2}
+    assert [row["cache"] for row in rows] == ["MISS"] * 7
+    by_key = {row["key"]: row["result"] for row in rows}
+    assert set(by_key) == {t.lower() for t in titles[:6]} | {f"{MISSING.lower()}|2001|"}
+    assert by_key[MISSING.lower()] is None
+    assert by_key[_title(catalog).lower()]["title"] == _title(catalog)
+
+
+def test_stream_hits_come_first(client, index_mode, catalog):
+    first, second = _title(catalog, 5), _title(catalog, 6)
+    _stream(client, [second])  # ikinci baslik cache'e yazilir
+
+    rows = _stream(client, [first, second])[:-1]
+    assert [(row["key"], row["cache"]) for row in rows] == [
+        (second.lower(), "HIT"), (first.lower(), "MISS")
+    ]
+
+
+def test_stream_duplicate_titles_share_one_key(client, index_mode, catalog):
+    title = _title(catalog, 7)
+    lines = _stream(client, [title, title.upper(), {"title": title, "year": catalog[7]["year"]}])
+
+    *rows, done = lines
+    assert done == {"done": True, "found": 3, "not_found": 0}
+    assert len(rows) == 3
+    assert {row["result"]["imdb_id"] for row in rows} == {catalog[7]["imdb_id"]}
+
+
+def test_stream_rejects_empty_and_oversized(client):
+    assert client.post("/api/ratings/stream", json={"titles": []}).status_code == 422
+    too_many = ["x"] * (settings.batch_stream_max_titles + 1)
+    assert client.post("/api/ratings/stream", json={"titles": too_many}).status_code == 422
+
+
+# ---------- Arama ----------
+
+def test_search_sends_x_cache(client, index_mode, catalog):
+    params = {"q": _title(catalog, 8), "limit": 5}
+    first = client.get("/api/search", params=params)
+    second = client.get("/api/search", params=params)
+
+    assert first.status_code == 200
+    assert first.json()["results"][0]["title"] == _title(catalog, 8)
+    # Indeks yolu her istekte hafizadan cozer (MISS); DB yolu ikinci istekte search cache'inden
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == ("MISS" if index_mode == "index" else "HIT")
+    assert second.json() == first.json()
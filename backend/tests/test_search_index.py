@@ -0,0 +1,81 @@
+"""
+Arama indeksi testleri: sonuclar rating sirasinda, tarama `limit` sonucta durur,
+sonuclar tam taramayla (LIKE '%q%' karsiligi) ayni.
+"""
+
+import random
+
+import pytest
+
+from app.utils.search_index import build_search_index
+from app.utils.turkish import normalize_turkish
+
+WORDS = ["dark", "night", "red", "the", "ask", "gece", "karanlik", "yol", "ar", "kara"]
+
+
+def _catalog(n=500, seed=7):
+    rng = random.Random(seed)
+    movies, aliases = {}, []
+    for i in range(n):
+        imdb_id = f"tt{i:07d}"
+        title = " ".join(rng.sample(WORDS, 3)) + f" {i}"
+        movies[imdb_id] = {"imdb_id": imdb_id, "title": title, "year": 2000,
+                           "rating": rng.choice([None, 5.5, 7.0, 7.0, 8.1, 9.0]),
+                           "votes": rng.randint(0, 5000)}
+        if i % 3 == 0:
+            aliases.append((normalize_turkish(" ".join(rng.sample(WORDS, 2))), imdb_id))
+    return movies, aliases
+
+
+def _brute_force(movies, aliases, query, limit):
+    """Tum basliklari tara, rating/oy'a gore sirala"""
+    q = normalize_turkish(query)
+    texts = [(normalize_turkish(m["title"]), i) for i, m in movies.items()] + aliases
+    ids = {i for text, i in texts if q in text}
+    ranked = sorted(ids, key=lambda i: (-(movies[i]["rating"] or 0), -(movies[i]["votes"] or 0), i))
+    return ranked[:limit]
+
+
+@pytest.mark.parametrize("query", ["ar", "the", "kara", "gece yol", "night red", "yok"])
+@pytest.mark.parametrize("limit", [1, 10, 100])
+def test_search_matches_full_scan(query, limit):
+    movies, aliases = _catalog()
+    index = build_search_index(movies, aliases)
+
+    results = index.search(query, limit)
+
+    ratings = [((m["rating"] or 0), (m["votes"] or 0)) for m in results]
+    assert ratings == sorted(ratings, reverse=True)
+    # Esit rating+oy'da sira farkli olabilir: kume ve sira anahtari karsilastirilir
+    expected = _brute_force(movies, aliases, query, limit)
+    assert len(results) == len(expected)
+    assert ratings == [((movies[i]["rating"] or 0), (movies[i]["votes"] or 0)) for i in expected]
+
+
+def test_short_query_stops_after_limit(monkeypatch):
+    movies, aliases = _catalog()
+    index = build_search_index(movies, aliases)
+    visited = []
+    original = index._candidates
+
+    def counting(query):
+        posting = original(query)
+        for doc in posting:
+            visited.append(doc)
+            yield doc
+
+    monkeypatch.setattr(index, "_candidates", counting)
+    results = index.search("ar", 10)
+
+    assert len(results) == 10
+    assert len(original("ar")) > 100
+    # Her eslesen dokuman yeni film olmayabilir (ayni filmin Turkce basligi)
+    assert len(visited) <= 20
+
+
+def test_empty_and_missing_queries():
+    movies, aliases = _catalog(50)
+    index = build_search_index(movies, aliases)
+    assert index.search("", 10) == []
+    assert index.search("a", 10) == []
+    assert index.search("zzz", 10) == []
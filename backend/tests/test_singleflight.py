@@ -0,0 +1,170 @@
+"""
+Single-flight testleri: lider/bekleyen, hata durumu, lease dolmasi, async future yolu.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.config import settings
+from app.utils import singleflight
+from app.utils.singleflight import coalesce, coalesce_async, coalesce_many, get_flight_stats
+
+
+@pytest.fixture
+def short_lease(monkeypatch):
+    monkeypatch.setattr(settings, "singleflight_lease_ms", 300)
+    monkeypatch.setattr(settings, "singleflight_poll_ms", 10)
+
+
+def _run_concurrently(n, target):
+    """n thread'i ayni anda baslat, sonuclari sirayla dondur"""
+    results = [None] * n
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        results[i] = target()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_callers_share_one_resolution():
+    calls = []
+
+    def resolve():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"rating": 8.8}
+
+    before = get_flight_stats()
+    results = _run_concurrently(5, lambda: coalesce("rating:inception", resolve))
+
+    assert results == [{"rating": 8.8}] * 5
+    assert len(calls) == 1
+    after = get_flight_stats()
+    assert after["leaders"] - before["leaders"] == 1
+    assert after["shared_local"] - before["shared_local"] == 4
+    assert "rating:inception" not in singleflight._calls
+
+
+def test_leader_error_reaches_leader_and_waiter_resolves_itself():
+    started = threading.Event()
+    outcomes = {}
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("db down")
+
+    def leader():
+        try:
+            coalesce("rating:dune", failing)
+        except RuntimeError as e:
+            outcomes["leader"] = e
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait()
+    # Lider hata verdi: bekleyen hatayi miras almaz, kendi resolve'unu calistirir
+    outcomes["waiter"] = coalesce("rating:dune", lambda: "fallback")
+    thread.join()
+
+    assert str(outcomes["leader"]) == "db down"
+    assert outcomes["waiter"] == "fallback"
+    assert "rating:dune" not in singleflight._calls
+
+
+def test_remote_leader_result_read_from_cache(redis_client, short_lease):
+    # Baska process kilidi almis ve birazdan sonucu cache'e yazacak
+    redis_client.set("lock:rating:up", b"other-process", px=5000)
+    timer = threading.Timer(0.05, lambda: redis_client.set("rating:up", b"8.3"))
+    timer.start()
+
+    def poll():
+        value = redis_client.get("rating:up")
+        return (value is not None, value)
+
+    resolved = []
+    result = coalesce("rating:up", lambda: resolved.append(1) or b"local", poll)
+    timer.join()
+
+    assert result == b"8.3"
+    assert resolved == []
+    # Kilit baskasinin: dokunulmamali
+    assert redis_client.get("lock:rating:up") == b"other-process"
+
+
+def test_lease_expiry_falls_back_to_local_resolve(redis_client, short_lease):
+    # Lider coktu: kilit duruyor ama cache'e hic yazilmiyor
+    redis_client.set("lock:rating:her", b"crashed", px=5000)
+    start = time.monotonic()
+    result = coalesce("rating:her", lambda: "local", lambda: (False, None))
+
+    assert result == "local"
+    assert time.monotonic() - start >= settings.singleflight_lease_ms / 1000
+
+
+def test_leader_lock_released_after_resolve(redis_client):
+    def resolve():
+        assert redis_client.exists("lock:rating:heat")
+        return "ok"
+
+    assert coalesce("rating:heat", resolve, lambda: (False, None)) == "ok"
+    assert not redis_client.exists("lock:rating:heat")
+
+
+def test_coalesce_many_dedupes_keys_and_fills_missing():
+    seen = []
+
+    def resolve(keys):
+        seen.append(keys)
+        return {"a": 1}
+
+    assert coalesce_many(["a", "b", "a"], resolve) == {"a": 1, "b": None}
+    assert seen == [["a", "b"]]
+
+
+def test_async_waiters_await_leader_future():
+    calls = []
+
+    async def resolve():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "dune"
+
+    async def main():
+        return await asyncio.gather(*(coalesce_async("rating:dune2", resolve) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["dune"] * 5
+    assert len(calls) == 1
+    assert singleflight._async_calls == {}
+
+
+def test_async_leader_error_waiters_resolve_themselves():
+    attempts = []
+
+    async def resolve():
+        attempts.append(1)
+        await asyncio.sleep(0.02)
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+        return "retry"
+
+    async def main():
+        return await asyncio.gather(
+            coalesce_async("rating:x", resolve), coalesce_async("rating:x", resolve),
+            return_exceptions=True,
+        )
+
+    leader, waiter = asyncio.run(main())
+    assert isinstance(leader, RuntimeError)
+    assert waiter == "retry"
+    assert singleflight._async_calls == {}
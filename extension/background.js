@@ -72,14 +72,32 @@ function setCachedRating(title, data) {
     }
 }
 
+/**
+ * Cache/cevap key'i (backend'deki BatchRatingItem.result_key ile ayni format)
+ * 
+ * OGRENME NOTU:
+ * Yil/tur key'e girmezse "Dune (1984)" icin alinan sonuc "Dune (2021)" kartinda gosterilir.
+ * Duz baslik -> "dune", yil/tur ile -> "dune|2021|movie", "dark||series"
+ * 
+ * @param {string|{title: string, year?: number, kind?: string}} item
+ */
+function ratingKey(item) {
+    if (typeof item === 'string') return item.toLowerCase();
+    const title = item.title.toLowerCase();
+    if (item.year == null && item.kind == null) return title;
+    return `${title}|${item.year ?? ''}|${item.kind ?? ''}`;
+}
+
 /**
  * Mesaj Dinleyici
  * Content script'ten gelen istekleri isler
  */
 chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
     if (request.type === 'GET_RATING') {
+        const key = ratingKey({ title: request.title, year: request.year, kind: request.kind });
+        
         // Oncelikle in-memory cache'e bak
-        const cached = getCachedRating(request.title);
+        const cached = getCachedRating(key);
         if (cached) {
             console.log('[Background] In-Memory Cache HIT:', request.title);
             sendResponse({ success: true, data: cached });
@@ -87,10 +105,10 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
         }
         
         console.log('[Background] In-Memory Cache MISS, API\'ye soruyorum:', request.title);
-        fetchRating(request.title, request.year)
+        fetchRating(request.title, request.year, request.kind)
             .then(data => {
                 // Basarili sonucu cache'e yaz
-                setCachedRating(request.title, data);
+                setCachedRating(key, data);
                 sendResponse({ success: true, data });
             })
             .catch(error => sendResponse({ success: false, error: error.message }));
@@ -104,6 +122,9 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
      * Content script gorunen kartlarin basliklarini toplu gonderir.
      * Once in-memory cache'e bakariz, olmayanlar icin batch API'ye sorariz.
      * Sonuclari hem cache'e hem content script'e doneriz.
+     * 
+     * Elemanlar duz baslik ("Inception") veya { title, year, kind } objesi olabilir;
+     * sonuclar ratingKey(eleman) key'i ile doner.
      */
     if (request.type === 'GET_BATCH_RATING') {
         const titles = request.titles || [];
@@ -113,12 +134,13 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
         const results = {};
         const uncachedTitles = [];
         
-        for (const title of titles) {
-            const cached = getCachedRating(title);
+        for (const item of titles) {
+            const key = ratingKey(item);
+            const cached = getCachedRating(key);
             if (cached) {
-                results[title.toLowerCase()] = cached;
+                results[key] = cached;
             } else {
-                uncachedTitles.push(title);
+                uncachedTitles.push(item);
             }
         }
         
@@ -132,11 +154,11 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
         fetchBatchRatings(uncachedTitles)
             .then(apiResults => {
                 // API sonuclarini cache'e yaz ve birlestir
-                for (const [title, rating] of Object.entries(apiResults)) {
+                for (const [key, rating] of Object.entries(apiResults)) {
                     if (rating) {
-                        setCachedRating(title, rating);
+                        setCachedRating(key, rating);
                     }
-                    results[title] = rating;
+                    results[key] = rating;
                 }
                 sendResponse({ success: true, data: results });
             })
@@ -150,17 +172,80 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
     }
 });
 
+/**
+ * OGRENME NOTU - Streaming batch (Port):
+ * sendMessage tek bir cevap doner, butun batch bitmeden kart boyanamaz.
+ * Content script bunun yerine bir Port acar (chrome.runtime.connect);
+ * background /api/ratings/stream'in NDJSON satirlarini okudukca her sonucu
+ * port'a yazar, kartlar sonuc geldikce boyanir (once cache HIT'leri).
+ * 
+ * Mesajlar: { key, result } ... ve en sonda { done: true }
+ */
+chrome.runtime.onConnect.addListener((port) => {
+    if (port.name !== 'rating-stream') return;
+    
+    let connected = true;
+    port.onDisconnect.addListener(() => { connected = false; });
+    const post = (message) => { if (connected) port.postMessage(message); };
+    
+    port.onMessage.addListener(async (request) => {
+        const items = request.titles || [];
+        const pending = new Map();  // key -> item (henuz cevaplanmayanlar)
+        
+        for (const item of items) {
+            const key = ratingKey(item);
+            const cached = getCachedRating(key);
+            if (cached) {
+                post({ key, result: cached });
+            } else {
+                pending.set(key, item);
+            }
+        }
+        
+        const deliver = (key, rating) => {
+            if (rating) {
+                setCachedRating(key, rating);
+            }
+            pending.delete(key);
+            post({ key, result: rating });
+        };
+        
+        if (pending.size > 0) {
+            try {
+                await streamBatchRatings(Array.from(pending.values()), deliver);
+            } catch (error) {
+                // Stream desteklenmiyorsa / yarida kestiyse kalanlari normal batch ile sor
+                console.error('[Background] Stream hatasi, batch ile devam:', error);
+                try {
+                    const apiResults = await fetchBatchRatings(Array.from(pending.values()));
+                    for (const [key, rating] of Object.entries(apiResults)) {
+                        deliver(key, rating);
+                    }
+                } catch (batchError) {
+                    console.error('[Background] Batch API hatasi:', batchError);
+                }
+            }
+        }
+        
+        post({ done: true });
+    });
+});
+
 /**
  * API'den rating bilgisini ceker
  * @param {string} title - Film/dizi basligi
  * @param {number|null} year - Yapim yili (opsiyonel)
+ * @param {string|null} kind - 'movie' veya 'series' (opsiyonel)
  */
-async function fetchRating(title, year = null) {
+async function fetchRating(title, year = null, kind = null) {
     let url = `${API_BASE_URL}/api/rating?title=${encodeURIComponent(title)}`;
     
     if (year) {
         url += `&year=${year}`;
     }
+    if (kind) {
+        url += `&kind=${kind}`;
+    }
     
     console.log('[Background] API istegi:', url);
     
@@ -190,8 +275,8 @@ async function fetchRating(title, year = null) {
  * Birden fazla baslik gondermek icin POST body kullaniyoruz.
  * GET query string'de 20 baslik gondermeye calismak URL'i cok uzatir.
  * 
- * @param {string[]} titles - Film/dizi basliklari
- * @returns {Object} { "title": {rating data}, ... }
+ * @param {Array<string|Object>} titles - Film/dizi basliklari veya { title, year, kind } objeleri
+ * @returns {Object} { ratingKey(eleman): {rating data}, ... }
  */
 async function fetchBatchRatings(titles) {
     const url = `${API_BASE_URL}/api/ratings/batch`;
@@ -214,5 +299,58 @@ async function fetchBatchRatings(titles) {
     return data.results;
 }
 
+/**
+ * Streaming batch API'sinden (NDJSON) rating'leri satir satir okur
+ * 
+ * OGRENME NOTU - NDJSON okuma:
+ * response.body bir ReadableStream; gelen parcalar satir ortasinda bolunebilir.
+ * Parcalar bir buffer'a eklenir, tamamlanan satirlar parse edilir,
+ * yarim kalan son satir bir sonraki parcayi bekler.
+ * 
+ * @param {Array<string|Object>} titles - Film/dizi basliklari veya { title, year, kind } objeleri
+ * @param {Function} onResult - (key, rating) her satir icin cagrilir
+ */
+async function streamBatchRatings(titles, onResult) {
+    const url = `${API_BASE_URL}/api/ratings/stream`;
+    
+    console.log('[Background] Stream API istegi:', titles.length, 'baslik');
+    
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ titles: titles })
+    });
+    
+    if (!response.ok || !response.body) {
+        throw new Error(`Stream API hatasi: ${response.status}`);
+    }
+    
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();  // Son satir yarim olabilir
+        
+        for (const line of lines) {
+            if (!line) continue;
+            const row = JSON.parse(line);
+            if (row.done) {
+                console.log(`[Background] Stream bitti: ${row.found} bulundu, ${row.not_found} bulunamadi`);
+                return;
+            }
+            onResult(row.key, row.result);
+        }
+    }
+    
+    // Ozet satiri gelmeden baglanti kapandi
+    throw new Error('Stream yarida kesildi');
+}
+
 // Service worker basladiginda log
-console.log('[Background] Netflix IMDB Extension service worker yuklendi (cache + batch aktif)');
+console.log('[Background] Netflix IMDB Extension service worker yuklendi (cache + batch + stream aktif)');
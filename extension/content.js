@@ -310,40 +310,42 @@ function addCardBadge(cardElement, rating) {
  * Scroll sirasinda kartlar tek tek gorunur hale gelir.
  * Her kart icin ayri istek atmak yerine 300ms bekleyip
  * gorunen tum kartlari tek batch'te gondeririz.
+ * 
+ * OGRENME NOTU - Streaming:
+ * Sonuclar Port uzerinden geldikce karta badge eklenir (background
+ * /api/ratings/stream'i okur). Cache'teki kartlar yavas DB sorgularini beklemez.
  */
 function flushPendingBatch() {
     if (pendingTitles.size === 0) return;
     
-    // Pending'leri kopyala ve temizle
-    const currentBatch = new Map(pendingTitles);
+    // Pending'leri kopyala ve temizle (key: background'daki ratingKey, duz baslikta lowercase)
+    const currentBatch = new Map();
+    for (const [title, cardElement] of pendingTitles.entries()) {
+        currentBatch.set(title.toLowerCase(), cardElement);
+    }
+    const titles = Array.from(pendingTitles.keys());
     pendingTitles.clear();
     
-    const titles = Array.from(currentBatch.keys());
     console.log(`[Content] Batch gonderiliyor: ${titles.length} baslik`);
     
-    // Background'a batch mesaji gonder
-    chrome.runtime.sendMessage(
-        { type: 'GET_BATCH_RATING', titles: titles },
-        (response) => {
-            if (chrome.runtime.lastError) {
-                console.error('[Content] Batch hatasi:', chrome.runtime.lastError);
-                return;
-            }
-            
-            if (response && response.success && response.data) {
-                // Her karta badge ekle
-                for (const [title, cardElement] of currentBatch.entries()) {
-                    const ratingData = response.data[title.toLowerCase()];
-                    if (ratingData && ratingData.rating) {
-                        addCardBadge(cardElement, ratingData.rating);
-                    }
-                }
-                
-                const foundCount = Object.values(response.data).filter(v => v && v.rating).length;
-                console.log(`[Content] Batch sonucu: ${foundCount}/${titles.length} karta badge eklendi`);
-            }
+    let foundCount = 0;
+    const port = chrome.runtime.connect({ name: 'rating-stream' });
+    
+    port.onMessage.addListener((message) => {
+        if (message.done) {
+            console.log(`[Content] Batch sonucu: ${foundCount}/${titles.length} karta badge eklendi`);
+            port.disconnect();
+            return;
+        }
+        
+        const cardElement = currentBatch.get(message.key);
+        if (cardElement && message.result && message.result.rating) {
+            addCardBadge(cardElement, message.result.rating);
+            foundCount++;
         }
-    );
+    });
+    
+    port.postMessage({ titles: titles });
 }
 
 /**
@@ -367,8 +369,9 @@ function queueCard(cardElement) {
     if (batchTimer) clearTimeout(batchTimer);
     batchTimer = setTimeout(flushPendingBatch, 300);
     
-    // Max 20 birikince de gonder (debounce beklemeden)
-    if (pendingTitles.size >= 20) {
+    // Max 100 birikince de gonder (debounce beklemeden)
+    // Backend tek istekte 200 basliga kadar toplu cozumler (BATCH_MAX_TITLES)
+    if (pendingTitles.size >= 100) {
         clearTimeout(batchTimer);
         flushPendingBatch();
     }
@@ -8,6 +8,8 @@ import time
 # Backend klasorunu path'e ekle
 sys.path.append(str(Path(__file__).parent.parent / 'backend'))
 
+from app.utils.turkish import normalize_turkish, normalize_sql
+
 def migrate():
     load_dotenv(Path('backend/.env'))
     database_url = os.getenv('DATABASE_URL')
@@ -18,53 +20,66 @@ def migrate():
 
     engine = create_engine(database_url)
     
-    def get_normalize_sql(column_name):
+    def backfill(conn, table):
         """
-        SQL REPLACE fonksiyonlari zinciri olusturur.
-        NOT: PostgreSQL'de tek tirnak icin '' (cift) kullanilir.
+        search_title kolonunu normalize_sql ile toplu guncelle, sonra ASCII disi
+        satirlari Python'daki normalize_turkish ile karsilastirip farklari duzelt.
+
+        OGRENME NOTU:
+        SQL ifadesi normalize_turkish ile ayni tablolardan uretilir (app/utils/turkish.py).
+        ASCII basliklarda sonuc birebir aynidir; ASCII disi harflerde (Kiril, Yunan)
+        PostgreSQL LOWER collation'a bagli oldugu icin son soz Python'un.
+        Sadece degisen satirlar yazilir (IS DISTINCT FROM) -> tekrar calistirmak ucuz.
         """
-        sql = column_name
-        
-        # Ozel karakterler (curly quotes, dashes)
-        # Key: Unicode karakter, Value: ASCII karsilik
-        special_chars = [
-            ('\u2019', "''"),  # Right Single Quotation Mark -> '
-            ('\u2018', "''"),  # Left Single Quotation Mark -> '
-            ('\u201C', '"'),   # Left Double Quotation Mark -> "
-            ('\u201D', '"'),   # Right Double Quotation Mark -> "
-            ('\u2013', '-'),   # En Dash -> -
-            ('\u2014', '-'),   # Em Dash -> -
-        ]
-        for special, normal in special_chars:
-            # SQL icinde tek tirnak escape: ' -> ''
-            sql = f"REPLACE({sql}, '{special}', '{normal}')"
-        
-        # Turkce karakterler
-        turkish_chars = [
-            ('Ş', 's'), ('ş', 's'),
-            ('İ', 'i'), ('ı', 'i'),
-            ('Ç', 'c'), ('ç', 'c'),
-            ('Ğ', 'g'), ('ğ', 'g'),
-            ('Ü', 'u'), ('ü', 'u'),
-            ('Ö', 'o'), ('ö', 'o'),
+        expr = normalize_sql('title')
+        result = conn.execute(text(f"""
+            UPDATE {table}
+            SET search_title = {expr}
+            WHERE search_title IS DISTINCT FROM {expr}
+        """))
+        conn.commit()
+        print(f"   {result.rowcount:,} satir SQL ile guncellendi")
+
+        # text() icinde ':' bind parametresi sayilir, \: ile escape edilir
+        rows = conn.execute(text(
+            f"SELECT id, title, search_title FROM {table} WHERE title ~ '[^[\\:ascii\\:]]'"
+        )).fetchall()
+        fixes = [
+            {"id": row_id, "search_title": normalize_turkish(title)}
+            for row_id, title, search_title in rows
+            if normalize_turkish(title) != search_title
         ]
-        for tr, eng in turkish_chars:
-            sql = f"REPLACE({sql}, '{tr}', '{eng}')"
-        
-        return f"LOWER({sql})"
+        for i in range(0, len(fixes), 5000):
+            conn.execute(
+                text(f"UPDATE {table} SET search_title = :search_title WHERE id = :id"),
+                fixes[i:i + 5000]
+            )
+        conn.commit()
+        print(f"   Parite kontrolu: {len(rows):,} ASCII disi satir, {len(fixes):,} duzeltme")
 
     print("Veritabani baglantisi kuruldu...")
     
     with engine.connect() as conn:
         conn.execute(text("COMMIT"))
         
-        # 1. Movies tablosunu TEMIZLE (Gereksiz kolon siliniyor)
-        print("1. Movies tablosundan search_title siliniyor (Clean up)...")
-        try:
-            conn.execute(text("ALTER TABLE movies DROP COLUMN IF EXISTS search_title"))
-            print("   Silindi.")
-        except Exception as e:
-            print(f"   Hata (onemsiz): {e}")
+        # 1. Movies tablosuna search_title ekle ve doldur
+        # OGRENME NOTU: lower(title) = 'x' sorgusu title index'ini kullanamaz.
+        # Normalize baslik ayri kolonda + (search_title, year, votes DESC) index'i
+        # ile exact lookup tek index probe'u olur.
+        print("1. Movies tablosuna search_title ekleniyor...")
+        conn.execute(text("ALTER TABLE movies ADD COLUMN IF NOT EXISTS search_title VARCHAR(500)"))
+        conn.commit()
+        
+        start = time.time()
+        backfill(conn, "movies")
+        print(f"   Sure: {time.time() - start:.2f} saniye")
+        
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_movies_search_title_year_votes
+            ON movies(search_title, year, votes DESC)
+        """))
+        conn.commit()
+        print("   Index olusturuldu: ix_movies_search_title_year_votes")
 
         # 2. Movie Titles tablosuna kolon ekle ve doldur
         print("2. Movie Titles tablosu hazirlaniyor...")
@@ -72,14 +87,7 @@ def migrate():
         
         print("3. Movie Titles verileri guncelleniyor (Bulk SQL)...")
         start = time.time()
-        
-        update_titles_sql = f"""
-            UPDATE movie_titles 
-            SET search_title = {get_normalize_sql('title')}
-        """
-        print("   SQL:", update_titles_sql[:200], "...")
-        conn.execute(text(update_titles_sql))
-        conn.commit()
+        backfill(conn, "movie_titles")
         print(f"   Tamamlandi! Sure: {time.time() - start:.2f} saniye")
         
         # 4. Index Olustur